@@ -1,27 +1,981 @@
 from __future__ import annotations
 
+import gzip
 import json
+import posixpath
+import re
 import subprocess
+from collections.abc import Mapping
+from contextlib import ExitStack
 from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from hashlib import sha256
+from io import BytesIO
+from mmap import mmap
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from threading import RLock, local
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
+import rfc3987
+import strict_rfc3339
 from importlib_resources import files as resource_file
-from jsonschema import validate
+from jsonschema import Draft7Validator, FormatChecker
+from jsonschema.exceptions import ValidationError, best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import extend, validator_for
 from lxml.etree import (
     Element,
     ElementTree,
+    Resolver,
+    XMLParser,
+    XMLPullParser,
+    XMLSchema,
+    XMLSyntaxError,
     fromstring,
+    iterparse,
+)
+from lxml.etree import (
+    parse as parse_xml,
 )
 from lxml.etree import (
     tostring as element_string,
 )
 
+from bas_metadata_library.codegen import get_generated_validator
+from bas_metadata_library.decode_cache import get_decode_cache, record_digest
+from bas_metadata_library.validation_cache import canonical_json, get_validation_cache
+
+
+@dataclass(frozen=True)
+class RecordValidationIssue:
+    """
+    An individual error found when validating a record against an XML schema.
+
+    Line and column numbers refer to the validated document where known. They are not available for records validated
+    directly from elements, rather than a parsed document, in which case `path` (an XPath to the element concerned)
+    should be used instead.
+    """
+
+    message: str
+    line: int | None = None
+    column: int | None = None
+    path: str | None = None
+
+    def __str__(self) -> str:
+        """Error as a single line, in a format similar to `xmllint`."""
+        location = self.path or ""
+        if self.line is not None:
+            location = f"line {self.line}, column {self.column}: {location}".rstrip()
+        return f"{location}: {self.message}" if location else self.message
+
 
 class RecordValidationError(Exception):
-    """Internal error indicating a record has failed schema validation."""
+    """
+    Internal error indicating a record has failed schema validation.
+
+    Where available, individual validation errors are included in the `errors` attribute.
+    """
+
+    def __init__(self, message: str, errors: list[RecordValidationIssue] | None = None):
+        super().__init__(message)
+        self.errors = errors if errors is not None else []
+
+
+_schemas_lock = RLock()
+_schemas: dict[str, dict] = {}
+_schema_validators: dict[tuple[str, Callable | None, FormatChecker | None], Validator] = {}
+
+
+def load_schema(name: str) -> dict:
+    """
+    Load a distribution configuration schema by name, once per process.
+
+    Schemas are loaded from the `bas_metadata_library.schemas.dist` module (e.g. 'iso_19115_0_v4') and then held in
+    memory, so the same schema instance is returned on subsequent calls. Schemas are shared and must not be modified.
+
+    :type name: str
+    :param name: file name of the schema, without a file extension
+    :return: JSON Schema
+    """
+    with _schemas_lock:
+        if name not in _schemas:
+            schema_path = resource_file("bas_metadata_library.schemas.dist").joinpath(f"{name}.json")
+            with schema_path.open() as schema_file:
+                _schemas[name] = json.load(schema_file)
+        return _schemas[name]
+
+
+_json_passthrough_types = {str, int, float, bool, list, type(None)}
+_encoding_keywords = ["properties", "patternProperties", "additionalProperties", "items", "additionalItems", "contains"]
+
+
+@lru_cache(maxsize=None)
+def encoding_validator(
+    validator_class: type[Validator], encode_member: Callable[[str | int, Any], Any]
+) -> type[Validator]:
+    """
+    Extend a JSON Schema validator class to validate instances as if they had been encoded as JSON.
+
+    Members of objects and arrays are encoded using `encode_member()` before they are validated. This allows values such
+    as Python dates to be validated in place, without first copying and encoding a whole instance.
+
+    `encode_member()` is called with the property name (objects) or index (arrays) and value of each member, other than
+    strings, numbers, booleans, nulls and arrays (which never need encoding), and must return the value unchanged (i.e.
+    the same object) if it does not need encoding. Where any members need encoding, a shallow copy of the object or
+    array is validated instead.
+
+    Extended classes are cached, so the same class is returned for the same arguments.
+
+    :type validator_class: type[Validator]
+    :param validator_class: JSON Schema validator class to extend (e.g. `Draft7Validator`)
+    :type encode_member: Callable
+    :param encode_member: returns the JSON encoding of an object or array member
+    :return: extended validator class
+    """
+
+    def _encode_members(instance: Any) -> Any:  # noqa: ANN401
+        if isinstance(instance, dict):
+            members = instance.items()
+        elif isinstance(instance, list):
+            members = enumerate(instance)
+        else:
+            return instance
+
+        encoded = None
+        for key, value in members:
+            if value.__class__ in _json_passthrough_types:
+                continue
+            encoded_value = encode_member(key, value)
+            if encoded_value is not value:
+                if encoded is None:
+                    encoded = instance.copy()
+                encoded[key] = encoded_value
+        return instance if encoded is None else encoded
+
+    def _encoding_keyword(keyword: Callable) -> Callable:
+        def _keyword(validator: Validator, value: Any, instance: Any, schema: dict) -> Iterator:  # noqa: ANN401
+            return keyword(validator, value, _encode_members(instance), schema)
+
+        return _keyword
+
+    return extend(
+        validator_class,
+        validators={
+            name: _encoding_keyword(validator_class.VALIDATORS[name])
+            for name in _encoding_keywords
+            if name in validator_class.VALIDATORS
+        },
+    )
+
+
+def encode_json_member(key: str | int, value: Any) -> Any:  # noqa: ANN401
+    """
+    Encode an object or array member as per a JSON round-trip using `str()` as a default.
+
+    I.e. as per `json.loads(json.dumps(value, default=str))`. For use with `encoding_validator()`.
+    """
+    if value is None or isinstance(value, (str, int, float, list, dict)):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    return str(value)
+
+
+_format_cache_size = 4096
+
+
+@lru_cache(maxsize=_format_cache_size)
+def _is_uri(instance: str) -> bool:
+    try:
+        rfc3987.parse(instance, rule="URI")
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=_format_cache_size)
+def _is_uri_reference(instance: str) -> bool:
+    try:
+        rfc3987.parse(instance, rule="URI_reference")
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=_format_cache_size)
+def _is_date_time(instance: str) -> bool:
+    return strict_rfc3339.validate_rfc3339(instance.upper())
+
+
+def _string_format(check: Callable[[str], bool]) -> Callable[[Any], bool]:
+    def _check(instance: Any) -> bool:  # noqa: ANN401
+        # as per JSON Schema, formats only apply to strings
+        return not isinstance(instance, str) or check(instance)
+
+    return _check
+
+
+# an empty instance (rather than the default) so that registering checks doesn't change the process-wide registry
+_format_checker = FormatChecker(formats=())
+for _format, (_check, _raises) in Draft7Validator.FORMAT_CHECKER.checkers.items():
+    _format_checker.checks(_format, raises=_raises)(_check)
+_format_checker.checks("uri")(_string_format(_is_uri))
+_format_checker.checks("uri-reference")(_string_format(_is_uri_reference))
+_format_checker.checks("date-time")(_string_format(_is_date_time))
+
+
+def get_format_checker() -> FormatChecker:
+    """
+    Get a JSON Schema format checker for validating values such as URIs and date-times.
+
+    Based on the default checker for JSON Schema Draft 7, with the 'uri', 'uri-reference' and 'date-time' formats used
+    by configuration schemas checked using `rfc3987` and `strict-rfc3339`. As the same values (e.g. licence and
+    identifier URIs) tend to appear across many records, results for these formats are memoized, up to a fixed number
+    of distinct values per format.
+
+    The same checker instance is returned on each call, so that validators using it can be shared (see
+    `get_schema_validator()`).
+
+    :return: format checker
+    """
+    return _format_checker
+
+
+def get_schema_validator(
+    schema: dict,
+    encode_member: Callable[[str | int, Any], Any] | None = None,
+    format_checker: FormatChecker | None = None,
+) -> Validator:
+    """
+    Get a compiled validator for a JSON Schema.
+
+    Validators are compiled once per schema identity (`$id`) and then reused, avoiding checking the schema against its
+    meta-schema, and building a new validator, each time an instance is validated.
+
+    Schemas without an absolute identity (e.g. a `$id` of '#') cannot be safely shared and are compiled on each call.
+
+    If set, the validator will encode members using `encode_member()` when validating (see `encoding_validator()`).
+
+    Formats (e.g. 'uri') are only checked if a `format_checker` is set (see `get_format_checker()`).
+
+    :type schema: dict
+    :param schema: JSON Schema
+    :type encode_member: Callable
+    :param encode_member: optional function to encode members as JSON
+    :type format_checker: FormatChecker
+    :param format_checker: optional format checker
+    :return: validator for schema
+    """
+    schema_id = schema.get("$id", "")
+    if schema_id == "" or schema_id.startswith("#"):
+        return _compile_schema_validator(schema=schema, encode_member=encode_member, format_checker=format_checker)
+
+    key = (schema_id, encode_member, format_checker)
+    with _schemas_lock:
+        if key not in _schema_validators:
+            _schema_validators[key] = _compile_schema_validator(
+                schema=schema, encode_member=encode_member, format_checker=format_checker
+            )
+        return _schema_validators[key]
+
+
+def warm_schema_validators(
+    names: list[str] | None = None, encode_member: Callable[[str | int, Any], Any] | None = None
+) -> None:
+    """
+    Load and compile validators for distribution configuration schemas ahead of use.
+
+    Optional, as schemas and validators are otherwise loaded and compiled lazily on first use. Intended for long-running
+    or multi-threaded applications to avoid this cost when the first record is processed.
+
+    :type names: list[str]
+    :param names: optional file names of schemas to load, without file extensions, all schemas are loaded if not set
+    :type encode_member: Callable
+    :param encode_member: optional function to encode members as JSON (see `get_schema_validator()`)
+    """
+    if names is None:
+        names = sorted(
+            schema_path.name.removesuffix(".json")
+            for schema_path in resource_file("bas_metadata_library.schemas.dist").iterdir()
+            if schema_path.name.endswith(".json")
+        )
+
+    for name in names:
+        get_schema_validator(schema=load_schema(name=name), encode_member=encode_member)
+
+
+def _compile_schema_validator(
+    schema: dict,
+    encode_member: Callable[[str | int, Any], Any] | None = None,
+    format_checker: FormatChecker | None = None,
+) -> Validator:
+    """Check a JSON Schema is valid and create a validator for it, as per `jsonschema.validate()`."""
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    if encode_member is not None:
+        validator_class = encoding_validator(validator_class=validator_class, encode_member=encode_member)
+    return validator_class(schema, format_checker=format_checker)
+
+
+def validate_instance(
+    instance: dict,
+    schema: dict,
+    encode_member: Callable[[str | int, Any], Any] | None = None,
+    format_checker: FormatChecker | None = None,
+    validator: Validator | None = None,
+) -> None:
+    """
+    Validate an instance against a JSON Schema using a compiled validator.
+
+    Equivalent to `jsonschema.validate()`, raising the most relevant error if the instance is invalid.
+
+    Where available, a generated validator is used to check the instance first (see `codegen.get_generated_validator()`).
+    A `jsonschema` validator is then only used to determine errors for invalid instances.
+
+    If already compiled for the schema, `encode_member` and `format_checker`, a `validator` can be given, otherwise one
+    is compiled, or reused, as needed (see `get_schema_validator()`).
+
+    :type instance: dict
+    :param instance: value to validate
+    :type schema: dict
+    :param schema: JSON Schema
+    :type encode_member: Callable
+    :param encode_member: optional function to encode members as JSON (see `get_schema_validator()`)
+    :type format_checker: FormatChecker
+    :param format_checker: optional format checker (see `get_schema_validator()`)
+    :type validator: Validator
+    :param validator: optional compiled validator for the schema
+    """
+    generated_validator = get_generated_validator(schema=schema)
+    if generated_validator is not None and generated_validator(instance, encode_member, format_checker):
+        return
+
+    if validator is None:
+        validator = get_schema_validator(schema=schema, encode_member=encode_member, format_checker=format_checker)
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+_fragment_validators: dict[tuple[str, str, Callable | None], Validator] = {}
+
+
+def _fragment_pointer(schema: dict, name: str) -> str:
+    for keyword in ["definitions", "$defs"]:
+        if name in schema.get(keyword, {}):
+            return f"#/{keyword}/{name}"
+    msg = f"Schema '{schema.get('$id', '')}' does not define a sub-schema named '{name}'."
+    raise ValueError(msg)
+
+
+def get_fragment_validator(
+    schema: dict, name: str, encode_member: Callable[[str | int, Any], Any] | None = None
+) -> Validator:
+    """
+    Get a compiled validator for a named sub-schema (definition) within a JSON Schema.
+
+    For validating part of an instance (e.g. a single contact in a record configuration) on its own. References within
+    the sub-schema are resolved against the whole schema.
+
+    As with `get_schema_validator()`, validators are compiled once per schema identity (`$id`) and sub-schema name.
+
+    :type schema: dict
+    :param schema: JSON Schema
+    :type name: str
+    :param name: name of sub-schema, as a member of the `definitions` or `$defs` keyword (e.g. 'contact')
+    :type encode_member: Callable
+    :param encode_member: optional function to encode members as JSON (see `get_schema_validator()`)
+    :return: validator for sub-schema
+    """
+    pointer = _fragment_pointer(schema=schema, name=name)
+    keyword = pointer.split("/")[1]
+    schema_id = schema.get("$id", "")
+    if schema_id == "" or schema_id.startswith("#"):
+        validator = get_schema_validator(schema=schema, encode_member=encode_member)
+        return validator.evolve(schema=schema[keyword][name])
+
+    with _schemas_lock:
+        if (schema_id, pointer, encode_member) not in _fragment_validators:
+            validator = get_schema_validator(schema=schema, encode_member=encode_member)
+            _fragment_validators[(schema_id, pointer, encode_member)] = validator.evolve(schema=schema[keyword][name])
+        return _fragment_validators[(schema_id, pointer, encode_member)]
+
+
+def validate_fragment(
+    instance: Any,  # noqa: ANN401
+    schema: dict,
+    name: str,
+    path: list[str | int] | None = None,
+    encode_member: Callable[[str | int, Any], Any] | None = None,
+) -> None:
+    """
+    Validate part of an instance against a named sub-schema (definition) within a JSON Schema.
+
+    Where available, a generated validator is used to check the fragment first (see `validate_instance()`).
+
+    Where the fragment is invalid, the most relevant error is raised. If the location of the fragment within the whole
+    instance is given as `path`, error paths are relative to the whole instance, as if the whole instance had been
+    validated (i.e. the `absolute_path` of an error within a contact would be `['metadata', 'contacts', 0, ...]`).
+
+    :type instance: Any
+    :param instance: fragment to validate
+    :type schema: dict
+    :param schema: JSON Schema
+    :type name: str
+    :param name: name of sub-schema, as a member of the `definitions` or `$defs` keyword (e.g. 'contact')
+    :type path: list[str | int]
+    :param path: optional location of the fragment within a whole instance
+    :type encode_member: Callable
+    :param encode_member: optional function to encode members as JSON (see `get_schema_validator()`)
+    """
+    generated_validator = get_generated_validator(schema=schema, fragment=_fragment_pointer(schema=schema, name=name))
+    if generated_validator is not None and generated_validator(instance, encode_member, None):
+        return
+
+    validator = get_fragment_validator(schema=schema, name=name, encode_member=encode_member)
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        # errors from within keywords such as 'anyOf' are relative to their parent error
+        root_error = error
+        while root_error.parent is not None:
+            root_error = root_error.parent
+        root_error.path.extendleft(reversed(path or []))
+        raise error
+
+
+_xsd_base_url = "bas-metadata-library:/xsd/"
+_xsd_schemas_lock = RLock()
+_xsd_schemas: dict[str, XMLSchema] = {}
+
+
+class _PackagedSchemaResolver(Resolver):
+    """
+    Resolves imported or included XML schemas from the `bas_metadata_library.schemas.xsd` module.
+
+    Schemas are loaded with a base URL under a private scheme, so relative schema locations (e.g. '../gco/gco.xsd')
+    resolve to other packaged schemas, regardless of how (or whether) this package is installed on a file system.
+    """
+
+    def resolve(self, system_url: str, public_id: str, context: object) -> object:
+        if not system_url.startswith(_xsd_base_url):
+            return None
+        xsd_path = posixpath.normpath(system_url[len(_xsd_base_url) :])
+        schema_path = resource_file("bas_metadata_library.schemas.xsd").joinpath(*xsd_path.split("/"))
+        return self.resolve_string(schema_path.read_bytes(), context, base_url=f"{_xsd_base_url}{xsd_path}")
+
+
+def get_xml_schema(xsd_path: Path) -> XMLSchema:
+    """
+    Get a compiled XML schema from the `bas_metadata_library.schemas.xsd` module.
+
+    Schemas, including any imported or included schemas, are loaded from this package (never the network) and compiled
+    once per process, then reused.
+
+    Compiled schemas are shared. `validate_xml_document()` should be used to validate documents, rather than calling
+    schemas directly, as lxml schemas are not safe to use from multiple threads at the same time.
+
+    :type xsd_path: Path
+    :param xsd_path: path to a schema, relative to the `bas_metadata_library.schemas.xsd` module (e.g. 'gmd/gmd.xsd')
+    :return: compiled XML schema
+    """
+    xsd_path = Path(xsd_path).as_posix()
+    with _xsd_schemas_lock:
+        if xsd_path not in _xsd_schemas:
+            parser = XMLParser(no_network=True, resolve_entities=False)
+            parser.resolvers.add(_PackagedSchemaResolver())
+            schema_path = resource_file("bas_metadata_library.schemas.xsd").joinpath(*xsd_path.split("/"))
+            schema_document = fromstring(schema_path.read_bytes(), parser=parser, base_url=f"{_xsd_base_url}{xsd_path}")
+            _xsd_schemas[xsd_path] = XMLSchema(schema_document.getroottree())
+        return _xsd_schemas[xsd_path]
+
+
+@lru_cache(maxsize=None)
+def _xml_schemas_digest() -> str:
+    """
+    Digest of the contents of all XML schemas in the `bas_metadata_library.schemas.xsd` module.
+
+    Any packaged schema may be imported or included by another, so all schemas are included. Calculated once per
+    process.
+    """
+    digest = sha256()
+    directories = [("", resource_file("bas_metadata_library.schemas.xsd"))]
+    while directories:
+        prefix, directory = directories.pop()
+        for item in sorted(directory.iterdir(), key=lambda item: item.name):
+            if item.is_dir():
+                directories.append((f"{prefix}{item.name}/", item))
+            elif item.name.endswith(".xsd"):
+                digest.update(f"{prefix}{item.name}".encode())
+                digest.update(b"\0")
+                digest.update(sha256(item.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _xml_schema_id(xsd_path: Path) -> str:
+    """
+    Identifier for an XML schema in the `bas_metadata_library.schemas.xsd` module, for use in validation cache keys.
+
+    Includes a digest of the contents of packaged schemas (see `_xml_schemas_digest()`), so that cached outcomes are
+    not reused if a schema changes (e.g. without a change in the version of this library in a development install).
+    """
+    return f"{Path(xsd_path).as_posix()}#sha256={_xml_schemas_digest()}"
+
+
+def warm_xml_schemas(xsd_paths: list[Path]) -> None:
+    """
+    Compile XML schemas ahead of time.
+
+    Optional, schemas are otherwise compiled when first used. This can be useful in long-running processes to avoid
+    compiling schemas while handling the first request that needs them.
+
+    :type xsd_paths: list[Path]
+    :param xsd_paths: paths to schemas, relative to the `bas_metadata_library.schemas.xsd` module
+    """
+    for xsd_path in xsd_paths:
+        get_xml_schema(xsd_path)
+
+
+def _validation_issues(error_log: object) -> list[RecordValidationIssue]:
+    """Convert an lxml error log into a list of validation issues."""
+    return [
+        RecordValidationIssue(
+            message=entry.message,
+            line=entry.line or None,
+            column=entry.column if entry.line else None,
+            path=entry.path or None,
+        )
+        for entry in error_log
+    ]
+
+
+def _raise_validation_error(errors: list[RecordValidationIssue]) -> None:
+    msg = "Record validation failed: " + "\n".join(str(error) for error in errors)
+    raise RecordValidationError(msg, errors=errors)
+
+
+@dataclass(frozen=True)
+class XMLParserOptions:
+    """
+    Options for XML parsers used to parse and decode records (see `set_xml_parser_options()`).
+
+    Parsers never access the network or resolve entities, regardless of these options, as records may be untrusted.
+
+    - `remove_blank_text`: whether to discard whitespace between elements (which is ignored when decoding records)
+    - `huge_tree`: whether to allow very deep trees and very long text content, which libxml2 otherwise rejects to limit
+      memory use (only enable for trusted records)
+    - `collect_ids`: whether to index `xml:id` attributes (not used by this library, so can be disabled to save memory)
+    """
+
+    remove_blank_text: bool = True
+    huge_tree: bool = False
+    collect_ids: bool = True
+
+
+_xml_parser_options_lock = RLock()
+_xml_parser_options = XMLParserOptions()
+_xml_parsers = local()
+
+
+def set_xml_parser_options(options: XMLParserOptions) -> None:
+    """
+    Set options for XML parsers used to parse and decode records in this process.
+
+    Parsers using previous options are replaced (in each thread) the next time a parser is needed.
+
+    :type options: XMLParserOptions
+    :param options: parser options
+    """
+    global _xml_parser_options
+    with _xml_parser_options_lock:
+        _xml_parser_options = options
+
+
+def get_xml_parser_options() -> XMLParserOptions:
+    """Get options for XML parsers used in this process (see `set_xml_parser_options()`)."""
+    return _xml_parser_options
+
+
+def get_xml_parser() -> XMLParser:
+    """
+    Get a configured XML parser for parsing records.
+
+    Parsers are created once per thread for the current parser options (see `set_xml_parser_options()`) and then
+    reused, as lxml parsers can be used for any number of documents, but not from multiple threads at the same time.
 
-    pass
+    :return: XML parser
+    """
+    options = _xml_parser_options
+    parsers = getattr(_xml_parsers, "parsers", None)
+    if parsers is None:
+        parsers = _xml_parsers.parsers = {}
+
+    parser = parsers.get(options)
+    if parser is None:
+        parser = parsers[options] = XMLParser(
+            no_network=True,
+            resolve_entities=False,
+            remove_blank_text=options.remove_blank_text,
+            huge_tree=options.huge_tree,
+            collect_ids=options.collect_ids,
+        )
+    return parser
+
+
+_gzip_magic = b"\x1f\x8b"
+
+
+def _decompress_document(
+    document: bytes | bytearray | memoryview | mmap,
+) -> bytes | bytearray | memoryview | mmap:
+    """Decompress a gzip compressed document (e.g. from `generate_xml_document(compress=True)`), if compressed."""
+    if document[:2] == _gzip_magic:
+        return gzip.decompress(document)
+    return document
+
+
+def parse_xml_document(document: str | bytes | bytearray | memoryview | mmap | Path) -> ElementTree:
+    """
+    Parse an XML document for validation.
+
+    Documents are parsed using a configured parser (see `get_xml_parser()`), without accessing the network or resolving
+    entities. Malformed documents are returned as a `RecordValidationError` exception, with individual errors in the
+    `errors` attribute.
+
+    As with `parse_record()`, text (`str`) documents are parsed as content (encoded as UTF-8), not as paths. Paths must
+    be given as `Path` objects. Encoded documents (including `bytearray`, `memoryview` and `mmap` objects, parsed in
+    place), or documents read from a path, may be gzip compressed.
+
+    :type document: str | bytes | bytearray | memoryview | mmap | Path
+    :param document: XML document, encoded XML document, or path to an XML document
+    :return: element tree of the document
+    """
+    parser = get_xml_parser()
+    try:
+        if isinstance(document, str):
+            return ElementTree(fromstring(document.encode(), parser=parser))
+        if isinstance(document, (bytes, bytearray, memoryview, mmap)):
+            return ElementTree(fromstring(_decompress_document(document), parser=parser))
+        return parse_xml(str(document), parser=parser)
+    except XMLSyntaxError as e:
+        _raise_validation_error(errors=_validation_issues(e.error_log))
+
+
+def parse_record(record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO) -> Element:
+    """
+    Parse an XML record.
+
+    Records can be given as text, or in a form lxml can parse directly without first copying the record:
+
+    - bytes (including `bytearray`, `memoryview` and `mmap` objects), parsed in place using the buffer protocol
+    - a path to a file, read by libxml2
+    - a binary file-like object, read incrementally
+
+    Text (`str`) records are encoded as UTF-8 before parsing, as lxml does not allow text with an XML declaration.
+
+    Gzip compressed records (e.g. from `generate_xml_document(compress=True)`) are decompressed when given as bytes or
+    a path. Compressed file-like objects should be wrapped in a `gzip.GzipFile` object.
+
+    Records are parsed using a configured parser (see `get_xml_parser()`), without accessing the network or resolving
+    entities.
+
+    :type record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO
+    :param record: XML record
+    :return: root element of the record
+    """
+    parser = get_xml_parser()
+    if isinstance(record, str):
+        return fromstring(record.encode(), parser=parser)
+    if isinstance(record, (bytes, bytearray, memoryview, mmap)):
+        return fromstring(_decompress_document(record), parser=parser)
+    if isinstance(record, Path):
+        return parse_xml(str(record), parser=parser).getroot()
+    return parse_xml(record, parser=parser).getroot()
+
+
+def read_record(
+    record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO,
+) -> bytes | bytearray | memoryview | mmap:
+    """
+    Read an XML record as bytes.
+
+    Records already in a form supporting the buffer protocol (e.g. bytes or `mmap` objects) are returned as is.
+
+    :type record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO
+    :param record: XML record
+    :return: encoded XML record
+    """
+    if isinstance(record, str):
+        return record.encode()
+    if isinstance(record, (bytes, bytearray, memoryview, mmap)):
+        return record
+    if isinstance(record, Path):
+        return record.read_bytes()
+    return record.read()
+
+
+def validate_xml_document(
+    document: str | bytes | bytearray | memoryview | mmap | Path | Element | ElementTree, xsd_path: Path
+) -> None:
+    """
+    Validate an XML document against an XML schema from the `bas_metadata_library.schemas.xsd` module.
+
+    Documents are validated in memory using a compiled schema (see `get_xml_schema()`). Documents can be given as an
+    element or element tree, or as text, an encoded document or path to a document, which will be parsed first (see
+    `parse_xml_document()`). Existing elements or element trees are not copied or modified.
+
+    :type document: str | bytes | bytearray | memoryview | mmap | Path | Element | ElementTree
+    :param document: XML document to validate
+    :type xsd_path: Path
+    :param xsd_path: path to a schema, relative to the `bas_metadata_library.schemas.xsd` module (e.g. 'gmd/gmd.xsd')
+    :raises RecordValidationError: if the document is invalid, with individual errors in the `errors` attribute
+    """
+    if isinstance(document, (bytes, bytearray, memoryview, mmap, str, Path)):
+        document = parse_xml_document(document=document)
+
+    schema = get_xml_schema(xsd_path)
+    with _xsd_schemas_lock:
+        if schema.validate(document):
+            return
+        errors = _validation_issues(schema.error_log)
+
+    _raise_validation_error(errors=errors)
+
+
+_utf8_xml_declaration = b"<?xml version='1.0' encoding='utf-8'?>\n"
+
+
+def write_xml_sections(sections: Iterable[Element], file: BinaryIO, pretty_print: bool = True) -> None:
+    """
+    Write an XML document incrementally, as sections of it are built.
+
+    `sections` should yield the root element of the document each time elements (sections) have been added to it. These
+    elements are written to `file` and then removed from the root element, so that only the section being built needs to
+    be held in memory.
+
+    Sections are serialised within the root element, so that namespaces declared by the root element aren't repeated,
+    and the output is the same as serialising the complete document at once (as a UTF-8 byte string, with an XML
+    declaration).
+
+    :type sections: Iterable[Element]
+    :param sections: root element of the document, yielded after each section is added
+    :type file: BinaryIO
+    :param file: binary file object (or other writable stream, such as a socket file) to write the document to
+    :type pretty_print: bool
+    :param pretty_print: whether to indent elements
+    """
+    root = None
+    start_tag = None
+    end_tag = b""
+    for root in sections:
+        children = list(root)
+        if len(children) == 0:
+            continue
+
+        chunk = element_string(root, pretty_print=pretty_print, encoding="utf-8")
+        if start_tag is None:
+            start_tag = chunk[: chunk.index(b">") + 1]
+            end_tag = chunk[chunk.rindex(b"</") :]
+            file.write(_utf8_xml_declaration)
+            file.write(start_tag)
+            start = len(start_tag)
+        else:
+            # when pretty printing, the new line after the start tag was written with the first section
+            start = len(start_tag) + int(pretty_print)
+        file.write(chunk[start : -len(end_tag)])
+
+        for child in children:
+            root.remove(child)
+
+    if root is None:
+        return
+    if start_tag is None:
+        file.write(element_string(ElementTree(root), pretty_print=pretty_print, xml_declaration=True, encoding="utf-8"))
+        return
+    file.write(end_tag)
+
+
+_scan_chunk_size = 16384
+
+
+def _record_chunks(record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO) -> Iterator[bytes]:
+    if isinstance(record, str):
+        record = record.encode()
+    if isinstance(record, (bytes, bytearray, memoryview, mmap)):
+        with memoryview(record) as view:
+            for offset in range(0, view.nbytes, _scan_chunk_size):
+                yield view[offset : offset + _scan_chunk_size].tobytes()
+        return
+    if isinstance(record, Path):
+        with record.open(mode="rb") as record_file:
+            yield from iter(partial(record_file.read, _scan_chunk_size), b"")
+        return
+    yield from iter(partial(record.read, _scan_chunk_size), b"")
+
+
+def scan_record(
+    record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO, tags: Iterable[str], until: str | None = None
+) -> Element:
+    """
+    Parse some top-level elements of an XML record, stopping early where possible.
+
+    Records are parsed incrementally, in small chunks. Top-level elements (children of the root element) with one of
+    `tags` are kept, and other top-level elements are cleared once parsed. If `until` is set, parsing stops once a
+    top-level element with this tag has been parsed, without reading the rest of the record. This is useful where only
+    a few elements near the start of a record are needed (e.g. to check whether a record has changed).
+
+    Elements after the `until` element may be partially parsed, and so should not be used.
+
+    Records are parsed using the current parser options (see `set_xml_parser_options()`), without accessing the network
+    or resolving entities. Malformed records are returned as a `RecordValidationError` exception, with errors in the
+    `errors` attribute (unless the error is after where parsing stopped).
+
+    :type record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO
+    :param record: XML record
+    :type tags: Iterable[str]
+    :param tags: tags of top-level elements to keep, in Clark notation
+    :type until: str
+    :param until: optional tag of a top-level element, in Clark notation, to stop parsing after
+    :return: root element of the record, containing the kept top-level elements
+    """
+    tags = set(tags)
+    options = _xml_parser_options
+    parser = XMLPullParser(
+        events=("start", "end"),
+        no_network=True,
+        resolve_entities=False,
+        remove_blank_text=options.remove_blank_text,
+        huge_tree=options.huge_tree,
+        collect_ids=options.collect_ids,
+    )
+    root = None
+    chunks = _record_chunks(record)
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if root is None:
+                    root = element
+                if event != "end" or element.getparent() is not root:
+                    continue
+                if element.tag not in tags:
+                    element.clear()
+                if element.tag == until:
+                    return root
+        return parser.close()
+    except XMLSyntaxError as e:
+        _raise_validation_error(errors=_validation_issues(e.error_log))
+    finally:
+        chunks.close()
+
+
+_xml_declaration = re.compile(rb"<\?xml\s[^>]*\?>")
+
+
+class _ConcatenatedDocuments:
+    """
+    Binary stream presenting a stream of concatenated XML documents as a single document.
+
+    Documents are wrapped in a container element, and any XML declarations removed. Documents are assumed to use UTF-8.
+
+    Other markup (e.g. processing instructions, comments and CDATA sections) is passed through unchanged, except that
+    XML declarations are removed wherever they appear (including within comments or CDATA sections). Document type
+    declarations can't appear within the container element, and so are not supported.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._started = False
+        self._finished = False
+        self._pending = b""
+
+    def read(self, size: int = -1) -> bytes:
+        data = b""
+        # keep reading where all data read so far is held back (e.g. a start tag longer than a read), as returning no
+        # data would end parsing before the end of the stream
+        while not data and not self._finished:
+            chunk = self._stream.read(size)
+            data = self._pending + chunk
+            self._pending = b""
+            if chunk:
+                # hold back a possibly incomplete markup declaration until the next read
+                cut = data.rfind(b"<")
+                if cut != -1 and data.find(b">", cut) == -1:
+                    data, self._pending = data[:cut], data[cut:]
+            else:
+                self._finished = True
+                data += b"</documents>"
+            data = _xml_declaration.sub(b"", data)
+
+        if data and not self._started:
+            self._started = True
+            data = b"<documents>" + data
+        return data
+
+
+def iterparse_records(document: str | Path | BinaryIO, tag: str, concatenated: bool = False) -> Iterator[Element]:
+    """
+    Iterate over records embedded in an XML document, such as a catalogue (e.g. CSW or OAI-PMH) response.
+
+    Documents are parsed incrementally, without accessing the network or resolving entities, using the current parser
+    options (see `set_xml_parser_options()`, except `collect_ids`, which lxml doesn't support here). Each record (an element
+    with `tag`, at any depth) is yielded once it has been parsed, and then cleared, along with any earlier elements,
+    once the next record is requested. Memory use therefore depends on the size of each record, rather than the whole
+    document. Records must not be used after the next record is requested (copy them if needed).
+
+    If `concatenated` is set, the document may be a number of concatenated XML documents (e.g. a dump of records),
+    rather than a single document. Concatenated documents must use UTF-8 and must not contain document type declarations
+    (`<!DOCTYPE ...>`), which are returned as a `RecordValidationError` exception. Processing instructions (e.g.
+    `<?xml-stylesheet ...?>`), comments and CDATA sections are supported, except for XML declarations within them.
+
+    As elsewhere (e.g. `parse_xml_document()`), a `str` document is the content of a document, rather than a path.
+
+    Malformed documents are returned as a `RecordValidationError` exception, with errors in the `errors` attribute.
+
+    :type document: str | Path | BinaryIO
+    :param document: XML document as a string, path to an XML document, or a binary file-like object
+    :type tag: str
+    :param tag: tag of record elements in Clark notation (e.g. '{http://www.isotc211.org/2005/gmd}MD_Metadata')
+    :type concatenated: bool
+    :param concatenated: whether the document may be concatenated XML documents
+    :return: record elements
+    """
+    stream = None
+    source = document
+    if isinstance(document, str):
+        source = BytesIO(document.encode())
+    elif isinstance(document, Path):
+        source = str(document)
+        if concatenated:
+            stream = Path(document).open(mode="rb")  # noqa: SIM115 (closed once iteration ends)
+            source = stream
+    if concatenated:
+        source = _ConcatenatedDocuments(stream=source)
+
+    options = _xml_parser_options
+    events = iterparse(
+        source,
+        events=("end",),
+        tag=tag,
+        no_network=True,
+        resolve_entities=False,
+        remove_blank_text=options.remove_blank_text,
+        huge_tree=options.huge_tree,
+    )
+    try:
+        for _, element in events:
+            yield element
+            element.clear(keep_tail=True)
+            for node in (element, *element.iterancestors()):
+                while node.getprevious() is not None:
+                    del node.getparent()[0]
+    except XMLSyntaxError as e:
+        _raise_validation_error(errors=_validation_issues(e.error_log))
+    finally:
+        if stream is not None:
+            stream.close()
 
 
 class Namespaces:
@@ -35,6 +989,7 @@ class Namespaces:
     """
 
     _schema_locations = {}  # noqa: RUF012
+    _frozen_nsmap: Mapping | None = None
 
     def __init__(self, namespaces: dict | None = None, root_namespace: str | None = None):
         """
@@ -82,6 +1037,23 @@ class Namespaces:
 
         return nsmap
 
+    def frozen_nsmap(self) -> Mapping:
+        """
+        Create a namespace map, as per `nsmap()`, that can't be changed.
+
+        The map is created once per instance and then reused, avoiding creating a new map each time one is needed (e.g.
+        for each XPath query). For use with a shared instance of this class, such as a module level constant.
+
+        :return: immutable mapping of Namespaces indexed by prefix
+        """
+        if self._frozen_nsmap is None:
+            self._frozen_nsmap = MappingProxyType(self.nsmap())
+        return self._frozen_nsmap
+
+    def __deepcopy__(self, memo: dict) -> Namespaces:
+        """Namespaces aren't changed once created, so are shared rather than copied (e.g. when copying records)."""
+        return self
+
     def schema_locations(self) -> str:
         """
         Generate value for a `xsi:schemaLocation` attribute.
@@ -97,6 +1069,49 @@ class Namespaces:
         return schema_locations.lstrip()
 
 
+class Vocabulary:
+    """
+    Tags, in Clark notation, for names in an XML namespace.
+
+    Tags are accessed as attributes named after each element or attribute, e.g. `GMD.CI_Citation` for a vocabulary of
+    the `gmd` namespace is '{http://www.isotc211.org/2005/gmd}CI_Citation'. Names that aren't valid Python identifiers
+    can be accessed as items instead (e.g. `GMD["pass"]`). Each tag is created when first used and then kept as a
+    constant, avoiding formatting the same tag each time an element is created.
+
+    Vocabularies can't be changed, other than by adding tags, and can be shared (e.g. as module level constants).
+    """
+
+    def __init__(self, namespace: str):
+        """
+        Initialise.
+
+        :type namespace: str
+        :param namespace: XML namespace (e.g. 'http://www.isotc211.org/2005/gmd')
+        """
+        object.__setattr__(self, "namespace", namespace)
+
+    def __getattr__(self, name: str) -> str:
+        """Tag for a name in this namespace, created when first used."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        tag = f"{{{self.namespace}}}{name}"
+        object.__setattr__(self, name, tag)
+        return tag
+
+    def __getitem__(self, name: str) -> str:
+        """Tag for a name in this namespace, for names that aren't valid identifiers (e.g. `pass`)."""
+        return getattr(self, name)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Prevent tags being changed."""
+        msg = "Vocabulary tags can't be changed."
+        raise AttributeError(msg)
+
+    def __repr__(self) -> str:
+        """Representation including namespace."""
+        return f"Vocabulary({self.namespace!r})"
+
+
 class MetadataRecordConfig:
     """
     Represents the configuration for a metadata record.
@@ -120,18 +1135,32 @@ class MetadataRecordConfig:
         if "$schema" not in self.config:
             self.config["$schema"] = self.schema_uri
 
-    def validate(self) -> None:
+    def validate(self, encode_config: bool = False, check_formats: bool = False) -> None:
         """
         Ensures the configuration is valid against the relevant JSON Schema.
 
-        The record configuration (a Python dict) is first duplicated to a JSON safe encoding (i.e. Python dates objects
-        converted to strings), to allow validation against the JSON Schema.
+        The record configuration (a Python dict) is validated in place, with any non-JSON values (i.e. Python dates)
+        checked as if converted to strings (see `encode_json_member()`).
+
+        If `encode_config` is set, the record configuration is instead first duplicated to a JSON safe encoding, and
+        this copy validated. This gives the same result, and is slower, but may be useful for debugging.
+
+        If `check_formats` is set, values with a format (e.g. URIs) are also checked (see `get_format_checker()`).
 
         Where the configuration is invalid, a relevant exception will be raised.
         """
-        if self.schema is not None:
+        if self.schema is None:
+            return
+
+        format_checker = get_format_checker() if check_formats else None
+        if encode_config:
             _config = json.loads(json.dumps(deepcopy(self.config), default=str))
-            validate(instance=_config, schema=self.schema)
+            validate_instance(instance=_config, schema=self.schema, format_checker=format_checker)
+            return
+
+        validate_instance(
+            instance=self.config, schema=self.schema, encode_member=encode_json_member, format_checker=format_checker
+        )
 
     def load(self, file: Path) -> None:
         """Loads a record configuration from a JSON encoded file."""
@@ -152,6 +1181,76 @@ class MetadataRecordConfig:
         return json.dumps(self.config, indent=2)
 
 
+class LazyMetadataRecordConfig(Mapping):
+    """
+    Represents the configuration for a metadata record, decoded from a record on access.
+
+    Each top-level section of the configuration (e.g. 'identification') is decoded the first time it's accessed, and
+    then reused. This is useful where only some sections are needed, such as for listing records, as other sections are
+    not decoded.
+
+    Iterating over the configuration (including `len()`, `keys()` and `dict()`), or calling `materialise()`, decodes all
+    sections, as sections that turn out to be empty are omitted, as in a regular record configuration.
+
+    It's expected instances of this class will be returned by the `make_lazy_config()` method of standard specific
+    record classes, using the decoders for each section of that standard.
+    """
+
+    def __init__(self, sections: dict[str, Callable[[], Any]], values: dict | None = None):
+        """
+        Initialise.
+
+        :type sections: dict
+        :param sections: functions to decode each section, returning `None` for empty sections, indexed by key
+        :type values: dict
+        :param values: optional sections that are already known (e.g. '$schema'), ordered before decoded sections
+        """
+        self._values: dict[str, Any] = {} if values is None else dict(values)
+        self._sections = dict(sections)
+        self._keys = [*self._values.keys(), *(key for key in self._sections if key not in self._values)]
+
+    def _value(self, key: str) -> Any:  # noqa: ANN401
+        if key not in self._values:
+            decode_section = self._sections[key]
+            try:
+                self._values[key] = decode_section()
+            except KeyError as e:
+                # not to be mistaken for a missing section
+                msg = f"Record configuration section '{key}' could not be decoded."
+                raise RuntimeError(msg) from e
+        return self._values[key]
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        """Get a section, decoding it if needed, raising a KeyError for empty sections."""
+        if key not in self._values and key not in self._sections:
+            raise KeyError(key)
+        value = self._value(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Keys of non-empty sections, decoding all sections."""
+        return (key for key in self._keys if self._value(key) is not None)
+
+    def __len__(self) -> int:
+        """Number of non-empty sections, decoding all sections."""
+        return sum(1 for _ in self)
+
+    @property
+    def decoded_sections(self) -> list[str]:
+        """Keys of sections decoded (or given) so far, including empty sections."""
+        return [key for key in self._keys if key in self._values]
+
+    def materialise(self) -> dict:
+        """
+        Decode all sections into a regular record configuration.
+
+        :return: record configuration
+        """
+        return {key: self[key] for key in self}
+
+
 class MetadataRecord:
     """
     Generates a metadata record using a configuration, or a configuration using a record.
@@ -165,17 +1264,34 @@ class MetadataRecord:
     should be able to create exactly the same configuration object again without loosing any information.
     """
 
-    def __init__(self, configuration: MetadataRecordConfig = None, record: str | None = None):
+    def __init__(
+        self,
+        configuration: MetadataRecordConfig = None,
+        record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO | None = None,
+    ):
         self.ns = Namespaces()
         self.attributes = {}
         self.record = None
+        self.record_digest = None
 
         if configuration is not None:
             configuration.validate()
             self.attributes = configuration.config
 
         if record is not None:
-            self.record = fromstring(record.encode())
+            self.load_record(record)
+
+    def load_record(self, record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO) -> None:
+        """
+        Parse a record to be decoded.
+
+        If a decode cache is set (see `decode_cache.set_decode_cache()`), a digest of the record is also calculated (as
+        `record_digest`), for looking up cached configurations.
+        """
+        if get_decode_cache() is not None:
+            record = read_record(record)
+            self.record_digest = record_digest(record)
+        self.record = parse_record(record)
 
     def make_config(self) -> MetadataRecordConfig:
         """
@@ -193,38 +1309,105 @@ class MetadataRecord:
         """
         return None
 
-    def generate_xml_document(self) -> bytes:
+    def make_sections(self) -> Iterator[Element]:
+        """
+        Builds a metadata record in sections, yielding the root element each time a section is added to it.
+
+        Used to write records incrementally (see `write_xml_document()`). By default, all elements are added at once
+        using `make_element()`. Standards may override this method to yield after each top-level section instead.
+        """
+        yield self.make_element()
+
+    def generate_xml_document(
+        self, pretty_print: bool = True, compress: bool = False, file: Path | BinaryIO | None = None
+    ) -> bytes | None:
         """
         Generates an XML document and tree from an XML element defining a record.
 
-        The XML document is encoded as a UTF-8 byte string, with pretty-printing and an XML declaration.
+        The XML document is encoded as a UTF-8 byte string, with an XML declaration, and by default with pretty-printing.
+        Set `pretty_print` to false for a compact document without indentation (e.g. for storage or transfer).
+
+        Set `compress` to compress the document using gzip. Compressed documents can be decoded and validated directly.
+
+        If `file` is set, the document is written to a path or binary file object, rather than returned. Documents are
+        written incrementally using `write_xml_document()` (and so the record will be empty afterwards).
         """
+        if file is not None:
+            with ExitStack() as stack:
+                if isinstance(file, Path):
+                    file = stack.enter_context(file.open(mode="wb"))
+                if compress:
+                    file = stack.enter_context(gzip.GzipFile(filename="", mode="wb", fileobj=file, mtime=0))
+                self.write_xml_document(file=file, pretty_print=pretty_print)
+            return None
+
         self.record = self.make_element()
         document = ElementTree(self.record)
 
-        return element_string(document, pretty_print=True, xml_declaration=True, encoding="utf-8")
+        encoded_document = element_string(document, pretty_print=pretty_print, xml_declaration=True, encoding="utf-8")
+        if compress:
+            return gzip.compress(encoded_document, mtime=0)
+        return encoded_document
+
+    def write_xml_document(self, file: BinaryIO, pretty_print: bool = True) -> None:
+        """
+        Generates an XML document incrementally, writing each section of the record to a file as it's built.
+
+        For large records, where holding both a complete element tree and the encoded document in memory is undesirable.
+        The XML document is encoded as UTF-8, with an XML declaration, and is the same as from `generate_xml_document()`
+        (or without indentation where `pretty_print` is false). See `write_xml_sections()` for more information.
 
-    def validate(self, xsd_path: Path) -> None:
+        Elements are removed from the record once written, so the record will be empty afterwards.
+        """
+        write_xml_sections(sections=self.make_sections(), file=file, pretty_print=pretty_print)
+
+    def validate(self, xsd_path: Path, use_xmllint: bool = False) -> None:
         """
         Validates the contents of a record against a given XSD schema.
 
-        The external `xmllint` binary is used to validate records as the `lxml` methods did not easily support relative
-        paths for schemas that use imports/includes (which includes the ISO 19115 family).
+        Schemas are loaded from an XSD directory within this package using the `importlib.files` method, with any
+        imported or included schemas resolved against this directory. Schemas are compiled once per process and the
+        record is validated in memory, without serialising it (see `validate_xml_document()`).
+
+        Validation errors are returned as a `RecordValidationError` exception, with individual errors (including the
+        XPath of the element concerned) in its `errors` attribute.
 
-        Schemas are loaded from an XSD directory within this package using the `importlib.files` method. The current
-        record object is written to a temporary directory to easily pass to the `xmllint` binary.
+        The external `xmllint` binary can be used instead by setting `use_xmllint` (e.g. to compare results). The
+        current record is written to a temporary directory to pass to `xmllint`, which only returns a 0 exit code if
+        the record validates successfully. Any other exit code is returned as a `RecordValidationError` exception, with
+        the output from `xmllint` as its message.
 
-        The `xmllint` binary only returns a 0 exit code if the record validates successfully. Therefore, any other exit
-        code can be considered a validation failure, and returned as a `RecordValidationError` exception.
+        If a validation cache is set (see `validation_cache.set_validation_cache()`), validation is skipped for records
+        with the same configuration as a record already validated successfully against the same schema (including the
+        contents of the schema, and any schemas it imports or includes).
 
         It is assumed this method will be overridden in concrete implementations of this class. Specifically it's
         assumed the `xsd_path` parameter will be hard coded to a schema suitable for the standard each class implements.
         """
+        cache = get_validation_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.key(
+                kind="record", content=canonical_json(self.attributes), schema_ids=[_xml_schema_id(xsd_path)]
+            )
+            if cache_key in cache:
+                return
+
+        validation_document: MetadataRecord = deepcopy(self)
+        if not use_xmllint:
+            validate_xml_document(document=validation_document.make_element(), xsd_path=xsd_path)
+        else:
+            self._validate_xmllint(validation_document=validation_document, xsd_path=xsd_path)
+
+        if cache_key is not None:
+            cache.add(cache_key)
+
+    @staticmethod
+    def _validate_xmllint(validation_document: MetadataRecord, xsd_path: Path) -> None:
+        """Validates a record using the external `xmllint` binary."""
         schema_path = resource_file("bas_metadata_library.schemas.xsd").joinpath(xsd_path)
-
         with TemporaryDirectory() as document_path:
             document_path = Path(document_path).joinpath("record.xml")
-            validation_document: MetadataRecord = deepcopy(self)
             with document_path.open(mode="w") as document_file:
                 document_data = validation_document.generate_xml_document().decode()
                 document_file.write(document_data)
@@ -239,9 +1422,127 @@ class MetadataRecord:
                 msg = f"Record validation failed: {e.stderr.decode()}"
                 raise RecordValidationError(msg) from e
 
+    @classmethod
+    def validate_document(
+        cls,
+        document: str | bytes | bytearray | memoryview | mmap | Path | Element | ElementTree,
+        xsd_path: Path,
+    ) -> None:
+        """
+        Validates an already generated record against a given XSD schema.
+
+        For validating the output of `generate_xml_document()` (or `make_element()`), or a record from elsewhere,
+        without generating the record again. Documents can be given as text, bytes (including `bytearray`,
+        `memoryview` and `mmap` objects), a path, or an lxml element or element tree (see `validate_xml_document()`).
+
+        If a validation cache is set (see `validation_cache.set_validation_cache()`), validation is skipped for text,
+        bytes or path documents with the same contents as a document already validated successfully against the same schema.
+
+        As with `validate()`, it is assumed this method will be overridden in concrete implementations of this class
+        to hard code the `xsd_path` parameter.
+        """
+        cache = get_validation_cache()
+        cache_key = None
+        if cache is not None and isinstance(document, (str, bytes, bytearray, memoryview, mmap, Path)):
+            if isinstance(document, str):
+                document = document.encode()
+            if isinstance(document, Path):
+                document = document.read_bytes()
+            cache_key = cache.key(kind="document", content=bytes(document), schema_ids=[_xml_schema_id(xsd_path)])
+            if cache_key in cache:
+                return
+
+        validate_xml_document(document=document, xsd_path=xsd_path)
+
+        if cache_key is not None:
+            cache.add(cache_key)
+
+
+@dataclass(frozen=True)
+class RecordValidationResult:
+    """
+    The result of validating a record as part of a batch (see `validate_many()`).
+
+    `index` is the position of the record in the batch, and `record` the item validated (as given). Where a record is
+    invalid, individual validation errors are given in `errors`.
+
+    Where a record could not be validated at all (e.g. a path that doesn't exist), it is treated as invalid, with the
+    exception raised given in `error` (and summarised as a single item in `errors`).
+    """
+
+    index: int
+    record: object
+    valid: bool
+    errors: list[RecordValidationIssue] = field(default_factory=list)
+    error: Exception | None = None
+
+
+def validate_many(
+    records: Iterable[MetadataRecord | MetadataRecordConfig | bytes | Path | Element | ElementTree],
+    standard: type[MetadataRecord],
+    stop_on_failure: bool = False,
+) -> Iterator[RecordValidationResult]:
+    """
+    Validate a batch of records against the XML schema for a standard.
+
+    All records are validated using the same compiled schema (see `get_xml_schema()`). Records can be given as record
+    configurations (which are used to generate records), record instances, or already generated records (as bytes, a
+    path, or an lxml element or element tree, see `MetadataRecord.validate_document()`).
+
+    Records are validated, and results returned, one at a time as this generator is consumed. Records can therefore
+    be given as any iterable (such as a generator reading records from disk), without holding all records in memory.
+
+    Record configurations are validated against their JSON Schema when generating records. Invalid configurations are
+    returned as invalid results, with the JSON Schema error in `RecordValidationResult.error`. Records generated from
+    configurations are validated as record instances, including using any validation cache set (see
+    `MetadataRecord.validate()`).
+
+    Records that can't be read, parsed or generated (raising an `OSError`, `ValueError` or `KeyError`) are returned as
+    invalid results, with the error in `RecordValidationResult.error`, rather than stopping the batch.
+
+    If `stop_on_failure` is set, no further records are validated after the first invalid record.
+
+    :type records: Iterable
+    :param records: records to validate
+    :type standard: type[MetadataRecord]
+    :param standard: record class for the standard records should be validated against (e.g. `iso_19115_2.MetadataRecord`)
+    :type stop_on_failure: bool
+    :param stop_on_failure: whether to stop after the first invalid record
+    :return: validation result for each record, in the order given
+    """
+    for index, record in enumerate(records):
+        try:
+            if isinstance(record, MetadataRecordConfig):
+                standard(configuration=record).validate()
+            elif isinstance(record, MetadataRecord):
+                record.validate()
+            else:
+                standard.validate_document(document=record)
+        except RecordValidationError as e:
+            result = RecordValidationResult(index=index, record=record, valid=False, errors=e.errors)
+        except ValidationError as e:
+            errors = [RecordValidationIssue(message=f"ValidationError: {e.message}", path=e.json_path)]
+            result = RecordValidationResult(index=index, record=record, valid=False, errors=errors, error=e)
+        except (OSError, ValueError, KeyError) as e:
+            errors = [RecordValidationIssue(message=f"{type(e).__name__}: {e}")]
+            result = RecordValidationResult(index=index, record=record, valid=False, errors=errors, error=e)
+        else:
+            result = RecordValidationResult(index=index, record=record, valid=True)
+
+        yield result
+        if stop_on_failure and not result.valid:
+            return
+
 
 class MetadataRecordElement:
-    """Create an XML element."""
+    """
+    Create an XML element.
+
+    The namespaces for a standard are shared by all elements, via the `ns` class attribute, which should be set to a
+    module level instance of the `Namespaces` class for the standard in subclasses.
+    """
+
+    ns = Namespaces()
 
     def __init__(
         self,
@@ -265,7 +1566,6 @@ class MetadataRecordElement:
         :type xpath: str
         :param xpath: Absolute XML XPath selecting the value of the element created
         """
-        self.ns = Namespaces()
         self.record = record
         self.attributes = attributes
         self.parent_element = parent_element
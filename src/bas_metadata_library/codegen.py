@@ -0,0 +1,437 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from hashlib import sha256
+from importlib import import_module
+from numbers import Number
+from threading import RLock
+from types import ModuleType
+from typing import Any, Callable
+
+# JSON Schema keywords that do not affect validation
+_annotation_keywords = {
+    "$comment",
+    "$defs",
+    "$id",
+    "$schema",
+    "default",
+    "definitions",
+    "description",
+    "examples",
+    "readOnly",
+    "title",
+    "writeOnly",
+}
+_validation_keywords = {
+    "$ref",
+    "additionalProperties",
+    "allOf",
+    "anyOf",
+    "const",
+    "contains",
+    "else",
+    "enum",
+    "format",
+    "if",
+    "items",
+    "maxItems",
+    "maxLength",
+    "maximum",
+    "minItems",
+    "minLength",
+    "minimum",
+    "oneOf",
+    "pattern",
+    "patternProperties",
+    "properties",
+    "propertyNames",
+    "required",
+    "then",
+    "type",
+}
+_type_checks = {
+    "array": "isinstance({0}, list)",
+    "boolean": "isinstance({0}, bool)",
+    "integer": "is_json_integer({0})",
+    "null": "{0} is None",
+    "number": "is_json_number({0})",
+    "object": "isinstance({0}, dict)",
+    "string": "isinstance({0}, str)",
+}
+
+JSON_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, list, type(None)})
+
+_generated_validators_package = "bas_metadata_library.schemas.validators"
+_generated_validators_lock = RLock()
+_generated_modules: dict[str, ModuleType | None] = {}
+
+
+def is_json_number(instance: Any) -> bool:  # noqa: ANN401
+    """As per the JSON Schema Draft 7 'number' type (excluding booleans)."""
+    return isinstance(instance, Number) and not isinstance(instance, bool)
+
+
+def is_json_integer(instance: Any) -> bool:  # noqa: ANN401
+    """As per the JSON Schema Draft 7 'integer' type (including floats without a fractional part)."""
+    if isinstance(instance, bool):
+        return False
+    return isinstance(instance, int) or (isinstance(instance, float) and instance.is_integer())
+
+
+def json_equal(one: Any, two: Any) -> bool:  # noqa: ANN401
+    """As per JSON Schema equality for the 'const' and 'enum' keywords (e.g. `True` and `1` are not equal)."""
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(json_equal(i, j) for i, j in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(key in two and json_equal(value, two[key]) for key, value in one.items())
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def schema_digest(schema: dict) -> str:
+    """SHA-256 digest of a JSON Schema, used to check generated validators match the schema they were generated from."""
+    return sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
+
+class _ValidatorGenerator:
+    """
+    Generates Python source for a function that checks whether an instance is valid against a JSON Schema.
+
+    Each distinct (sub-)schema becomes a function returning a boolean. `$ref` references are resolved within the
+    schema, with recursion supported by naming functions before generating their bodies. Only the Draft 7 keywords used
+    by the schemas in this package are supported, other keywords raise a `ValueError`.
+    """
+
+    def __init__(self, schema: dict):
+        self.schema = schema
+        self.functions: list[str] = []
+        self.constants: list[str] = []
+        self._function_names: dict[str, str] = {}
+        self._constant_names: dict[str, str] = {}
+
+    def constant(self, expression: str) -> str:
+        if expression not in self._constant_names:
+            self._constant_names[expression] = f"_C{len(self._constant_names)}"
+            self.constants.append(f"{self._constant_names[expression]} = {expression}")
+        return self._constant_names[expression]
+
+    def resolve(self, ref: str) -> dict | bool:
+        if not ref.startswith("#"):
+            msg = f"Unsupported reference '{ref}', only references within a schema are supported."
+            raise ValueError(msg)
+        schema = self.schema
+        for token in [token for token in ref[1:].split("/") if token != ""]:
+            token = token.replace("~1", "/").replace("~0", "~")
+            schema = schema[int(token)] if isinstance(schema, list) else schema[token]
+        return schema
+
+    @staticmethod
+    def check_supported(schema: dict) -> None:
+        unsupported = set(schema.keys()) - _validation_keywords - _annotation_keywords
+        if unsupported:
+            msg = f"Unsupported JSON Schema keywords: {sorted(unsupported)}."
+            raise ValueError(msg)
+
+    def is_trivial(self, schema: dict | bool) -> bool:
+        if isinstance(schema, bool):
+            return schema
+        # Unsupported keywords may restrict instances, so schemas using them can't be assumed to always be valid
+        self.check_supported(schema)
+        return not any(keyword in _validation_keywords for keyword in schema)
+
+    def function(self, schema: dict | bool) -> str:
+        # As per Draft 7, keywords alongside a reference are ignored
+        if isinstance(schema, dict) and "$ref" in schema:
+            return self.function(self.resolve(schema["$ref"]))
+
+        key = json.dumps(schema, sort_keys=True)
+        if key not in self._function_names:
+            self._function_names[key] = f"_v{len(self._function_names)}"
+            name = self._function_names[key]
+            body = self.body(schema)
+            self.functions.append("\n".join([f"def {name}(i, e, f):", *[f"    {line}" for line in body]]))
+        return self._function_names[key]
+
+    def check(self, schema: dict | bool, value: str) -> list[str]:
+        if self.is_trivial(schema):
+            return []
+        return [f"if not {self.function(schema)}({value}, e, f):", "    return False"]
+
+    @staticmethod
+    def encode(value: str, key: str) -> list[str]:
+        return [
+            f"if e is not None and {value}.__class__ not in JSON_PASSTHROUGH_TYPES:",
+            f"    {value} = e({key}, {value})",
+        ]
+
+    def body(self, schema: dict | bool) -> list[str]:  # noqa: C901
+        if isinstance(schema, bool):
+            return [f"return {schema}"]
+
+        self.check_supported(schema)
+
+        lines = []
+        types = schema.get("type")
+        if types is not None:
+            types = [types] if isinstance(types, str) else types
+            lines += [
+                f"if not ({' or '.join(_type_checks[type_].format('i') for type_ in types)}):",
+                "    return False",
+            ]
+
+        lines += self._object_lines(schema, known=types == ["object"])
+        lines += self._array_lines(schema, known=types == ["array"])
+        lines += self._string_lines(schema, known=types == ["string"])
+        lines += self._number_lines(schema, known=types == ["number"])
+
+        if "format" in schema:
+            lines += [f"if f is not None and not f.conforms(i, {schema['format']!r}):", "    return False"]
+        if "const" in schema:
+            lines += [f"if not json_equal(i, {self.constant(repr(schema['const']))}):", "    return False"]
+        if "enum" in schema:
+            enum = self.constant(repr(tuple(schema["enum"])))
+            lines += [f"if not any(json_equal(i, _) for _ in {enum}):", "    return False"]
+        for subschema in schema.get("allOf", []):
+            lines += self.check(subschema, "i")
+        if "anyOf" in schema:
+            functions = ", ".join(self.function(subschema) for subschema in schema["anyOf"])
+            lines += [f"if not any(_(i, e, f) for _ in ({functions},)):", "    return False"]
+        if "oneOf" in schema:
+            functions = ", ".join(self.function(subschema) for subschema in schema["oneOf"])
+            lines += [f"if sum(1 for _ in ({functions},) if _(i, e, f)) != 1:", "    return False"]
+        if "if" in schema:
+            then_lines = self.check(schema.get("then", True), "i")
+            else_lines = self.check(schema.get("else", True), "i")
+            if then_lines or else_lines:
+                lines += [
+                    f"if {self.function(schema['if'])}(i, e, f):",
+                    *[f"    {line}" for line in then_lines or ["pass"]],
+                ]
+                if else_lines:
+                    lines += ["else:", *[f"    {line}" for line in else_lines]]
+
+        return [*lines, "return True"]
+
+    @staticmethod
+    def _guard(lines: list[str], condition: str, known: bool) -> list[str]:
+        if not lines or known:
+            return lines
+        return [f"if {condition}:", *[f"    {line}" for line in lines]]
+
+    def _object_lines(self, schema: dict, known: bool) -> list[str]:  # noqa: C901
+        lines = []
+        for name in schema.get("required", []):
+            lines += [f"if {name!r} not in i:", "    return False"]
+        for name, subschema in schema.get("properties", {}).items():
+            check = self.check(subschema, "v")
+            if check:
+                lines += [f"if {name!r} in i:", f"    v = i[{name!r}]"]
+                lines += [f"    {line}" for line in [*self.encode("v", repr(name)), *check]]
+
+        pattern_properties = schema.get("patternProperties", {})
+        for pattern, subschema in pattern_properties.items():
+            check = self.check(subschema, "v")
+            if check:
+                regex = self.constant(f"re.compile({pattern!r})")
+                lines += ["for k, v in i.items():", f"    if {regex}.search(k):"]
+                lines += [f"        {line}" for line in [*self.encode("v", "k"), *check]]
+
+        if "additionalProperties" in schema:
+            additional = schema["additionalProperties"]
+            conditions = []
+            if "properties" in schema:
+                properties = self.constant(f"frozenset({sorted(schema['properties'])!r})")
+                conditions.append(f"k not in {properties}")
+            if pattern_properties:
+                regex = self.constant(f"re.compile({'|'.join(pattern_properties)!r})")
+                conditions.append(f"not {regex}.search(k)")
+            condition = " and ".join(conditions) or "True"
+            if additional is False:
+                lines += ["for k in i:", f"    if {condition}:", "        return False"]
+            elif not self.is_trivial(additional):
+                lines += ["for k, v in i.items():", f"    if {condition}:"]
+                lines += [f"        {line}" for line in [*self.encode("v", "k"), *self.check(additional, "v")]]
+
+        if "propertyNames" in schema:
+            check = self.check(schema["propertyNames"], "k")
+            if check:
+                lines += ["for k in i:", *[f"    {line}" for line in check]]
+
+        return self._guard(lines, "isinstance(i, dict)", known)
+
+    def _array_lines(self, schema: dict, known: bool) -> list[str]:
+        lines = []
+        if "minItems" in schema:
+            lines += [f"if len(i) < {schema['minItems']!r}:", "    return False"]
+        if "maxItems" in schema:
+            lines += [f"if len(i) > {schema['maxItems']!r}:", "    return False"]
+        if "items" in schema:
+            items = schema["items"]
+            if isinstance(items, list):
+                msg = "Unsupported JSON Schema keyword value: 'items' as an array."
+                raise ValueError(msg)
+            check = self.check(items, "v")
+            if check:
+                lines += ["for k, v in enumerate(i):", *[f"    {line}" for line in [*self.encode("v", "k"), *check]]]
+        if "contains" in schema:
+            lines += [
+                f"if not any({self.function(schema['contains'])}(v, e, f) for v in (",
+                "    v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)",
+                ")):",
+                "    return False",
+            ]
+        return self._guard(lines, "isinstance(i, list)", known)
+
+    def _string_lines(self, schema: dict, known: bool) -> list[str]:
+        lines = []
+        if "minLength" in schema:
+            lines += [f"if len(i) < {schema['minLength']!r}:", "    return False"]
+        if "maxLength" in schema:
+            lines += [f"if len(i) > {schema['maxLength']!r}:", "    return False"]
+        if "pattern" in schema:
+            regex = self.constant(f"re.compile({schema['pattern']!r})")
+            lines += [f"if not {regex}.search(i):", "    return False"]
+        return self._guard(lines, "isinstance(i, str)", known)
+
+    def _number_lines(self, schema: dict, known: bool) -> list[str]:
+        lines = []
+        if "minimum" in schema:
+            lines += [f"if i < {schema['minimum']!r}:", "    return False"]
+        if "maximum" in schema:
+            lines += [f"if i > {schema['maximum']!r}:", "    return False"]
+        return self._guard(lines, "is_json_number(i)", known)
+
+
+def generate_validator_source(schema: dict, source: str) -> str:
+    """
+    Generate the source of a Python module that validates instances against a JSON Schema.
+
+    The module defines a `validate(instance, encode_member=None, format_checker=None)` function, returning whether an
+    instance is valid. It gives the same result as a `jsonschema` validator from
+    `bas_metadata_library.get_schema_validator()` for the same schema, `encode_member` function and format checker,
+    without interpreting the schema on each call. It does not return errors.
+
+    The module also defines a `FRAGMENTS` dict of equivalent functions for each named sub-schema (in `definitions` or
+    `$defs`), indexed by JSON pointer (e.g. '#/definitions/contact').
+
+    Only the JSON Schema (Draft 7) keywords used by schemas in this package are supported. Formats are only checked if
+    a format checker is given, as per `jsonschema` validators.
+
+    :type schema: dict
+    :param schema: JSON Schema (with an absolute `$id`)
+    :type source: str
+    :param source: name of the schema file the module is generated from, for reference
+    :return: Python module source
+    """
+    generator = _ValidatorGenerator(schema=schema)
+    root = generator.function(schema)
+    fragments = [
+        f"    {f'#/{keyword}/{name}'!r}: {generator.function(subschema)},"
+        for keyword in ["definitions", "$defs"]
+        for name, subschema in schema.get(keyword, {}).items()
+    ]
+
+    return "\n".join(
+        [
+            f"# Generated from '{source}' by the `generate-validators` task - do not edit.",
+            "import re",
+            "",
+            "from bas_metadata_library.codegen import JSON_PASSTHROUGH_TYPES, is_json_integer, is_json_number, json_equal",
+            "",
+            f"SCHEMA_ID = {schema['$id']!r}",
+            f"SCHEMA_DIGEST = {schema_digest(schema)!r}",
+            "",
+            *generator.constants,
+            "",
+            "",
+            "\n\n\n".join(generator.functions),
+            "",
+            "",
+            "def validate(instance, encode_member=None, format_checker=None):",
+            f"    return {root}(instance, encode_member, format_checker)",
+            "",
+            "",
+            "FRAGMENTS = {",
+            *fragments,
+            "}",
+            "",
+        ]
+    )
+
+
+def generate_validators_index_source(modules: dict[str, str]) -> str:
+    """
+    Generate the source of the package index for generated validator modules.
+
+    :type modules: dict[str, str]
+    :param modules: generated module names, indexed by the `$id` of the schema each module was generated from
+    :return: Python module source
+    """
+    lines = [f"    {schema_id!r}: {module!r}," for schema_id, module in sorted(modules.items())]
+    return "\n".join(
+        [
+            "# Generated by the `generate-validators` task - do not edit.",
+            "",
+            "MODULES = {",
+            *lines,
+            "}",
+            "",
+        ]
+    )
+
+
+def _load_generated_module(schema: dict) -> ModuleType | None:
+    try:
+        modules = import_module(_generated_validators_package).MODULES
+    except ImportError:
+        return None
+
+    module_name = modules.get(schema.get("$id"))
+    if module_name is None:
+        return None
+    module = import_module(f"{_generated_validators_package}.{module_name}")
+    if schema_digest(schema) != module.SCHEMA_DIGEST:
+        return None
+    return module
+
+
+def get_generated_validator(schema: dict, fragment: str | None = None) -> Callable[..., bool] | None:
+    """
+    Get a generated validator for a JSON Schema, or a named sub-schema within it, if available.
+
+    Generated validators are Python modules in the `bas_metadata_library.schemas.validators` package, created from
+    the distribution schemas in this package by the `generate-validators` task (see `generate_validator_source()`).
+
+    Validators are loaded once per schema identity (`$id`). If a validator has not been generated for a schema, or was
+    generated from a different version of the schema, `None` is returned and a `jsonschema` validator should be used.
+
+    Generated validators are called with an instance, an optional `encode_member` function (see
+    `bas_metadata_library.encoding_validator()`) and an optional `jsonschema.FormatChecker`, and return whether the
+    instance is valid.
+
+    :type schema: dict
+    :param schema: JSON Schema
+    :type fragment: str
+    :param fragment: optional JSON pointer to a named sub-schema (e.g. '#/definitions/contact')
+    :return: generated validator function, or None if not available
+    """
+    schema_id = schema.get("$id", "")
+    if schema_id == "" or schema_id.startswith("#"):
+        return None
+
+    with _generated_validators_lock:
+        if schema_id not in _generated_modules:
+            _generated_modules[schema_id] = _load_generated_module(schema=schema)
+        module = _generated_modules[schema_id]
+
+    if module is None:
+        return None
+    if fragment is None:
+        return module.validate
+    return module.FRAGMENTS.get(fragment)
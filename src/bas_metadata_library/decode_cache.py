@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import pickle
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import RLock
+
+_decode_cache_lock = RLock()
+_decode_cache: DecodeCache | None = None
+
+
+@dataclass(frozen=True)
+class DecodeCacheStats:
+    """
+    Statistics for a decode cache.
+
+    `size` is the total size, in bytes, of cached record configurations (as stored).
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    size: int
+
+
+class DecodeCache:
+    """
+    Optional in-memory cache of record configurations decoded from records.
+
+    For avoiding decoding the same, unchanged, records repeatedly (e.g. popular records in an API). Configurations are
+    keyed by a digest of the record (as bytes), the standard, and any fields decoded (see `key()`).
+
+    Configurations are stored serialised (pickled), so that they can't be changed once cached, and each lookup returns
+    a new copy that callers can change freely. Serialised configurations also give an accurate size for each entry.
+
+    Where the cache holds more than `max_entries` entries, or entries larger than `max_bytes` in total, the least
+    recently used entries are removed.
+
+    Caches are safe to use from multiple threads. To use a cache for all record decoding in a process, see
+    `set_decode_cache()`.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialise.
+
+        :type max_entries: int
+        :param max_entries: maximum number of entries to keep
+        :type max_bytes: int
+        :param max_bytes: maximum total size of entries to keep, in bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = RLock()
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Number of entries in cache."""
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        """Whether a configuration is cached for a key (without marking the entry as recently used)."""
+        return key in self._entries
+
+    @staticmethod
+    def key(digest: str, root_tag: str, fields: list[str] | None = None) -> str:
+        """
+        Generate a cache key for decoding a record.
+
+        :type digest: str
+        :param digest: digest of the record (see `record_digest()`)
+        :type root_tag: str
+        :param root_tag: tag of the root element of the record in Clark notation, identifying the standard
+        :type fields: list[str]
+        :param fields: optional fields decoded from the record
+        :return: cache key
+        """
+        _fields = "*" if fields is None else "\0".join(sorted(fields))
+        return sha256(f"{digest}\0{root_tag}\0{_fields}".encode()).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """
+        Get a copy of the configuration cached for a key, marking the entry as recently used, if cached.
+
+        :type key: str
+        :param key: cache key
+        :return: record configuration, or None if not cached
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return pickle.loads(value)  # noqa: S301 (only contains values pickled by this class)
+
+    def add(self, key: str, config: dict) -> None:
+        """
+        Cache a configuration for a key, removing the least recently used entries if needed.
+
+        Configurations larger than `max_bytes` are not cached.
+
+        :type key: str
+        :param key: cache key
+        :type config: dict
+        :param config: record configuration
+        """
+        value = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(value) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += len(value)
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def stats(self) -> DecodeCacheStats:
+        """Cache statistics, including the number of hits and misses since the cache was created or cleared."""
+        with self._lock:
+            return DecodeCacheStats(hits=self._hits, misses=self._misses, entries=len(self._entries), size=self._size)
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+
+
+def record_digest(record: bytes | bytearray | memoryview) -> str:
+    """
+    Digest of a record, as bytes, for use in decode cache keys.
+
+    :type record: bytes | bytearray | memoryview
+    :param record: encoded XML record
+    :return: digest
+    """
+    return sha256(record).hexdigest()
+
+
+def set_decode_cache(cache: DecodeCache | None) -> None:
+    """
+    Set, or unset, a decode cache to use for all record decoding in this process.
+
+    Where set, `make_config()` for ISO 19115 records returns cached configurations for records already decoded.
+
+    :type cache: DecodeCache | None
+    :param cache: decode cache, or None to stop using a cache
+    """
+    global _decode_cache
+    with _decode_cache_lock:
+        _decode_cache = cache
+
+
+def get_decode_cache() -> DecodeCache | None:
+    """Get the decode cache set for this process, if any (see `set_decode_cache()`)."""
+    return _decode_cache
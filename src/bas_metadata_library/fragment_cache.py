@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import wraps
+from hashlib import sha256
+from threading import RLock
+from typing import TYPE_CHECKING, Callable
+
+from lxml.etree import Element
+
+from bas_metadata_library.validation_cache import canonical_json
+
+if TYPE_CHECKING:
+    from bas_metadata_library import MetadataRecordElement
+
+_fragment_cache_lock = RLock()
+_fragment_cache: FragmentCache | None = None
+
+
+@dataclass(frozen=True)
+class FragmentCacheStats:
+    """Statistics for a fragment cache."""
+
+    hits: int
+    misses: int
+    entries: int
+
+
+class FragmentCache:
+    """
+    Optional in-memory cache of XML fragments encoded from parts of record configurations.
+
+    For avoiding encoding the same sub-trees repeatedly, where parts of record configurations are the same across many
+    records (e.g. a common organisation as a contact, a licence as a constraint, or a reference system). Fragments are
+    keyed by the kind of element class that encoded them and a hash of the (canonically encoded) part of the record
+    configuration they were encoded from (see `key()`).
+
+    Fragments are stored as copies, so that they can't be changed once cached, and each lookup returns new copies that
+    can be added to a record.
+
+    Where the cache holds more than `max_entries` entries, the least recently used entries are removed.
+
+    Caches are safe to use from multiple threads. To use a cache for all record encoding in a process, see
+    `set_fragment_cache()`.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialise.
+
+        :type max_entries: int
+        :param max_entries: maximum number of entries to keep
+        """
+        self.max_entries = max_entries
+        self._lock = RLock()
+        self._entries: OrderedDict[str, list[Element]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Number of entries in cache."""
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        """Whether a fragment is cached for a key (without marking the entry as recently used)."""
+        return key in self._entries
+
+    @staticmethod
+    def key(kind: str, config: dict) -> str:
+        """
+        Generate a cache key for encoding part of a record configuration.
+
+        :type kind: str
+        :param kind: kind of element encoded (e.g. the qualified name of an element class)
+        :type config: dict
+        :param config: part of a record configuration the fragment is encoded from
+        :return: cache key
+        """
+        digest = sha256(kind.encode())
+        digest.update(b"\0")
+        digest.update(canonical_json(config))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> list[Element] | None:
+        """
+        Get copies of the elements cached for a key, marking the entry as recently used, if cached.
+
+        :type key: str
+        :param key: cache key
+        :return: elements in the fragment, or None if not cached
+        """
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return [deepcopy(element) for element in fragment]
+
+    def add(self, key: str, fragment: list[Element]) -> None:
+        """
+        Cache copies of the elements in a fragment for a key, removing the least recently used entries if needed.
+
+        :type key: str
+        :param key: cache key
+        :type fragment: list[Element]
+        :param fragment: elements in the fragment
+        """
+        fragment = [deepcopy(element) for element in fragment]
+        with self._lock:
+            self._entries[key] = fragment
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> FragmentCacheStats:
+        """Cache statistics, including the number of hits and misses since the cache was created or cleared."""
+        with self._lock:
+            return FragmentCacheStats(hits=self._hits, misses=self._misses, entries=len(self._entries))
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def cached_fragment(make_element: Callable[[MetadataRecordElement], None]) -> Callable[[MetadataRecordElement], None]:
+    """
+    Reuse elements added by an element class `make_element()` method from the fragment cache, if set.
+
+    For element classes whose elements depend only on their `element_attributes`, and which only add elements to the end
+    of their `parent_element`. Where a fragment cache is set (see `set_fragment_cache()`), elements are copied from the
+    cache where available, otherwise elements are made as normal and then added to the cache.
+    """
+    kind = f"{make_element.__module__}.{make_element.__qualname__}"
+
+    @wraps(make_element)
+    def _make_element(self: MetadataRecordElement) -> None:
+        cache = get_fragment_cache()
+        if cache is None:
+            make_element(self)
+            return
+
+        key = cache.key(kind=kind, config=self.element_attributes)
+        fragment = cache.get(key)
+        if fragment is not None:
+            self.parent_element.extend(fragment)
+            return
+
+        offset = len(self.parent_element)
+        make_element(self)
+        cache.add(key, self.parent_element[offset:])
+
+    return _make_element
+
+
+def set_fragment_cache(cache: FragmentCache | None) -> None:
+    """
+    Set, or unset, a fragment cache to use for all record encoding in this process.
+
+    Where set, element classes using `cached_fragment()` for ISO 19115 records (contacts, legal constraints, metadata
+    standards and reference systems) reuse cached elements for parts of record configurations already encoded.
+
+    :type cache: FragmentCache | None
+    :param cache: fragment cache, or None to stop using a cache
+    """
+    global _fragment_cache
+    with _fragment_cache_lock:
+        _fragment_cache = cache
+
+
+def get_fragment_cache() -> FragmentCache | None:
+    """Get the fragment cache set for this process, if any (see `set_fragment_cache()`)."""
+    return _fragment_cache
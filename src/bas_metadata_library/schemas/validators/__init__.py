@@ -0,0 +1,10 @@
+# Generated by the `generate-validators` task - do not edit.
+
+MODULES = {
+    'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/iso-19115-0-v4.json': 'iso_19115_0_v4',
+    'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/iso-19115-2-v4.json': 'iso_19115_2_v4',
+    'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/magic-administration-content-v1.json': 'magic_administration_content_v1',
+    'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/magic-administration-encoding-v1.json': 'magic_administration_encoding_v1',
+    'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/magic-discovery-v1.json': 'magic_discovery_v1',
+    'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/magic-discovery-v2.json': 'magic_discovery_v2',
+}
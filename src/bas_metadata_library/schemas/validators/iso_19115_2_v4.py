@@ -0,0 +1,2761 @@
+# Generated from 'iso_19115_2_v4.json' by the `generate-validators` task - do not edit.
+import re
+
+from bas_metadata_library.codegen import JSON_PASSTHROUGH_TYPES, is_json_integer, is_json_number, json_equal
+
+SCHEMA_ID = 'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/iso-19115-2-v4.json'
+SCHEMA_DIGEST = 'af33455f176861ce4b02850b684bc4f0692f7a3cd248447a6d0cbf8da2faec40'
+
+_C0 = ('aggregate', 'application', 'attribute', 'attributeType', 'collection', 'collectionHardware', 'collectionSession', 'dataset', 'dimensionGroup', 'document', 'feature', 'featureType', 'fieldSession', 'initiative', 'metadata', 'model', 'nonGeographicDataset', 'product', 'propertyType', 'repository', 'sample', 'series', 'service', 'software', 'tile', 'mapProduct', 'paperMapProduct', 'webMapProduct')
+_C1 = ('utf8',)
+_C2 = frozenset(['href', 'name', 'title'])
+_C3 = frozenset(['administrative_area', 'city', 'country', 'delivery_point', 'postal_code'])
+_C4 = ('download', 'information', 'offlineAccess', 'order', 'search')
+_C5 = frozenset(['description', 'function', 'href', 'protocol', 'title'])
+_C6 = ('author', 'custodian', 'distributor', 'originator', 'owner', 'pointOfContact', 'principalInvestigator', 'processor', 'publisher', 'resourceProvider', 'sponsor', 'user', 'coAuthor', 'collaborator', 'contributor', 'editor', 'funder', 'mediator', 'rightsHolder', 'stakeholder')
+_C7 = frozenset(['address', 'email', 'individual', 'online_resource', 'organisation', 'phone', 'position', 'role'])
+_C8 = ('continual', 'daily', 'weekly', 'fortnightly', 'monthly', 'quarterly', 'biannually', 'annually', 'asNeeded', 'irregular', 'notPlanned', 'unknown')
+_C9 = ('completed', 'historicalArchive', 'obsolete', 'onGoing', 'planned', 'required', 'underDevelopment')
+_C10 = frozenset(['maintenance_frequency', 'progress'])
+_C11 = ('access', 'usage')
+_C12 = ('confidential', 'copyright', 'inConfidence', 'intellectualPropertyRights', 'licenceDistributor', 'licenceEndUser', 'licenceUnrestricted', 'license', 'otherRestrictions', 'patent', 'patentPending', 'private', 'restricted', 'SBU', 'statutory', 'trademark', 'unrestricted')
+_C13 = frozenset(['href', 'permissions', 'restriction_code', 'statement', 'type'])
+_C14 = frozenset(['name', 'version'])
+_C15 = frozenset(['character_set', 'constraints', 'contacts', 'date_stamp', 'language', 'maintenance', 'metadata_standard'])
+_C16 = frozenset(['href', 'value'])
+_C17 = frozenset(['value'])
+_C18 = re.compile('^\\d{4}(-((0[1-9]|1[0-2])(-([0-2][0-9]|3[01]))?)?)?$')
+_C19 = re.compile('.*')
+_C20 = ('creation', 'publication', 'revision', 'adopted', 'deprecated', 'distribution', 'expiry', 'inForce', 'lastRevision', 'lastUpdate', 'nextUpdate', 'released', 'superseded', 'unavailable', 'validityBegins', 'validityExpires')
+_C21 = frozenset(['contact', 'dates', 'title'])
+_C22 = frozenset(['authority', 'code', 'version'])
+_C23 = frozenset(['edition', 'name', 'page'])
+_C24 = frozenset(['href', 'identifier', 'namespace'])
+_C25 = ('image/jpeg', 'image/png')
+_C26 = frozenset(['description', 'href', 'identifier', 'mime_type'])
+_C27 = frozenset(['amendment_number', 'file_decompression_technique', 'format', 'href', 'specification', 'version'])
+_C28 = frozenset(['href', 'term'])
+_C29 = ('dataCentre', 'discipline', 'featureType', 'instrument', 'place', 'platform', 'process', 'product', 'project', 'service', 'stratum', 'subTopicCategory', 'taxon', 'temporal', 'theme')
+_C30 = frozenset(['contact', 'dates', 'edition', 'title'])
+_C31 = frozenset(['terms', 'thesaurus', 'type'])
+_C32 = ('collectiveTitle', 'crossReference', 'dependency', 'isComposedOf', 'largerWorkCitation', 'partOfSeamlessDatabase', 'revisionOf', 'series', 'stereoMate', 'physicalReverseOf')
+_C33 = ('campaign', 'collection', 'exercise', 'experiment', 'investigation', 'mission', 'operation', 'platform', 'process', 'program', 'project', 'sensor', 'study', 'task', 'trial', 'dataDictionary', 'sciencePaper', 'userGuide', 'paperMap')
+_C34 = frozenset(['association_type', 'identifier', 'initiative_type'])
+_C35 = ('vector', 'grid', 'textTable', 'tin', 'steroModel', 'video')
+_C36 = ('farming', 'biota', 'boundaries', 'climatologyMeteorologyAtmosphere', 'economy', 'elevation', 'environment', 'geoscientificInformation', 'health', 'imageryBaseMapsEarthCover', 'intelligenceMilitary', 'inlandWaters', 'location', 'oceans', 'planningCadastre', 'society', 'structure', 'transportation', 'utilitiesCommunication', 'extraTerrestrial', 'disaster')
+_C37 = frozenset(['east_longitude', 'north_latitude', 'south_latitude', 'west_longitude'])
+_C38 = frozenset(['bounding_box'])
+_C39 = frozenset(['identifier'])
+_C40 = frozenset(['href'])
+_C41 = frozenset(['code', 'domain_of_validity', 'identifier', 'maximum', 'minimum', 'name', 'remarks', 'scope', 'vertical_cs', 'vertical_datum'])
+_C42 = frozenset(['end', 'start'])
+_C43 = frozenset(['period'])
+_C44 = frozenset(['geographic', 'identifier', 'temporal', 'vertical'])
+_C45 = frozenset(['contact', 'dates', 'description', 'edition', 'identifiers', 'source_steps', 'title'])
+_C46 = frozenset(['date', 'description', 'processors', 'rationale', 'sources'])
+_C47 = frozenset(['process_steps', 'sources', 'statement'])
+_C48 = frozenset(['explanation', 'result', 'specification'])
+_C49 = frozenset(['abstract', 'aggregations', 'character_set', 'constraints', 'contacts', 'credit', 'dates', 'domain_consistency', 'edition', 'extents', 'graphic_overviews', 'identifiers', 'keywords', 'language', 'lineage', 'maintenance', 'other_citation_details', 'purpose', 'resource_formats', 'series', 'spatial_representation_type', 'spatial_resolution', 'status', 'supplemental_information', 'title', 'topics'])
+_C50 = ('distributor',)
+_C51 = frozenset(['magnitude', 'unit'])
+_C52 = frozenset(['online_resource', 'size'])
+_C53 = frozenset(['distributor', 'format', 'transfer_option'])
+_C54 = frozenset(['$schema', 'distribution', 'file_identifier', 'hierarchy_level', 'identification', 'metadata', 'reference_system_info'])
+
+
+def _v1(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v2(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v3(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C0):
+        return False
+    return True
+
+
+def _v5(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if len(i) < 1:
+        return False
+    return True
+
+
+def _v6(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C1):
+        return False
+    return True
+
+
+def _v10(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v11(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v12(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v9(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'name' not in i:
+        return False
+    if 'name' in i:
+        v = i['name']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('name', v)
+        if not _v10(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v11(v, e, f):
+            return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v12(v, e, f):
+            return False
+    for k in i:
+        if k not in _C2:
+            return False
+    return True
+
+
+def _v13(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v14(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'email'):
+        return False
+    return True
+
+
+def _v15(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v17(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v18(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v19(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v20(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v21(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v16(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'delivery_point' in i:
+        v = i['delivery_point']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('delivery_point', v)
+        if not _v17(v, e, f):
+            return False
+    if 'city' in i:
+        v = i['city']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('city', v)
+        if not _v18(v, e, f):
+            return False
+    if 'administrative_area' in i:
+        v = i['administrative_area']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('administrative_area', v)
+        if not _v19(v, e, f):
+            return False
+    if 'postal_code' in i:
+        v = i['postal_code']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('postal_code', v)
+        if not _v20(v, e, f):
+            return False
+    if 'country' in i:
+        v = i['country']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('country', v)
+        if not _v21(v, e, f):
+            return False
+    for k in i:
+        if k not in _C3:
+            return False
+    return True
+
+
+def _v23(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v24(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v25(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v26(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v27(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C4):
+        return False
+    return True
+
+
+def _v22(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'href' not in i:
+        return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v23(v, e, f):
+            return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v24(v, e, f):
+            return False
+    if 'description' in i:
+        v = i['description']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('description', v)
+        if not _v25(v, e, f):
+            return False
+    if 'protocol' in i:
+        v = i['protocol']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('protocol', v)
+        if not _v26(v, e, f):
+            return False
+    if 'function' in i:
+        v = i['function']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('function', v)
+        if not _v27(v, e, f):
+            return False
+    for k in i:
+        if k not in _C5:
+            return False
+    return True
+
+
+def _v29(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C6):
+        return False
+    return True
+
+
+def _v28(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v29(v, e, f):
+            return False
+    return True
+
+
+def _v30(i, e, f):
+    if isinstance(i, dict):
+        if 'role' not in i:
+            return False
+    return True
+
+
+def _v32(i, e, f):
+    if isinstance(i, dict):
+        if 'individual' not in i:
+            return False
+    return True
+
+
+def _v33(i, e, f):
+    if isinstance(i, dict):
+        if 'organisation' not in i:
+            return False
+    return True
+
+
+def _v31(i, e, f):
+    if not any(_(i, e, f) for _ in (_v32, _v33,)):
+        return False
+    return True
+
+
+def _v8(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'individual' in i:
+        v = i['individual']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('individual', v)
+        if not _v9(v, e, f):
+            return False
+    if 'organisation' in i:
+        v = i['organisation']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('organisation', v)
+        if not _v9(v, e, f):
+            return False
+    if 'position' in i:
+        v = i['position']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('position', v)
+        if not _v13(v, e, f):
+            return False
+    if 'email' in i:
+        v = i['email']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('email', v)
+        if not _v14(v, e, f):
+            return False
+    if 'phone' in i:
+        v = i['phone']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('phone', v)
+        if not _v15(v, e, f):
+            return False
+    if 'address' in i:
+        v = i['address']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('address', v)
+        if not _v16(v, e, f):
+            return False
+    if 'online_resource' in i:
+        v = i['online_resource']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('online_resource', v)
+        if not _v22(v, e, f):
+            return False
+    if 'role' in i:
+        v = i['role']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('role', v)
+        if not _v28(v, e, f):
+            return False
+    for k in i:
+        if k not in _C7:
+            return False
+    if not _v30(i, e, f):
+        return False
+    if not _v31(i, e, f):
+        return False
+    return True
+
+
+def _v7(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if len(i) < 1:
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v8(v, e, f):
+            return False
+    return True
+
+
+def _v34(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'date'):
+        return False
+    return True
+
+
+def _v36(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C8):
+        return False
+    return True
+
+
+def _v37(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C9):
+        return False
+    return True
+
+
+def _v35(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'maintenance_frequency' in i:
+        v = i['maintenance_frequency']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('maintenance_frequency', v)
+        if not _v36(v, e, f):
+            return False
+    if 'progress' in i:
+        v = i['progress']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('progress', v)
+        if not _v37(v, e, f):
+            return False
+    for k in i:
+        if k not in _C10:
+            return False
+    return True
+
+
+def _v41(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C11):
+        return False
+    return True
+
+
+def _v42(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C12):
+        return False
+    return True
+
+
+def _v43(i, e, f):
+    return False
+
+
+def _v40(i, e, f):
+    if isinstance(i, dict):
+        if 'type' not in i:
+            return False
+        if 'restriction_code' not in i:
+            return False
+        if 'type' in i:
+            v = i['type']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('type', v)
+            if not _v41(v, e, f):
+                return False
+        if 'restriction_code' in i:
+            v = i['restriction_code']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('restriction_code', v)
+            if not _v42(v, e, f):
+                return False
+        if 'statement' in i:
+            v = i['statement']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('statement', v)
+            if not _v43(v, e, f):
+                return False
+        if 'href' in i:
+            v = i['href']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('href', v)
+            if not _v43(v, e, f):
+                return False
+        if 'permissions' in i:
+            v = i['permissions']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('permissions', v)
+            if not _v43(v, e, f):
+                return False
+        for k in i:
+            if k not in _C13:
+                return False
+    return True
+
+
+def _v45(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v46(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v44(i, e, f):
+    if isinstance(i, dict):
+        if 'type' not in i:
+            return False
+        if 'restriction_code' not in i:
+            return False
+        if 'statement' not in i:
+            return False
+        if 'type' in i:
+            v = i['type']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('type', v)
+            if not _v41(v, e, f):
+                return False
+        if 'restriction_code' in i:
+            v = i['restriction_code']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('restriction_code', v)
+            if not _v42(v, e, f):
+                return False
+        if 'statement' in i:
+            v = i['statement']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('statement', v)
+            if not _v45(v, e, f):
+                return False
+        if 'href' in i:
+            v = i['href']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('href', v)
+            if not _v46(v, e, f):
+                return False
+        if 'permissions' in i:
+            v = i['permissions']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('permissions', v)
+            if not _v43(v, e, f):
+                return False
+        for k in i:
+            if k not in _C13:
+                return False
+    return True
+
+
+def _v47(i, e, f):
+    if isinstance(i, dict):
+        if 'type' not in i:
+            return False
+        if 'restriction_code' not in i:
+            return False
+        if 'href' not in i:
+            return False
+        if 'type' in i:
+            v = i['type']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('type', v)
+            if not _v41(v, e, f):
+                return False
+        if 'restriction_code' in i:
+            v = i['restriction_code']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('restriction_code', v)
+            if not _v42(v, e, f):
+                return False
+        if 'statement' in i:
+            v = i['statement']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('statement', v)
+            if not _v43(v, e, f):
+                return False
+        if 'href' in i:
+            v = i['href']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('href', v)
+            if not _v46(v, e, f):
+                return False
+        if 'permissions' in i:
+            v = i['permissions']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('permissions', v)
+            if not _v43(v, e, f):
+                return False
+        for k in i:
+            if k not in _C13:
+                return False
+    return True
+
+
+def _v50(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v52(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    return True
+
+
+def _v51(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v52(v, e, f):
+            return False
+    return True
+
+
+def _v49(i, e, f):
+    if sum(1 for _ in (_v50, _v51,) if _(i, e, f)) != 1:
+        return False
+    return True
+
+
+def _v48(i, e, f):
+    if isinstance(i, dict):
+        if 'type' not in i:
+            return False
+        if 'restriction_code' not in i:
+            return False
+        if 'permissions' not in i:
+            return False
+        if 'type' in i:
+            v = i['type']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('type', v)
+            if not _v41(v, e, f):
+                return False
+        if 'restriction_code' in i:
+            v = i['restriction_code']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('restriction_code', v)
+            if not _v42(v, e, f):
+                return False
+        if 'statement' in i:
+            v = i['statement']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('statement', v)
+            if not _v43(v, e, f):
+                return False
+        if 'href' in i:
+            v = i['href']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('href', v)
+            if not _v43(v, e, f):
+                return False
+        if 'permissions' in i:
+            v = i['permissions']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('permissions', v)
+            if not _v49(v, e, f):
+                return False
+        for k in i:
+            if k not in _C13:
+                return False
+    return True
+
+
+def _v39(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if not any(_(i, e, f) for _ in (_v40, _v44, _v47, _v48,)):
+        return False
+    return True
+
+
+def _v38(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v39(v, e, f):
+            return False
+    return True
+
+
+def _v54(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v55(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v53(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'name' in i:
+        v = i['name']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('name', v)
+        if not _v54(v, e, f):
+            return False
+    if 'version' in i:
+        v = i['version']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('version', v)
+        if not _v55(v, e, f):
+            return False
+    for k in i:
+        if k not in _C14:
+            return False
+    return True
+
+
+def _v4(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'contacts' not in i:
+        return False
+    if 'date_stamp' not in i:
+        return False
+    if 'language' in i:
+        v = i['language']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('language', v)
+        if not _v5(v, e, f):
+            return False
+    if 'character_set' in i:
+        v = i['character_set']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('character_set', v)
+        if not _v6(v, e, f):
+            return False
+    if 'contacts' in i:
+        v = i['contacts']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('contacts', v)
+        if not _v7(v, e, f):
+            return False
+    if 'date_stamp' in i:
+        v = i['date_stamp']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('date_stamp', v)
+        if not _v34(v, e, f):
+            return False
+    if 'maintenance' in i:
+        v = i['maintenance']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('maintenance', v)
+        if not _v35(v, e, f):
+            return False
+    if 'constraints' in i:
+        v = i['constraints']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('constraints', v)
+        if not _v38(v, e, f):
+            return False
+    if 'metadata_standard' in i:
+        v = i['metadata_standard']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('metadata_standard', v)
+        if not _v53(v, e, f):
+            return False
+    for k in i:
+        if k not in _C15:
+            return False
+    return True
+
+
+def _v58(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v59(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v57(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'value' not in i:
+        return False
+    if 'value' in i:
+        v = i['value']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('value', v)
+        if not _v58(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v59(v, e, f):
+            return False
+    for k in i:
+        if k not in _C16:
+            return False
+    return True
+
+
+def _v60(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v63(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if len(i) < 1:
+        return False
+    return True
+
+
+def _v62(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'value' not in i:
+        return False
+    if 'value' in i:
+        v = i['value']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('value', v)
+        if not _v63(v, e, f):
+            return False
+    for k in i:
+        if k not in _C17:
+            return False
+    return True
+
+
+def _v66(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not _C18.search(i):
+        return False
+    return True
+
+
+def _v67(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'date-time'):
+        return False
+    return True
+
+
+def _v65(i, e, f):
+    if isinstance(i, str):
+        if len(i) < 4:
+            return False
+    if not any(_(i, e, f) for _ in (_v66, _v67,)):
+        return False
+    return True
+
+
+def _v68(i, e, f):
+    if not any(json_equal(i, _) for _ in _C20):
+        return False
+    return True
+
+
+def _v64(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    for k, v in i.items():
+        if _C19.search(k):
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e(k, v)
+            if not _v65(v, e, f):
+                return False
+    for k in i:
+        if not _C19.search(k):
+            return False
+    for k in i:
+        if not _v68(k, e, f):
+            return False
+    return True
+
+
+def _v61(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v62(v, e, f):
+            return False
+    if 'dates' in i:
+        v = i['dates']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('dates', v)
+        if not _v64(v, e, f):
+            return False
+    if 'contact' in i:
+        v = i['contact']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('contact', v)
+        if not _v8(v, e, f):
+            return False
+    for k in i:
+        if k not in _C21:
+            return False
+    return True
+
+
+def _v56(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'code' not in i:
+        return False
+    if 'code' in i:
+        v = i['code']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('code', v)
+        if not _v57(v, e, f):
+            return False
+    if 'version' in i:
+        v = i['version']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('version', v)
+        if not _v60(v, e, f):
+            return False
+    if 'authority' in i:
+        v = i['authority']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('authority', v)
+        if not _v61(v, e, f):
+            return False
+    for k in i:
+        if k not in _C22:
+            return False
+    return True
+
+
+def _v70(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if len(i) < 1:
+        return False
+    return True
+
+
+def _v71(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v72(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v73(i, e, f):
+    if not _v37(i, e, f):
+        return False
+    return True
+
+
+def _v74(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v76(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v77(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v75(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'name' in i:
+        v = i['name']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('name', v)
+        if not _v76(v, e, f):
+            return False
+    if 'page' in i:
+        v = i['page']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('page', v)
+        if not _v77(v, e, f):
+            return False
+    if 'edition' in i:
+        v = i['edition']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('edition', v)
+        if not _v74(v, e, f):
+            return False
+    for k in i:
+        if k not in _C23:
+            return False
+    return True
+
+
+def _v78(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v81(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v82(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v83(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v80(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'identifier' not in i:
+        return False
+    if 'identifier' in i:
+        v = i['identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identifier', v)
+        if not _v81(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v82(v, e, f):
+            return False
+    if 'namespace' in i:
+        v = i['namespace']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('namespace', v)
+        if not _v83(v, e, f):
+            return False
+    for k in i:
+        if k not in _C24:
+            return False
+    return True
+
+
+def _v79(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v80(v, e, f):
+            return False
+    return True
+
+
+def _v86(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v87(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v88(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v89(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C25):
+        return False
+    return True
+
+
+def _v85(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'identifier' not in i:
+        return False
+    if 'href' not in i:
+        return False
+    if 'mime_type' not in i:
+        return False
+    if 'identifier' in i:
+        v = i['identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identifier', v)
+        if not _v86(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v87(v, e, f):
+            return False
+    if 'description' in i:
+        v = i['description']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('description', v)
+        if not _v88(v, e, f):
+            return False
+    if 'mime_type' in i:
+        v = i['mime_type']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('mime_type', v)
+        if not _v89(v, e, f):
+            return False
+    for k in i:
+        if k not in _C26:
+            return False
+    return True
+
+
+def _v84(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v85(v, e, f):
+            return False
+    return True
+
+
+def _v92(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v93(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v94(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v95(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v96(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v97(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v91(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'format' not in i:
+        return False
+    if 'format' in i:
+        v = i['format']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('format', v)
+        if not _v92(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v93(v, e, f):
+            return False
+    if 'version' in i:
+        v = i['version']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('version', v)
+        if not _v94(v, e, f):
+            return False
+    if 'amendment_number' in i:
+        v = i['amendment_number']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('amendment_number', v)
+        if not _v95(v, e, f):
+            return False
+    if 'specification' in i:
+        v = i['specification']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('specification', v)
+        if not _v96(v, e, f):
+            return False
+    if 'file_decompression_technique' in i:
+        v = i['file_decompression_technique']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('file_decompression_technique', v)
+        if not _v97(v, e, f):
+            return False
+    for k in i:
+        if k not in _C27:
+            return False
+    return True
+
+
+def _v90(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v91(v, e, f):
+            return False
+    return True
+
+
+def _v102(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v103(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v101(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'term' not in i:
+        return False
+    if 'term' in i:
+        v = i['term']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('term', v)
+        if not _v102(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v103(v, e, f):
+            return False
+    for k in i:
+        if k not in _C28:
+            return False
+    return True
+
+
+def _v100(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v101(v, e, f):
+            return False
+    return True
+
+
+def _v104(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C29):
+        return False
+    return True
+
+
+def _v108(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v107(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v108(v, e, f):
+            return False
+    return True
+
+
+def _v106(i, e, f):
+    if not any(_(i, e, f) for _ in (_v62, _v107,)):
+        return False
+    return True
+
+
+def _v105(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'title' not in i:
+        return False
+    if 'dates' not in i:
+        return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v106(v, e, f):
+            return False
+    if 'dates' in i:
+        v = i['dates']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('dates', v)
+        if not _v64(v, e, f):
+            return False
+    if 'edition' in i:
+        v = i['edition']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('edition', v)
+        if not _v74(v, e, f):
+            return False
+    if 'contact' in i:
+        v = i['contact']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('contact', v)
+        if not _v8(v, e, f):
+            return False
+    for k in i:
+        if k not in _C30:
+            return False
+    return True
+
+
+def _v99(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'terms' not in i:
+        return False
+    if 'terms' in i:
+        v = i['terms']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('terms', v)
+        if not _v100(v, e, f):
+            return False
+    if 'type' in i:
+        v = i['type']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('type', v)
+        if not _v104(v, e, f):
+            return False
+    if 'thesaurus' in i:
+        v = i['thesaurus']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('thesaurus', v)
+        if not _v105(v, e, f):
+            return False
+    for k in i:
+        if k not in _C31:
+            return False
+    return True
+
+
+def _v98(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v99(v, e, f):
+            return False
+    return True
+
+
+def _v111(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C32):
+        return False
+    return True
+
+
+def _v112(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C33):
+        return False
+    return True
+
+
+def _v110(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'association_type' not in i:
+        return False
+    if 'identifier' not in i:
+        return False
+    if 'association_type' in i:
+        v = i['association_type']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('association_type', v)
+        if not _v111(v, e, f):
+            return False
+    if 'initiative_type' in i:
+        v = i['initiative_type']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('initiative_type', v)
+        if not _v112(v, e, f):
+            return False
+    if 'identifier' in i:
+        v = i['identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identifier', v)
+        if not _v80(v, e, f):
+            return False
+    for k in i:
+        if k not in _C34:
+            return False
+    return True
+
+
+def _v109(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if len(i) < 1:
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v110(v, e, f):
+            return False
+    return True
+
+
+def _v113(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v114(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C35):
+        return False
+    return True
+
+
+def _v115(i, e, f):
+    if not (is_json_number(i) or i is None):
+        return False
+    return True
+
+
+def _v117(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C36):
+        return False
+    return True
+
+
+def _v116(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v117(v, e, f):
+            return False
+    return True
+
+
+def _v120(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v124(i, e, f):
+    if not (is_json_number(i)):
+        return False
+    if i < -180:
+        return False
+    if i > 180:
+        return False
+    return True
+
+
+def _v125(i, e, f):
+    if not (is_json_number(i)):
+        return False
+    if i < -180:
+        return False
+    if i > 180:
+        return False
+    return True
+
+
+def _v126(i, e, f):
+    if not (is_json_number(i)):
+        return False
+    if i < -90:
+        return False
+    if i > 90:
+        return False
+    return True
+
+
+def _v127(i, e, f):
+    if not (is_json_number(i)):
+        return False
+    if i < -90:
+        return False
+    if i > 90:
+        return False
+    return True
+
+
+def _v123(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'west_longitude' not in i:
+        return False
+    if 'east_longitude' not in i:
+        return False
+    if 'south_latitude' not in i:
+        return False
+    if 'north_latitude' not in i:
+        return False
+    if 'west_longitude' in i:
+        v = i['west_longitude']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('west_longitude', v)
+        if not _v124(v, e, f):
+            return False
+    if 'east_longitude' in i:
+        v = i['east_longitude']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('east_longitude', v)
+        if not _v125(v, e, f):
+            return False
+    if 'south_latitude' in i:
+        v = i['south_latitude']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('south_latitude', v)
+        if not _v126(v, e, f):
+            return False
+    if 'north_latitude' in i:
+        v = i['north_latitude']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('north_latitude', v)
+        if not _v127(v, e, f):
+            return False
+    for k in i:
+        if k not in _C37:
+            return False
+    return True
+
+
+def _v122(i, e, f):
+    if isinstance(i, dict):
+        if 'bounding_box' not in i:
+            return False
+        if 'bounding_box' in i:
+            v = i['bounding_box']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('bounding_box', v)
+            if not _v123(v, e, f):
+                return False
+        for k in i:
+            if k not in _C38:
+                return False
+    return True
+
+
+def _v129(i, e, f):
+    if not _v80(i, e, f):
+        return False
+    return True
+
+
+def _v128(i, e, f):
+    if isinstance(i, dict):
+        if 'identifier' not in i:
+            return False
+        if 'identifier' in i:
+            v = i['identifier']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('identifier', v)
+            if not _v129(v, e, f):
+                return False
+        for k in i:
+            if k not in _C39:
+                return False
+    return True
+
+
+def _v121(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if sum(1 for _ in (_v122, _v128,) if _(i, e, f)) != 1:
+        return False
+    return True
+
+
+def _v131(i, e, f):
+    if not (is_json_number(i)):
+        return False
+    return True
+
+
+def _v132(i, e, f):
+    if not (is_json_number(i)):
+        return False
+    return True
+
+
+def _v133(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v134(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v135(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v136(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v137(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v139(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v138(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v139(v, e, f):
+            return False
+    for k in i:
+        if k not in _C40:
+            return False
+    return True
+
+
+def _v141(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v140(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v141(v, e, f):
+            return False
+    for k in i:
+        if k not in _C40:
+            return False
+    return True
+
+
+def _v143(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v142(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v143(v, e, f):
+            return False
+    for k in i:
+        if k not in _C40:
+            return False
+    return True
+
+
+def _v130(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'minimum' in i:
+        v = i['minimum']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('minimum', v)
+        if not _v131(v, e, f):
+            return False
+    if 'maximum' in i:
+        v = i['maximum']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('maximum', v)
+        if not _v132(v, e, f):
+            return False
+    if 'identifier' in i:
+        v = i['identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identifier', v)
+        if not _v133(v, e, f):
+            return False
+    if 'code' in i:
+        v = i['code']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('code', v)
+        if not _v134(v, e, f):
+            return False
+    if 'name' in i:
+        v = i['name']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('name', v)
+        if not _v135(v, e, f):
+            return False
+    if 'remarks' in i:
+        v = i['remarks']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('remarks', v)
+        if not _v136(v, e, f):
+            return False
+    if 'scope' in i:
+        v = i['scope']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('scope', v)
+        if not _v137(v, e, f):
+            return False
+    if 'domain_of_validity' in i:
+        v = i['domain_of_validity']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('domain_of_validity', v)
+        if not _v138(v, e, f):
+            return False
+    if 'vertical_cs' in i:
+        v = i['vertical_cs']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('vertical_cs', v)
+        if not _v140(v, e, f):
+            return False
+    if 'vertical_datum' in i:
+        v = i['vertical_datum']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('vertical_datum', v)
+        if not _v142(v, e, f):
+            return False
+    for k in i:
+        if k not in _C41:
+            return False
+    return True
+
+
+def _v145(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'start' in i:
+        v = i['start']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('start', v)
+        if not _v65(v, e, f):
+            return False
+    if 'end' in i:
+        v = i['end']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('end', v)
+        if not _v65(v, e, f):
+            return False
+    for k in i:
+        if k not in _C42:
+            return False
+    return True
+
+
+def _v144(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'period' in i:
+        v = i['period']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('period', v)
+        if not _v145(v, e, f):
+            return False
+    for k in i:
+        if k not in _C43:
+            return False
+    return True
+
+
+def _v119(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'identifier' not in i:
+        return False
+    if 'geographic' not in i:
+        return False
+    if 'identifier' in i:
+        v = i['identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identifier', v)
+        if not _v120(v, e, f):
+            return False
+    if 'geographic' in i:
+        v = i['geographic']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('geographic', v)
+        if not _v121(v, e, f):
+            return False
+    if 'vertical' in i:
+        v = i['vertical']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('vertical', v)
+        if not _v130(v, e, f):
+            return False
+    if 'temporal' in i:
+        v = i['temporal']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('temporal', v)
+        if not _v144(v, e, f):
+            return False
+    for k in i:
+        if k not in _C44:
+            return False
+    return True
+
+
+def _v118(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if len(i) < 1:
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v119(v, e, f):
+            return False
+    return True
+
+
+def _v147(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v150(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v151(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v152(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v8(v, e, f):
+            return False
+    return True
+
+
+def _v155(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v149(v, e, f):
+            return False
+    return True
+
+
+def _v154(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'title' not in i:
+        return False
+    if 'dates' not in i:
+        return False
+    if 'description' in i:
+        v = i['description']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('description', v)
+        if not _v150(v, e, f):
+            return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v62(v, e, f):
+            return False
+    if 'dates' in i:
+        v = i['dates']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('dates', v)
+        if not _v64(v, e, f):
+            return False
+    if 'edition' in i:
+        v = i['edition']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('edition', v)
+        if not _v74(v, e, f):
+            return False
+    if 'identifiers' in i:
+        v = i['identifiers']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identifiers', v)
+        if not _v79(v, e, f):
+            return False
+    if 'contact' in i:
+        v = i['contact']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('contact', v)
+        if not _v8(v, e, f):
+            return False
+    if 'source_steps' in i:
+        v = i['source_steps']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('source_steps', v)
+        if not _v155(v, e, f):
+            return False
+    for k in i:
+        if k not in _C45:
+            return False
+    return True
+
+
+def _v153(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v154(v, e, f):
+            return False
+    return True
+
+
+def _v149(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'description' not in i:
+        return False
+    if 'description' in i:
+        v = i['description']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('description', v)
+        if not _v150(v, e, f):
+            return False
+    if 'rationale' in i:
+        v = i['rationale']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('rationale', v)
+        if not _v151(v, e, f):
+            return False
+    if 'date' in i:
+        v = i['date']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('date', v)
+        if not _v65(v, e, f):
+            return False
+    if 'processors' in i:
+        v = i['processors']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('processors', v)
+        if not _v152(v, e, f):
+            return False
+    if 'sources' in i:
+        v = i['sources']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('sources', v)
+        if not _v153(v, e, f):
+            return False
+    for k in i:
+        if k not in _C46:
+            return False
+    return True
+
+
+def _v148(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v149(v, e, f):
+            return False
+    return True
+
+
+def _v156(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v154(v, e, f):
+            return False
+    return True
+
+
+def _v146(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'statement' in i:
+        v = i['statement']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('statement', v)
+        if not _v147(v, e, f):
+            return False
+    if 'process_steps' in i:
+        v = i['process_steps']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('process_steps', v)
+        if not _v148(v, e, f):
+            return False
+    if 'sources' in i:
+        v = i['sources']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('sources', v)
+        if not _v156(v, e, f):
+            return False
+    for k in i:
+        if k not in _C47:
+            return False
+    return True
+
+
+def _v161(i, e, f):
+    if isinstance(i, dict):
+        if 'href' in i:
+            v = i['href']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('href', v)
+            if not _v108(v, e, f):
+                return False
+    return True
+
+
+def _v160(i, e, f):
+    if not any(_(i, e, f) for _ in (_v62, _v161,)):
+        return False
+    return True
+
+
+def _v159(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'title' not in i:
+        return False
+    if 'dates' not in i:
+        return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v160(v, e, f):
+            return False
+    if 'dates' in i:
+        v = i['dates']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('dates', v)
+        if not _v64(v, e, f):
+            return False
+    if 'edition' in i:
+        v = i['edition']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('edition', v)
+        if not _v74(v, e, f):
+            return False
+    if 'contact' in i:
+        v = i['contact']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('contact', v)
+        if not _v8(v, e, f):
+            return False
+    for k in i:
+        if k not in _C30:
+            return False
+    return True
+
+
+def _v162(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v163(i, e, f):
+    if not (isinstance(i, bool)):
+        return False
+    return True
+
+
+def _v158(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'specification' in i:
+        v = i['specification']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('specification', v)
+        if not _v159(v, e, f):
+            return False
+    if 'explanation' in i:
+        v = i['explanation']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('explanation', v)
+        if not _v162(v, e, f):
+            return False
+    if 'result' in i:
+        v = i['result']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('result', v)
+        if not _v163(v, e, f):
+            return False
+    for k in i:
+        if k not in _C48:
+            return False
+    return True
+
+
+def _v157(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v158(v, e, f):
+            return False
+    return True
+
+
+def _v69(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'title' not in i:
+        return False
+    if 'dates' not in i:
+        return False
+    if 'abstract' not in i:
+        return False
+    if 'language' not in i:
+        return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v62(v, e, f):
+            return False
+    if 'abstract' in i:
+        v = i['abstract']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('abstract', v)
+        if not _v70(v, e, f):
+            return False
+    if 'purpose' in i:
+        v = i['purpose']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('purpose', v)
+        if not _v71(v, e, f):
+            return False
+    if 'credit' in i:
+        v = i['credit']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('credit', v)
+        if not _v72(v, e, f):
+            return False
+    if 'status' in i:
+        v = i['status']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('status', v)
+        if not _v73(v, e, f):
+            return False
+    if 'dates' in i:
+        v = i['dates']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('dates', v)
+        if not _v64(v, e, f):
+            return False
+    if 'edition' in i:
+        v = i['edition']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('edition', v)
+        if not _v74(v, e, f):
+            return False
+    if 'series' in i:
+        v = i['series']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('series', v)
+        if not _v75(v, e, f):
+            return False
+    if 'other_citation_details' in i:
+        v = i['other_citation_details']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('other_citation_details', v)
+        if not _v78(v, e, f):
+            return False
+    if 'identifiers' in i:
+        v = i['identifiers']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identifiers', v)
+        if not _v79(v, e, f):
+            return False
+    if 'contacts' in i:
+        v = i['contacts']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('contacts', v)
+        if not _v7(v, e, f):
+            return False
+    if 'maintenance' in i:
+        v = i['maintenance']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('maintenance', v)
+        if not _v35(v, e, f):
+            return False
+    if 'graphic_overviews' in i:
+        v = i['graphic_overviews']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('graphic_overviews', v)
+        if not _v84(v, e, f):
+            return False
+    if 'resource_formats' in i:
+        v = i['resource_formats']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('resource_formats', v)
+        if not _v90(v, e, f):
+            return False
+    if 'keywords' in i:
+        v = i['keywords']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('keywords', v)
+        if not _v98(v, e, f):
+            return False
+    if 'constraints' in i:
+        v = i['constraints']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('constraints', v)
+        if not _v38(v, e, f):
+            return False
+    if 'aggregations' in i:
+        v = i['aggregations']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('aggregations', v)
+        if not _v109(v, e, f):
+            return False
+    if 'supplemental_information' in i:
+        v = i['supplemental_information']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('supplemental_information', v)
+        if not _v113(v, e, f):
+            return False
+    if 'spatial_representation_type' in i:
+        v = i['spatial_representation_type']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('spatial_representation_type', v)
+        if not _v114(v, e, f):
+            return False
+    if 'spatial_resolution' in i:
+        v = i['spatial_resolution']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('spatial_resolution', v)
+        if not _v115(v, e, f):
+            return False
+    if 'character_set' in i:
+        v = i['character_set']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('character_set', v)
+        if not _v6(v, e, f):
+            return False
+    if 'language' in i:
+        v = i['language']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('language', v)
+        if not _v5(v, e, f):
+            return False
+    if 'topics' in i:
+        v = i['topics']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('topics', v)
+        if not _v116(v, e, f):
+            return False
+    if 'extents' in i:
+        v = i['extents']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('extents', v)
+        if not _v118(v, e, f):
+            return False
+    if 'lineage' in i:
+        v = i['lineage']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('lineage', v)
+        if not _v146(v, e, f):
+            return False
+    if 'domain_consistency' in i:
+        v = i['domain_consistency']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('domain_consistency', v)
+        if not _v157(v, e, f):
+            return False
+    for k in i:
+        if k not in _C49:
+            return False
+    return True
+
+
+def _v169(i, e, f):
+    if not any(json_equal(i, _) for _ in _C50):
+        return False
+    return True
+
+
+def _v168(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v169(v, e, f):
+            return False
+    return True
+
+
+def _v167(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'role' in i:
+        v = i['role']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('role', v)
+        if not _v168(v, e, f):
+            return False
+    return True
+
+
+def _v166(i, e, f):
+    if not _v8(i, e, f):
+        return False
+    if not _v167(i, e, f):
+        return False
+    return True
+
+
+def _v172(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v173(i, e, f):
+    if not (is_json_number(i)):
+        return False
+    return True
+
+
+def _v171(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'unit' not in i:
+        return False
+    if 'magnitude' not in i:
+        return False
+    if 'unit' in i:
+        v = i['unit']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('unit', v)
+        if not _v172(v, e, f):
+            return False
+    if 'magnitude' in i:
+        v = i['magnitude']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('magnitude', v)
+        if not _v173(v, e, f):
+            return False
+    for k in i:
+        if k not in _C51:
+            return False
+    return True
+
+
+def _v170(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'online_resource' not in i:
+        return False
+    if 'size' in i:
+        v = i['size']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('size', v)
+        if not _v171(v, e, f):
+            return False
+    if 'online_resource' in i:
+        v = i['online_resource']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('online_resource', v)
+        if not _v22(v, e, f):
+            return False
+    for k in i:
+        if k not in _C52:
+            return False
+    return True
+
+
+def _v165(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'distributor' not in i:
+        return False
+    if 'transfer_option' not in i:
+        return False
+    if 'distributor' in i:
+        v = i['distributor']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('distributor', v)
+        if not _v166(v, e, f):
+            return False
+    if 'format' in i:
+        v = i['format']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('format', v)
+        if not _v91(v, e, f):
+            return False
+    if 'transfer_option' in i:
+        v = i['transfer_option']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('transfer_option', v)
+        if not _v170(v, e, f):
+            return False
+    for k in i:
+        if k not in _C53:
+            return False
+    return True
+
+
+def _v164(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v165(v, e, f):
+            return False
+    return True
+
+
+def _v0(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if '$schema' not in i:
+        return False
+    if 'metadata' not in i:
+        return False
+    if 'identification' not in i:
+        return False
+    if '$schema' in i:
+        v = i['$schema']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('$schema', v)
+        if not _v1(v, e, f):
+            return False
+    if 'file_identifier' in i:
+        v = i['file_identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('file_identifier', v)
+        if not _v2(v, e, f):
+            return False
+    if 'hierarchy_level' in i:
+        v = i['hierarchy_level']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('hierarchy_level', v)
+        if not _v3(v, e, f):
+            return False
+    if 'metadata' in i:
+        v = i['metadata']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('metadata', v)
+        if not _v4(v, e, f):
+            return False
+    if 'reference_system_info' in i:
+        v = i['reference_system_info']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('reference_system_info', v)
+        if not _v56(v, e, f):
+            return False
+    if 'identification' in i:
+        v = i['identification']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identification', v)
+        if not _v69(v, e, f):
+            return False
+    if 'distribution' in i:
+        v = i['distribution']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('distribution', v)
+        if not _v164(v, e, f):
+            return False
+    for k in i:
+        if k not in _C54:
+            return False
+    return True
+
+
+def _v174(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'hierarchy_level' not in i:
+        return False
+    if 'metadata' not in i:
+        return False
+    if 'identification' not in i:
+        return False
+    if '$schema' in i:
+        v = i['$schema']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('$schema', v)
+        if not _v1(v, e, f):
+            return False
+    if 'file_identifier' in i:
+        v = i['file_identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('file_identifier', v)
+        if not _v2(v, e, f):
+            return False
+    if 'hierarchy_level' in i:
+        v = i['hierarchy_level']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('hierarchy_level', v)
+        if not _v3(v, e, f):
+            return False
+    if 'metadata' in i:
+        v = i['metadata']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('metadata', v)
+        if not _v4(v, e, f):
+            return False
+    if 'reference_system_info' in i:
+        v = i['reference_system_info']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('reference_system_info', v)
+        if not _v56(v, e, f):
+            return False
+    if 'identification' in i:
+        v = i['identification']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identification', v)
+        if not _v69(v, e, f):
+            return False
+    if 'distribution' in i:
+        v = i['distribution']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('distribution', v)
+        if not _v164(v, e, f):
+            return False
+    for k in i:
+        if k not in _C54:
+            return False
+    return True
+
+
+def validate(instance, encode_member=None, format_checker=None):
+    return _v0(instance, encode_member, format_checker)
+
+
+FRAGMENTS = {
+    '#/definitions/abstract': _v70,
+    '#/definitions/address': _v16,
+    '#/definitions/aggregations': _v109,
+    '#/definitions/aggregation': _v110,
+    '#/definitions/character_set': _v6,
+    '#/definitions/constraint': _v39,
+    '#/definitions/constraint_type': _v41,
+    '#/definitions/constraints': _v38,
+    '#/definitions/contact': _v8,
+    '#/definitions/contact_identity': _v9,
+    '#/definitions/contacts': _v7,
+    '#/definitions/credit': _v72,
+    '#/definitions/date': _v65,
+    '#/definitions/dates': _v64,
+    '#/definitions/date_stamp': _v34,
+    '#/definitions/description': _v150,
+    '#/definitions/distribution': _v164,
+    '#/definitions/distributor': _v166,
+    '#/definitions/distribution_option': _v165,
+    '#/definitions/domain_consistency_measure': _v158,
+    '#/definitions/domain_consistency': _v157,
+    '#/definitions/edition': _v74,
+    '#/definitions/extent': _v119,
+    '#/definitions/extents': _v118,
+    '#/definitions/file_identifier': _v2,
+    '#/definitions/format': _v91,
+    '#/definitions/graphic_overviews': _v84,
+    '#/definitions/geographic_extent': _v121,
+    '#/definitions/hierarchy_level': _v3,
+    '#/definitions/identification': _v69,
+    '#/definitions/identifier': _v80,
+    '#/definitions/identifiers': _v79,
+    '#/definitions/keywords': _v98,
+    '#/definitions/language': _v5,
+    '#/definitions/lineage': _v146,
+    '#/definitions/maintenance': _v35,
+    '#/definitions/metadata': _v4,
+    '#/definitions/metadata_standard': _v53,
+    '#/definitions/online_resource': _v22,
+    '#/definitions/other_citation_details': _v78,
+    '#/definitions/permission': _v52,
+    '#/definitions/permissions': _v49,
+    '#/definitions/process_step': _v149,
+    '#/definitions/purpose': _v71,
+    '#/definitions/progress': _v37,
+    '#/definitions/resource_formats': _v90,
+    '#/definitions/reference_system_info': _v56,
+    '#/definitions/resource': _v174,
+    '#/definitions/restriction_code': _v42,
+    '#/definitions/_schema': _v1,
+    '#/definitions/series': _v75,
+    '#/definitions/source': _v154,
+    '#/definitions/spatial_representation_type': _v114,
+    '#/definitions/spatial_resolution': _v115,
+    '#/definitions/specification': _v159,
+    '#/definitions/status': _v73,
+    '#/definitions/supplemental_information': _v113,
+    '#/definitions/temporal_extent': _v144,
+    '#/definitions/thesaurus': _v105,
+    '#/definitions/title': _v62,
+    '#/definitions/topics': _v116,
+    '#/definitions/transfer_option': _v170,
+    '#/definitions/vertical_extent': _v130,
+}
@@ -0,0 +1,197 @@
+# Generated from 'magic_administration_content_v1.json' by the `generate-validators` task - do not edit.
+import re
+
+from bas_metadata_library.codegen import JSON_PASSTHROUGH_TYPES, is_json_integer, is_json_number, json_equal
+
+SCHEMA_ID = 'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/magic-administration-content-v1.json'
+SCHEMA_DIGEST = '9436ecc66de0f1867db0c5895619f97465f69574cf0d64a3d307214e49a8cf3a'
+
+_C0 = 'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/magic-administration-content-v1.json'
+_C1 = re.compile('./-/issues/\\d+(?:[/?#].)?$')
+_C2 = frozenset(['comment', 'directory', 'expiry', 'group'])
+
+
+def _v1(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    if not json_equal(i, _C0):
+        return False
+    return True
+
+
+def _v2(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if len(i) < 1:
+        return False
+    return True
+
+
+def _v4(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if len(i) < 1:
+        return False
+    if not _C1.search(i):
+        return False
+    if f is not None and not f.conforms(i, 'uri-reference'):
+        return False
+    return True
+
+
+def _v3(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v4(v, e, f):
+            return False
+    return True
+
+
+def _v7(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if len(i) < 1:
+        return False
+    return True
+
+
+def _v8(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if len(i) < 1:
+        return False
+    return True
+
+
+def _v9(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if f is not None and not f.conforms(i, 'datetime'):
+        return False
+    return True
+
+
+def _v10(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v6(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'directory' not in i:
+        return False
+    if 'group' not in i:
+        return False
+    if 'expiry' not in i:
+        return False
+    if 'directory' in i:
+        v = i['directory']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('directory', v)
+        if not _v7(v, e, f):
+            return False
+    if 'group' in i:
+        v = i['group']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('group', v)
+        if not _v8(v, e, f):
+            return False
+    if 'expiry' in i:
+        v = i['expiry']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('expiry', v)
+        if not _v9(v, e, f):
+            return False
+    if 'comment' in i:
+        v = i['comment']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('comment', v)
+        if not _v10(v, e, f):
+            return False
+    for k in i:
+        if k not in _C2:
+            return False
+    return True
+
+
+def _v5(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v6(v, e, f):
+            return False
+    return True
+
+
+def _v11(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    for k, v in enumerate(i):
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e(k, v)
+        if not _v6(v, e, f):
+            return False
+    return True
+
+
+def _v0(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if '$schema' not in i:
+        return False
+    if 'id' not in i:
+        return False
+    if '$schema' in i:
+        v = i['$schema']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('$schema', v)
+        if not _v1(v, e, f):
+            return False
+    if 'id' in i:
+        v = i['id']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('id', v)
+        if not _v2(v, e, f):
+            return False
+    if 'gitlab_issues' in i:
+        v = i['gitlab_issues']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('gitlab_issues', v)
+        if not _v3(v, e, f):
+            return False
+    if 'metadata_permissions' in i:
+        v = i['metadata_permissions']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('metadata_permissions', v)
+        if not _v5(v, e, f):
+            return False
+    if 'resource_permissions' in i:
+        v = i['resource_permissions']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('resource_permissions', v)
+        if not _v11(v, e, f):
+            return False
+    return True
+
+
+def validate(instance, encode_member=None, format_checker=None):
+    return _v0(instance, encode_member, format_checker)
+
+
+FRAGMENTS = {
+    '#/$defs/access_permission': _v6,
+    '#/$defs/gitlab_issues': _v3,
+    '#/$defs/metadata_permissions': _v5,
+    '#/$defs/resource_identifier': _v2,
+    '#/$defs/resource_permissions': _v11,
+    '#/$defs/_schema': _v1,
+}
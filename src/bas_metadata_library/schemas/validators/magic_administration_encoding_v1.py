@@ -0,0 +1,573 @@
+# Generated from 'magic_administration_encoding_v1.json' by the `generate-validators` task - do not edit.
+import re
+
+from bas_metadata_library.codegen import JSON_PASSTHROUGH_TYPES, is_json_integer, is_json_number, json_equal
+
+SCHEMA_ID = 'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/magic-administration-encoding-v1.json'
+SCHEMA_DIGEST = '5a23dea9d8f287197fc15931deef5914d3c322c151d6fd5523847d9545c9f841'
+
+_C0 = 'British Antarctic Survey (BAS) Mapping and Geographic Information Centre (MAGIC) Administration Metadata Profile'
+_C1 = 'https://metadata-standards.data.bas.ac.uk/profiles/magic-administration/v1/'
+_C2 = '2025-10-22'
+_C3 = '1'
+_C4 = 'Mapping and Geographic Information Centre, British Antarctic Survey'
+_C5 = 'https://ror.org/01rhff309'
+_C6 = 'ror'
+_C7 = '+44 (0)1223 221400'
+_C8 = 'British Antarctic Survey, High Cross, Madingley Road'
+_C9 = 'Cambridge'
+_C10 = 'Cambridgeshire'
+_C11 = 'CB3 0ET'
+_C12 = 'United Kingdom'
+_C13 = 'magic@bas.ac.uk'
+_C14 = 'https://www.bas.ac.uk/teams/magic'
+_C15 = 'Mapping and Geographic Information Centre (MAGIC) - BAS public website'
+_C16 = 'General information about the BAS Mapping and Geographic Information Centre (MAGIC) from the British Antarctic Survey (BAS) public website.'
+_C17 = 'information'
+_C18 = 'publisher'
+_C19 = 'Resource within scope of the British Antarctic Survey (BAS) Mapping and Geographic Information Centre (MAGIC) Administration Metadata Profile.'
+_C20 = True
+
+
+def _v1(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v3(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v8(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C0):
+        return False
+    return True
+
+
+def _v9(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C1):
+        return False
+    return True
+
+
+def _v7(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'value' not in i:
+        return False
+    if 'href' not in i:
+        return False
+    if 'value' in i:
+        v = i['value']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('value', v)
+        if not _v8(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v9(v, e, f):
+            return False
+    return True
+
+
+def _v11(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C2):
+        return False
+    return True
+
+
+def _v10(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'publication' not in i:
+        return False
+    if 'publication' in i:
+        v = i['publication']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('publication', v)
+        if not _v11(v, e, f):
+            return False
+    return True
+
+
+def _v12(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C3):
+        return False
+    return True
+
+
+def _v16(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C4):
+        return False
+    return True
+
+
+def _v17(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C5):
+        return False
+    return True
+
+
+def _v18(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C6):
+        return False
+    return True
+
+
+def _v15(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'name' not in i:
+        return False
+    if 'href' not in i:
+        return False
+    if 'title' not in i:
+        return False
+    if 'name' in i:
+        v = i['name']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('name', v)
+        if not _v16(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v17(v, e, f):
+            return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v18(v, e, f):
+            return False
+    return True
+
+
+def _v19(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C7):
+        return False
+    return True
+
+
+def _v21(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C8):
+        return False
+    return True
+
+
+def _v22(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C9):
+        return False
+    return True
+
+
+def _v23(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C10):
+        return False
+    return True
+
+
+def _v24(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C11):
+        return False
+    return True
+
+
+def _v25(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C12):
+        return False
+    return True
+
+
+def _v20(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'delivery_point' not in i:
+        return False
+    if 'city' not in i:
+        return False
+    if 'administrative_area' not in i:
+        return False
+    if 'postal_code' not in i:
+        return False
+    if 'country' not in i:
+        return False
+    if 'delivery_point' in i:
+        v = i['delivery_point']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('delivery_point', v)
+        if not _v21(v, e, f):
+            return False
+    if 'city' in i:
+        v = i['city']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('city', v)
+        if not _v22(v, e, f):
+            return False
+    if 'administrative_area' in i:
+        v = i['administrative_area']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('administrative_area', v)
+        if not _v23(v, e, f):
+            return False
+    if 'postal_code' in i:
+        v = i['postal_code']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('postal_code', v)
+        if not _v24(v, e, f):
+            return False
+    if 'country' in i:
+        v = i['country']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('country', v)
+        if not _v25(v, e, f):
+            return False
+    return True
+
+
+def _v26(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C13):
+        return False
+    return True
+
+
+def _v28(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C14):
+        return False
+    return True
+
+
+def _v29(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C15):
+        return False
+    return True
+
+
+def _v30(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C16):
+        return False
+    return True
+
+
+def _v31(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C17):
+        return False
+    return True
+
+
+def _v27(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'href' not in i:
+        return False
+    if 'title' not in i:
+        return False
+    if 'description' not in i:
+        return False
+    if 'function' not in i:
+        return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v28(v, e, f):
+            return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v29(v, e, f):
+            return False
+    if 'description' in i:
+        v = i['description']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('description', v)
+        if not _v30(v, e, f):
+            return False
+    if 'function' in i:
+        v = i['function']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('function', v)
+        if not _v31(v, e, f):
+            return False
+    return True
+
+
+def _v14(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'organisation' not in i:
+        return False
+    if 'phone' not in i:
+        return False
+    if 'address' not in i:
+        return False
+    if 'email' not in i:
+        return False
+    if 'online_resource' not in i:
+        return False
+    if 'organisation' in i:
+        v = i['organisation']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('organisation', v)
+        if not _v15(v, e, f):
+            return False
+    if 'phone' in i:
+        v = i['phone']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('phone', v)
+        if not _v19(v, e, f):
+            return False
+    if 'address' in i:
+        v = i['address']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('address', v)
+        if not _v20(v, e, f):
+            return False
+    if 'email' in i:
+        v = i['email']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('email', v)
+        if not _v26(v, e, f):
+            return False
+    if 'online_resource' in i:
+        v = i['online_resource']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('online_resource', v)
+        if not _v27(v, e, f):
+            return False
+    return True
+
+
+def _v34(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C18):
+        return False
+    return True
+
+
+def _v33(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if not any(_v34(v, e, f) for v in (
+        v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)
+    )):
+        return False
+    return True
+
+
+def _v32(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'role' not in i:
+        return False
+    if 'role' in i:
+        v = i['role']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('role', v)
+        if not _v33(v, e, f):
+            return False
+    return True
+
+
+def _v13(i, e, f):
+    if not _v14(i, e, f):
+        return False
+    if not _v32(i, e, f):
+        return False
+    return True
+
+
+def _v6(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'title' not in i:
+        return False
+    if 'dates' not in i:
+        return False
+    if 'edition' not in i:
+        return False
+    if 'contact' not in i:
+        return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v7(v, e, f):
+            return False
+    if 'dates' in i:
+        v = i['dates']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('dates', v)
+        if not _v10(v, e, f):
+            return False
+    if 'edition' in i:
+        v = i['edition']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('edition', v)
+        if not _v12(v, e, f):
+            return False
+    if 'contact' in i:
+        v = i['contact']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('contact', v)
+        if not _v13(v, e, f):
+            return False
+    return True
+
+
+def _v35(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C19):
+        return False
+    return True
+
+
+def _v36(i, e, f):
+    if not (isinstance(i, bool)):
+        return False
+    if not json_equal(i, _C20):
+        return False
+    return True
+
+
+def _v5(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'specification' not in i:
+        return False
+    if 'explanation' not in i:
+        return False
+    if 'result' not in i:
+        return False
+    if 'specification' in i:
+        v = i['specification']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('specification', v)
+        if not _v6(v, e, f):
+            return False
+    if 'explanation' in i:
+        v = i['explanation']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('explanation', v)
+        if not _v35(v, e, f):
+            return False
+    if 'result' in i:
+        v = i['result']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('result', v)
+        if not _v36(v, e, f):
+            return False
+    return True
+
+
+def _v4(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if not any(_v5(v, e, f) for v in (
+        v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)
+    )):
+        return False
+    return True
+
+
+def _v2(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'supplemental_information' not in i:
+        return False
+    if 'domain_consistency' not in i:
+        return False
+    if 'supplemental_information' in i:
+        v = i['supplemental_information']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('supplemental_information', v)
+        if not _v3(v, e, f):
+            return False
+    if 'domain_consistency' in i:
+        v = i['domain_consistency']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('domain_consistency', v)
+        if not _v4(v, e, f):
+            return False
+    return True
+
+
+def _v0(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'file_identifier' not in i:
+        return False
+    if 'identification' not in i:
+        return False
+    if 'file_identifier' in i:
+        v = i['file_identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('file_identifier', v)
+        if not _v1(v, e, f):
+            return False
+    if 'identification' in i:
+        v = i['identification']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identification', v)
+        if not _v2(v, e, f):
+            return False
+    return True
+
+
+def validate(instance, encode_member=None, format_checker=None):
+    return _v0(instance, encode_member, format_checker)
+
+
+FRAGMENTS = {
+    '#/$defs/domain_conformance': _v5,
+    '#/$defs/domain_consistency': _v4,
+    '#/$defs/file_identifier': _v1,
+    '#/$defs/identification': _v2,
+    '#/$defs/magic': _v14,
+    '#/$defs/supplemental_information': _v3,
+}
@@ -0,0 +1,953 @@
+# Generated from 'magic_discovery_v1.json' by the `generate-validators` task - do not edit.
+import re
+
+from bas_metadata_library.codegen import JSON_PASSTHROUGH_TYPES, is_json_integer, is_json_number, json_equal
+
+SCHEMA_ID = 'https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/magic-discovery-v1.json'
+SCHEMA_DIGEST = '747dfab5c6b88647f66b82cd10a82203f2fb3db92faa234a55641d4e1fd9903b'
+
+_C0 = ('collection', 'dataset', 'product', 'paperMapProduct', 'series')
+_C1 = 'Mapping and Geographic Information Centre, British Antarctic Survey'
+_C2 = 'https://ror.org/01rhff309'
+_C3 = 'ror'
+_C4 = '+44 (0)1223 221400'
+_C5 = 'British Antarctic Survey, High Cross, Madingley Road'
+_C6 = 'Cambridge'
+_C7 = 'Cambridgeshire'
+_C8 = 'CB3 0ET'
+_C9 = 'United Kingdom'
+_C10 = 'magic@bas.ac.uk'
+_C11 = 'https://www.bas.ac.uk/teams/magic'
+_C12 = 'Mapping and Geographic Information Centre (MAGIC) - BAS public website'
+_C13 = 'General information about the BAS Mapping and Geographic Information Centre (MAGIC) from the British Antarctic Survey (BAS) public website.'
+_C14 = 'information'
+_C15 = 'pointOfContact'
+_C16 = re.compile('^https://data\\.bas\\.ac\\.uk/items/.+')
+_C17 = 'data.bas.ac.uk'
+_C18 = 'access'
+_C19 = 'usage'
+_C20 = 'bounding'
+_C21 = 'British Antarctic Survey (BAS) Mapping and Geographic Information Centre (MAGIC) Discovery Metadata Profile'
+_C22 = ('https://metadata-standards.data.bas.ac.uk/profiles/magic-discovery-v1/', 'https://metadata-standards.data.bas.ac.uk/profiles/magic-discovery/v1/')
+_C23 = '2024-11-01'
+_C24 = '1'
+_C25 = 'publisher'
+_C26 = 'Resource within scope of British Antarctic Survey (BAS) Mapping and Geographic Information Centre (MAGIC) Discovery Metadata Profile.'
+_C27 = True
+_C28 = 'collection'
+
+
+def _v1(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v2(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C0):
+        return False
+    return True
+
+
+def _v8(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C1):
+        return False
+    return True
+
+
+def _v9(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C2):
+        return False
+    return True
+
+
+def _v10(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C3):
+        return False
+    return True
+
+
+def _v7(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'name' not in i:
+        return False
+    if 'href' not in i:
+        return False
+    if 'title' not in i:
+        return False
+    if 'name' in i:
+        v = i['name']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('name', v)
+        if not _v8(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v9(v, e, f):
+            return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v10(v, e, f):
+            return False
+    return True
+
+
+def _v11(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C4):
+        return False
+    return True
+
+
+def _v13(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C5):
+        return False
+    return True
+
+
+def _v14(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C6):
+        return False
+    return True
+
+
+def _v15(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C7):
+        return False
+    return True
+
+
+def _v16(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C8):
+        return False
+    return True
+
+
+def _v17(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C9):
+        return False
+    return True
+
+
+def _v12(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'delivery_point' not in i:
+        return False
+    if 'city' not in i:
+        return False
+    if 'administrative_area' not in i:
+        return False
+    if 'postal_code' not in i:
+        return False
+    if 'country' not in i:
+        return False
+    if 'delivery_point' in i:
+        v = i['delivery_point']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('delivery_point', v)
+        if not _v13(v, e, f):
+            return False
+    if 'city' in i:
+        v = i['city']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('city', v)
+        if not _v14(v, e, f):
+            return False
+    if 'administrative_area' in i:
+        v = i['administrative_area']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('administrative_area', v)
+        if not _v15(v, e, f):
+            return False
+    if 'postal_code' in i:
+        v = i['postal_code']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('postal_code', v)
+        if not _v16(v, e, f):
+            return False
+    if 'country' in i:
+        v = i['country']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('country', v)
+        if not _v17(v, e, f):
+            return False
+    return True
+
+
+def _v18(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C10):
+        return False
+    return True
+
+
+def _v20(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C11):
+        return False
+    return True
+
+
+def _v21(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C12):
+        return False
+    return True
+
+
+def _v22(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C13):
+        return False
+    return True
+
+
+def _v23(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C14):
+        return False
+    return True
+
+
+def _v19(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'href' not in i:
+        return False
+    if 'title' not in i:
+        return False
+    if 'description' not in i:
+        return False
+    if 'function' not in i:
+        return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v20(v, e, f):
+            return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v21(v, e, f):
+            return False
+    if 'description' in i:
+        v = i['description']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('description', v)
+        if not _v22(v, e, f):
+            return False
+    if 'function' in i:
+        v = i['function']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('function', v)
+        if not _v23(v, e, f):
+            return False
+    return True
+
+
+def _v6(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'organisation' not in i:
+        return False
+    if 'phone' not in i:
+        return False
+    if 'address' not in i:
+        return False
+    if 'email' not in i:
+        return False
+    if 'online_resource' not in i:
+        return False
+    if 'organisation' in i:
+        v = i['organisation']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('organisation', v)
+        if not _v7(v, e, f):
+            return False
+    if 'phone' in i:
+        v = i['phone']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('phone', v)
+        if not _v11(v, e, f):
+            return False
+    if 'address' in i:
+        v = i['address']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('address', v)
+        if not _v12(v, e, f):
+            return False
+    if 'email' in i:
+        v = i['email']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('email', v)
+        if not _v18(v, e, f):
+            return False
+    if 'online_resource' in i:
+        v = i['online_resource']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('online_resource', v)
+        if not _v19(v, e, f):
+            return False
+    return True
+
+
+def _v26(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C15):
+        return False
+    return True
+
+
+def _v25(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if not any(_v26(v, e, f) for v in (
+        v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)
+    )):
+        return False
+    return True
+
+
+def _v24(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'role' not in i:
+        return False
+    if 'role' in i:
+        v = i['role']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('role', v)
+        if not _v25(v, e, f):
+            return False
+    return True
+
+
+def _v5(i, e, f):
+    if not _v6(i, e, f):
+        return False
+    if not _v24(i, e, f):
+        return False
+    return True
+
+
+def _v4(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if not any(_v5(v, e, f) for v in (
+        v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)
+    )):
+        return False
+    return True
+
+
+def _v3(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'contacts' not in i:
+        return False
+    if 'date_stamp' not in i:
+        return False
+    if 'contacts' in i:
+        v = i['contacts']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('contacts', v)
+        if not _v4(v, e, f):
+            return False
+    return True
+
+
+def _v30(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+
+def _v31(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not _C16.search(i):
+        return False
+    return True
+
+
+def _v32(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C17):
+        return False
+    return True
+
+
+def _v29(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'identifier' not in i:
+        return False
+    if 'href' not in i:
+        return False
+    if 'namespace' not in i:
+        return False
+    if 'identifier' in i:
+        v = i['identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identifier', v)
+        if not _v30(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v31(v, e, f):
+            return False
+    if 'namespace' in i:
+        v = i['namespace']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('namespace', v)
+        if not _v32(v, e, f):
+            return False
+    return True
+
+
+def _v28(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if not any(_v29(v, e, f) for v in (
+        v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)
+    )):
+        return False
+    return True
+
+
+def _v33(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'maintenance_frequency' not in i:
+        return False
+    if 'progress' not in i:
+        return False
+    return True
+
+
+def _v37(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C18):
+        return False
+    return True
+
+
+def _v36(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'type' not in i:
+        return False
+    if 'type' in i:
+        v = i['type']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('type', v)
+        if not _v37(v, e, f):
+            return False
+    return True
+
+
+def _v35(i, e, f):
+    if isinstance(i, list):
+        if not any(_v36(v, e, f) for v in (
+            v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)
+        )):
+            return False
+    return True
+
+
+def _v40(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C19):
+        return False
+    return True
+
+
+def _v39(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'type' not in i:
+        return False
+    if 'type' in i:
+        v = i['type']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('type', v)
+        if not _v40(v, e, f):
+            return False
+    return True
+
+
+def _v38(i, e, f):
+    if isinstance(i, list):
+        if not any(_v39(v, e, f) for v in (
+            v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)
+        )):
+            return False
+    return True
+
+
+def _v34(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if not _v35(i, e, f):
+        return False
+    if not _v38(i, e, f):
+        return False
+    return True
+
+
+def _v43(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C20):
+        return False
+    return True
+
+
+def _v42(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'identifier' not in i:
+        return False
+    if 'identifier' in i:
+        v = i['identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identifier', v)
+        if not _v43(v, e, f):
+            return False
+    return True
+
+
+def _v41(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if not any(_v42(v, e, f) for v in (
+        v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)
+    )):
+        return False
+    return True
+
+
+def _v44(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'statement' not in i:
+        return False
+    return True
+
+
+def _v49(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C21):
+        return False
+    return True
+
+
+def _v50(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not any(json_equal(i, _) for _ in _C22):
+        return False
+    return True
+
+
+def _v48(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'value' not in i:
+        return False
+    if 'href' not in i:
+        return False
+    if 'value' in i:
+        v = i['value']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('value', v)
+        if not _v49(v, e, f):
+            return False
+    if 'href' in i:
+        v = i['href']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('href', v)
+        if not _v50(v, e, f):
+            return False
+    return True
+
+
+def _v52(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C23):
+        return False
+    return True
+
+
+def _v51(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'publication' not in i:
+        return False
+    if 'publication' in i:
+        v = i['publication']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('publication', v)
+        if not _v52(v, e, f):
+            return False
+    return True
+
+
+def _v53(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C24):
+        return False
+    return True
+
+
+def _v57(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C25):
+        return False
+    return True
+
+
+def _v56(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if not any(_v57(v, e, f) for v in (
+        v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)
+    )):
+        return False
+    return True
+
+
+def _v55(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'role' not in i:
+        return False
+    if 'role' in i:
+        v = i['role']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('role', v)
+        if not _v56(v, e, f):
+            return False
+    return True
+
+
+def _v54(i, e, f):
+    if not _v6(i, e, f):
+        return False
+    if not _v55(i, e, f):
+        return False
+    return True
+
+
+def _v47(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'title' not in i:
+        return False
+    if 'dates' not in i:
+        return False
+    if 'edition' not in i:
+        return False
+    if 'contact' not in i:
+        return False
+    if 'title' in i:
+        v = i['title']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('title', v)
+        if not _v48(v, e, f):
+            return False
+    if 'dates' in i:
+        v = i['dates']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('dates', v)
+        if not _v51(v, e, f):
+            return False
+    if 'edition' in i:
+        v = i['edition']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('edition', v)
+        if not _v53(v, e, f):
+            return False
+    if 'contact' in i:
+        v = i['contact']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('contact', v)
+        if not _v54(v, e, f):
+            return False
+    return True
+
+
+def _v58(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C26):
+        return False
+    return True
+
+
+def _v59(i, e, f):
+    if not (isinstance(i, bool)):
+        return False
+    if not json_equal(i, _C27):
+        return False
+    return True
+
+
+def _v46(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'specification' not in i:
+        return False
+    if 'explanation' not in i:
+        return False
+    if 'result' not in i:
+        return False
+    if 'specification' in i:
+        v = i['specification']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('specification', v)
+        if not _v47(v, e, f):
+            return False
+    if 'explanation' in i:
+        v = i['explanation']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('explanation', v)
+        if not _v58(v, e, f):
+            return False
+    if 'result' in i:
+        v = i['result']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('result', v)
+        if not _v59(v, e, f):
+            return False
+    return True
+
+
+def _v45(i, e, f):
+    if not (isinstance(i, list)):
+        return False
+    if not any(_v46(v, e, f) for v in (
+        v if e is None or v.__class__ in JSON_PASSTHROUGH_TYPES else e(k, v) for k, v in enumerate(i)
+    )):
+        return False
+    return True
+
+
+def _v27(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'edition' not in i:
+        return False
+    if 'identifiers' not in i:
+        return False
+    if 'contacts' not in i:
+        return False
+    if 'maintenance' not in i:
+        return False
+    if 'constraints' not in i:
+        return False
+    if 'extents' not in i:
+        return False
+    if 'domain_consistency' not in i:
+        return False
+    if 'identifiers' in i:
+        v = i['identifiers']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identifiers', v)
+        if not _v28(v, e, f):
+            return False
+    if 'contacts' in i:
+        v = i['contacts']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('contacts', v)
+        if not _v4(v, e, f):
+            return False
+    if 'maintenance' in i:
+        v = i['maintenance']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('maintenance', v)
+        if not _v33(v, e, f):
+            return False
+    if 'constraints' in i:
+        v = i['constraints']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('constraints', v)
+        if not _v34(v, e, f):
+            return False
+    if 'extents' in i:
+        v = i['extents']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('extents', v)
+        if not _v41(v, e, f):
+            return False
+    if 'lineage' in i:
+        v = i['lineage']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('lineage', v)
+        if not _v44(v, e, f):
+            return False
+    if 'domain_consistency' in i:
+        v = i['domain_consistency']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('domain_consistency', v)
+        if not _v45(v, e, f):
+            return False
+    return True
+
+
+def _v61(i, e, f):
+    if isinstance(i, dict):
+        if 'edition' not in i:
+            return False
+        if 'identifiers' not in i:
+            return False
+        if 'contacts' not in i:
+            return False
+        if 'maintenance' not in i:
+            return False
+        if 'constraints' not in i:
+            return False
+        if 'extents' not in i:
+            return False
+        if 'lineage' not in i:
+            return False
+        if 'domain_consistency' not in i:
+            return False
+    return True
+
+
+def _v60(i, e, f):
+    if isinstance(i, dict):
+        if 'identification' in i:
+            v = i['identification']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('identification', v)
+            if not _v61(v, e, f):
+                return False
+    return True
+
+
+def _v63(i, e, f):
+    if not (isinstance(i, str)):
+        return False
+    if not json_equal(i, _C28):
+        return False
+    return True
+
+
+def _v62(i, e, f):
+    if isinstance(i, dict):
+        if 'hierarchy_level' in i:
+            v = i['hierarchy_level']
+            if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+                v = e('hierarchy_level', v)
+            if not _v63(v, e, f):
+                return False
+    return True
+
+
+def _v0(i, e, f):
+    if not (isinstance(i, dict)):
+        return False
+    if 'file_identifier' not in i:
+        return False
+    if 'hierarchy_level' not in i:
+        return False
+    if 'metadata' not in i:
+        return False
+    if 'identification' not in i:
+        return False
+    if 'file_identifier' in i:
+        v = i['file_identifier']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('file_identifier', v)
+        if not _v1(v, e, f):
+            return False
+    if 'hierarchy_level' in i:
+        v = i['hierarchy_level']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('hierarchy_level', v)
+        if not _v2(v, e, f):
+            return False
+    if 'metadata' in i:
+        v = i['metadata']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('metadata', v)
+        if not _v3(v, e, f):
+            return False
+    if 'identification' in i:
+        v = i['identification']
+        if e is not None and v.__class__ not in JSON_PASSTHROUGH_TYPES:
+            v = e('identification', v)
+        if not _v27(v, e, f):
+            return False
+    if _v62(i, e, f):
+        pass
+    else:
+        if not _v60(i, e, f):
+            return False
+    return True
+
+
+def validate(instance, encode_member=None, format_checker=None):
+    return _v0(instance, encode_member, format_checker)
+
+
+FRAGMENTS = {
+    '#/definitions/catalogue_identifier': _v29,
+    '#/definitions/constraints': _v34,
+    '#/definitions/contacts': _v4,
+    '#/definitions/domain_conformance': _v46,
+    '#/definitions/domain_consistency': _v45,
+    '#/definitions/extents': _v41,
+    '#/definitions/hierarchy_level': _v2,
+    '#/definitions/identification': _v27,
+    '#/definitions/identifiers': _v28,
+    '#/definitions/lineage': _v44,
+    '#/definitions/magic': _v6,
+    '#/definitions/maintenance': _v33,
+    '#/definitions/metadata': _v3,
+    '#/definitions/point_of_contact': _v5,
+}
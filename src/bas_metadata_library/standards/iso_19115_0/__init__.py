@@ -2,19 +2,29 @@ from __future__ import annotations
 
 import json
 from copy import deepcopy
+from mmap import mmap
 from pathlib import Path
+from typing import BinaryIO, Iterator
 
-from importlib_resources import files as resource_file
-from lxml.etree import Element, fromstring
+from lxml.etree import Element, ElementTree
 
+from bas_metadata_library import LazyMetadataRecordConfig, iterparse_records, load_schema
 from bas_metadata_library import MetadataRecord as _MetadataRecord
 from bas_metadata_library import MetadataRecordConfig as _MetadataRecordConfig
 from bas_metadata_library import Namespaces as _Namespaces
+from bas_metadata_library.standards.iso_19115_common import GMD, XSI
+from bas_metadata_library.standards.iso_19115_common.decoder import (
+    RecordHeader,
+    decode_record,
+    decode_sections,
+    scan_record_header,
+)
 from bas_metadata_library.standards.iso_19115_common.root_element import ISOMetadataRecord
 from bas_metadata_library.standards.iso_19115_common.utils import (
     decode_config_from_json,
     encode_config_for_json,
     validate_config,
+    validate_config_fragment,
 )
 
 
@@ -49,6 +59,10 @@ class Namespaces(_Namespaces):
         super().__init__(namespaces=self._namespaces)
 
 
+NAMESPACES = Namespaces()
+NSMAP = NAMESPACES.frozen_nsmap()
+
+
 class MetadataRecordConfigV4(_MetadataRecordConfig):
     """v4 configuration schema for ISO 19115:2003."""
 
@@ -57,17 +71,30 @@ class MetadataRecordConfigV4(_MetadataRecordConfig):
 
         self.config = kwargs
 
-        schema_path = resource_file("bas_metadata_library.schemas.dist").joinpath("iso_19115_0_v4.json")
-        with schema_path.open() as schema_file:
-            schema_data = json.load(schema_file)
+        schema_data = load_schema(name="iso_19115_0_v4")
         self.schema = schema_data
 
         # Workaround - will be addressed in #149
         self.schema_uri = schema_data["$id"]
         self.config = {"$schema": self.schema_uri, **kwargs}
 
-    def validate(self) -> None:
-        validate_config(config=self.config, schema=self.schema)
+    def validate(self, encode_config: bool = False, check_formats: bool = False) -> None:
+        """
+        Validate record configuration against the schema for this standard and any profiles it indicates.
+
+        If `check_formats` is set, values such as URIs and date-times are also checked against their formats.
+        """
+        validate_config(
+            config=self.config, schema=self.schema, encode_config=encode_config, check_formats=check_formats
+        )
+
+    def validate_fragment(self, name: str, fragment: dict, path: list[str | int] | None = None) -> None:
+        """
+        Validate part of a record configuration against a named sub-schema (e.g. 'contact', 'distribution_option').
+
+        Where `path` is given (e.g. `['metadata', 'contacts', 0]`), error paths are relative to the whole config.
+        """
+        validate_config_fragment(fragment=fragment, schema=self.schema, name=name, path=path)
 
     def load(self, file: Path) -> None:
         with file.open() as file:
@@ -91,31 +118,101 @@ class MetadataRecord(_MetadataRecord):
     Expects/requires record configurations to use version 3 of the configuration schema for this standard
     """
 
-    def __init__(self, configuration: MetadataRecordConfigV4 = None, record: str | None = None):
-        self.ns = Namespaces()
+    def __init__(
+        self,
+        configuration: MetadataRecordConfigV4 = None,
+        record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO | None = None,
+    ):
+        self.ns = NAMESPACES
         self.attributes = {}
         self.record = Element(
-            f"{{{self.ns.gmd}}}MD_Metadata",
-            attrib={f"{{{self.ns.xsi}}}schemaLocation": self.ns.schema_locations()},
+            GMD.MD_Metadata,
+            attrib={XSI.schemaLocation: self.ns.schema_locations()},
             nsmap=self.ns.nsmap(),
         )
         self.xpath = "/gmd:MD_Metadata"
+        self.record_digest = None
 
         if configuration is not None:
             configuration.validate()
             self.attributes = configuration.config
 
         if record is not None:
-            self.record = fromstring(record.encode())
+            self.load_record(record)
 
         self.metadata_record = ISOMetadataRecord(record=self.record, attributes=self.attributes, xpath=self.xpath)
 
-    def make_config(self) -> MetadataRecordConfigV4:
-        return MetadataRecordConfigV4(**self.metadata_record.make_config())
+    def make_config(self, fields: list[str] | None = None) -> MetadataRecordConfigV4:
+        """
+        Decode record into a record configuration.
+
+        Records are decoded in a single pass over their elements (see `iso_19115_common.decoder`).
+
+        If set, only the values for `fields` are decoded, where each field is a path of configuration keys separated by
+        '.' (e.g. `['file_identifier', 'identification.title']`). Such configurations are partial, and so not valid.
+
+        If a decode cache is set (see `decode_cache.set_decode_cache()`), configurations for records already decoded are
+        returned from the cache.
+        """
+        return MetadataRecordConfigV4(
+            **decode_record(record=self.record, root_tag=GMD.MD_Metadata, fields=fields, digest=self.record_digest)
+        )
+
+    def make_lazy_config(self) -> LazyMetadataRecordConfig:
+        """
+        Decode record into a record configuration, decoding each top-level section when first accessed.
+
+        Useful where only some sections of a record configuration are needed (e.g. 'file_identifier' and
+        'identification' for listing records). Use `materialise()` to decode all sections into a regular record
+        configuration (e.g. `MetadataRecordConfigV4(**config.materialise())`).
+        """
+        return LazyMetadataRecordConfig(
+            sections=decode_sections(record=self.record, root_tag=GMD.MD_Metadata),
+            values={"$schema": load_schema(name="iso_19115_0_v4")["$id"]},
+        )
+
+    @classmethod
+    def iter_configs(
+        cls, document: str | Path | BinaryIO, concatenated: bool = False, fields: list[str] | None = None
+    ) -> Iterator[MetadataRecordConfigV4]:
+        """
+        Decode records embedded in an XML document, such as a catalogue (e.g. CSW or OAI-PMH) response.
+
+        Documents are parsed incrementally and each record decoded into a record configuration in turn, so that large
+        documents can be processed without loading them into memory (see `iterparse_records()` for `concatenated`).
+        Records for other standards are ignored. See `make_config()` for `fields`.
+
+        Documents can be given as a string (of XML content, not a path), a path or a binary file-like object.
+        """
+        root_tag = GMD.MD_Metadata
+        for record in iterparse_records(document=document, tag=root_tag, concatenated=concatenated):
+            yield MetadataRecordConfigV4(**decode_record(record=record, root_tag=root_tag, fields=fields))
+
+    @classmethod
+    def scan_header(
+        cls, record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO, maintenance: bool = True
+    ) -> RecordHeader:
+        """
+        Decode the header of a record (file identifier, hierarchy level, date stamp and metadata maintenance).
+
+        Only the elements needed are decoded, and parsing stops once they have been parsed, so that large numbers of
+        records can be checked for changes cheaply (see `scan_record_header()` for `maintenance`).
+        """
+        return scan_record_header(record=record, root_tag=GMD.MD_Metadata, maintenance=maintenance)
 
     def make_element(self) -> Element:
         return self.metadata_record.make_element()
 
+    def make_sections(self) -> Iterator[Element]:
+        return self.metadata_record.make_sections()
+
+    # noinspection PyMethodOverriding
+    def validate(self, use_xmllint: bool = False) -> None:
+        super().validate(xsd_path=Path("gmd/gmd.xsd"), use_xmllint=use_xmllint)
+
     # noinspection PyMethodOverriding
-    def validate(self) -> None:
-        super().validate(xsd_path=Path("gmd/gmd.xsd"))
+    @classmethod
+    def validate_document(
+        cls, document: str | bytes | bytearray | memoryview | mmap | Path | Element | ElementTree
+    ) -> None:
+        super().validate_document(document=document, xsd_path=Path("gmd/gmd.xsd"))
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from lxml.etree import Element, SubElement
+from typing import TYPE_CHECKING
+
+from lxml.etree import Element
 
 from bas_metadata_library import (
     MetadataRecord as _MetadataRecord,
@@ -11,6 +13,12 @@ from bas_metadata_library import (
 from bas_metadata_library import (
     Namespaces as _Namespaces,
 )
+from bas_metadata_library import (
+    Vocabulary,
+)
+
+if TYPE_CHECKING:
+    from bas_metadata_library.standards.iso_19115_common.mapping import Codec
 
 
 class Namespaces(_Namespaces):
@@ -56,13 +64,29 @@ class Namespaces(_Namespaces):
         super().__init__(namespaces=self._namespaces)
 
 
+NAMESPACES = Namespaces()
+NSMAP = NAMESPACES.frozen_nsmap()
+
+GMD = Vocabulary(Namespaces.gmd)
+GCO = Vocabulary(Namespaces.gco)
+GML = Vocabulary(Namespaces.gml)
+GMX = Vocabulary(Namespaces.gmx)
+SRV = Vocabulary(Namespaces.srv)
+XLINK = Vocabulary(Namespaces.xlink)
+XSI = Vocabulary(Namespaces.xsi)
+GMI = Vocabulary(Namespaces.gmi)
+
+
 class MetadataRecordElement(_MetadataRecordElement):
     """
     Overloaded base MetadataRecordElement class.
 
-    Sets the type hint of the record attribute to the MetadataRecord class for this metadata standard.
+    Sets the type hint of the record attribute to the MetadataRecord class for this metadata standard, and the namespaces
+    shared by all elements to those for this metadata standard.
     """
 
+    ns = NAMESPACES
+
     def __init__(
         self,
         record: _MetadataRecord,
@@ -78,11 +102,32 @@ class MetadataRecordElement(_MetadataRecordElement):
             element_attributes=element_attributes,
             xpath=xpath,
         )
-        self.ns = Namespaces()
+
+    def select(self, path: str | None = None) -> list[Element]:
+        """
+        Select the elements for this element in a record, using its XPath.
+
+        Used by `make_config()` methods, which decode the selected elements using the equivalent function in the
+        `decoder` module or codec in the `mapping` module. If set, `path` is relative to the elements selected by the
+        XPath of the element (e.g. '..' to select their parent elements).
+
+        :type path: str
+        :param path: optional XPath relative to the elements for this element
+        :return: selected elements
+        """
+        xpath = self.xpath if path is None else f"{self.xpath}/{path}"
+        return self.record.xpath(xpath, namespaces=self.ns.nsmap())
 
 
 class CodeListElement(MetadataRecordElement):
-    """Derived MetadataRecordElement class defining an ISO code list element."""
+    """
+    Derived MetadataRecordElement class defining an ISO code list element.
+
+    Code lists are described by a declarative mapping (see `mapping.CodeList`), compiled into the `codec` class
+    attribute set by subclasses, which is used to encode code list elements.
+    """
+
+    codec: Codec | None = None
 
     def __init__(
         self,
@@ -92,6 +137,7 @@ class CodeListElement(MetadataRecordElement):
         element_attributes: dict | None = None,
         xpath: str | None = None,
     ):
+        mapping = self.codec.mapping
         super().__init__(
             record=record,
             attributes=attributes,
@@ -99,35 +145,15 @@ class CodeListElement(MetadataRecordElement):
             element_attributes=element_attributes,
             xpath=xpath,
         )
-        self.code_list_values = []
-        self.code_list = None
-        self.element = None
-        self.element_code = None
-        self.attribute = None
+        self.code_list_values = list(mapping.values)
+        self.code_list = mapping.code_list
+        self.element, self.element_code = self.codec.tags
+        self.attribute = mapping.key
 
     def make_config(self) -> str:
         """Build partial record configuration."""
-        _ = ""
-
-        value = self.record.xpath(
-            f"{self.xpath}[@codeList = '{self.code_list}']/@codeListValue",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(value) == 1:
-            _ = value[0]
-
-        return _
+        return self.codec.decode(self.select(".."))
 
     def make_element(self) -> None:
         """Build XML element."""
-        code_list_element = SubElement(self.parent_element, self.element)
-        if (
-            self.attribute in self.element_attributes
-            and self.element_attributes[self.attribute] in self.code_list_values
-        ):
-            code_list_value = SubElement(
-                code_list_element,
-                self.element_code,
-                attrib={"codeList": self.code_list, "codeListValue": self.element_attributes[self.attribute]},
-            )
-            code_list_value.text = self.element_attributes[self.attribute]
+        self.codec.encode(self.parent_element, self.element_attributes)
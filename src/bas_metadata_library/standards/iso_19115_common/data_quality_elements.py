@@ -1,11 +1,19 @@
 from lxml.etree import SubElement
 
-from bas_metadata_library.standards.iso_19115_common import MetadataRecordElement
-from bas_metadata_library.standards.iso_19115_common.base_elements import ScopeCode
+from bas_metadata_library.standards.iso_19115_common import GCO, GMD, MetadataRecordElement
 from bas_metadata_library.standards.iso_19115_common.common_elements import Citation, ResponsibleParty
+from bas_metadata_library.standards.iso_19115_common.decoder import (
+    _data_quality_config,
+    _domain_consistency_config,
+    _lineage_config,
+    _process_step_config,
+    _source_config,
+)
+from bas_metadata_library.standards.iso_19115_common.mapping import (
+    RESPONSIBLE_PARTY,
+    SCOPE,
+)
 from bas_metadata_library.standards.iso_19115_common.utils import (
-    condense_contacts_roles,
-    decode_date_string,
     encode_date_string,
 )
 
@@ -15,42 +23,12 @@ class DataQuality(MetadataRecordElement):
 
     def make_config(self) -> dict:
         """Decode to Python."""
-        _ = {}
-
-        _domain_consistency = []
-        domains_length = int(
-            self.record.xpath(
-                f"count({self.xpath}/gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:report/gmd:DQ_DomainConsistency)",
-                namespaces=self.ns.nsmap(),
-            )
-        )
-        for domain_index in range(1, domains_length + 1):
-            domain_consistency = DomainConsistency(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:report[gmd:DQ_DomainConsistency])[{domain_index}]",
-            )
-            _domain = domain_consistency.make_config()
-            if bool(_domain):
-                _domain_consistency.append(_domain)
-        if len(_domain_consistency) > 0:
-            _["domain_consistency"] = _domain_consistency
-
-        lineage = Lineage(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:lineage",
-        )
-        _lineage = lineage.make_config()
-        if bool(_lineage):
-            _["lineage"] = _lineage
-
-        return _
+        return _data_quality_config(self.select())
 
     def make_element(self) -> None:
         """Encode as XML."""
-        data_quality_wrapper = SubElement(self.record, f"{{{self.ns.gmd}}}dataQualityInfo")
-        data_quality_element = SubElement(data_quality_wrapper, f"{{{self.ns.gmd}}}DQ_DataQuality")
+        data_quality_wrapper = SubElement(self.record, GMD.dataQualityInfo)
+        data_quality_element = SubElement(data_quality_wrapper, GMD.DQ_DataQuality)
 
         scope = Scope(record=self.record, attributes=self.attributes, parent_element=data_quality_element)
         scope.make_element()
@@ -80,73 +58,32 @@ class Scope(MetadataRecordElement):
 
     def make_element(self) -> None:
         """Encode as XML."""
-        scope_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}scope")
-        scope_element = SubElement(scope_wrapper, f"{{{self.ns.gmd}}}DQ_Scope")
+        scope_wrapper = SubElement(self.parent_element, GMD.scope)
+        scope_element = SubElement(scope_wrapper, GMD.DQ_Scope)
 
-        scope_code = ScopeCode(record=self.record, attributes=self.attributes, parent_element=scope_element)
-        scope_code.make_element()
+        SCOPE.encode(scope_element, self.attributes)
 
 
 class Lineage(MetadataRecordElement):
     """gmd:lineage."""
 
-    def make_config(self) -> dict[str, str]:
+    def make_config(self) -> dict:
         """Decode to Python."""
-        _ = {}
-
-        statement_value = self.record.xpath(
-            f"{self.xpath}/gmd:LI_Lineage/gmd:statement/gco:CharacterString/text()", namespaces=self.ns.nsmap()
-        )
-        if len(statement_value) == 1:
-            _["statement"] = statement_value[0]
-
-        _process_steps = []
-        steps_length = int(
-            self.record.xpath(f"count({self.xpath}/gmd:LI_Lineage/gmd:processStep)", namespaces=self.ns.nsmap())
-        )
-        for step_index in range(1, steps_length + 1):
-            process_step = ProcessStep(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:LI_Lineage/gmd:processStep)[{step_index}]",
-            )
-            _process_step = process_step.make_config()
-            if bool(_process_step):
-                _process_steps.append(_process_step)
-        if len(_process_steps) > 0:
-            _["process_steps"] = _process_steps
-
-        _sources = []
-        sources_length = int(
-            self.record.xpath(f"count({self.xpath}/gmd:LI_Lineage/gmd:source)", namespaces=self.ns.nsmap())
-        )
-        for source_index in range(1, sources_length + 1):
-            source = Source(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:LI_Lineage/gmd:source)[{source_index}]",
-            )
-            _source = source.make_config()
-            if bool(_source):
-                _sources.append(_source)
-        if len(_sources) > 0:
-            _["sources"] = _sources
-
-        return _
+        return _lineage_config(self.select())
 
     def make_element(self) -> None:
         """Encode as XML."""
-        lineage_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}lineage")
-        lineage_element = SubElement(lineage_wrapper, f"{{{self.ns.gmd}}}LI_Lineage")
+        lineage_wrapper = SubElement(self.parent_element, GMD.lineage)
+        lineage_element = SubElement(lineage_wrapper, GMD.LI_Lineage)
 
         if "statement" in self.element_attributes:
-            statement_element = SubElement(lineage_element, f"{{{self.ns.gmd}}}statement")
-            statement_value = SubElement(statement_element, f"{{{self.ns.gco}}}CharacterString")
+            statement_element = SubElement(lineage_element, GMD.statement)
+            statement_value = SubElement(statement_element, GCO.CharacterString)
             statement_value.text = self.element_attributes["statement"]
 
         if "process_steps" in self.element_attributes:
             for process_step_attributes in self.element_attributes["process_steps"]:
-                process_step_wrapper = SubElement(lineage_element, f"{{{self.ns.gmd}}}processStep")
+                process_step_wrapper = SubElement(lineage_element, GMD.processStep)
 
                 process_step = ProcessStep(
                     record=self.record,
@@ -158,7 +95,7 @@ class Lineage(MetadataRecordElement):
 
         if "sources" in self.element_attributes:
             for source_attributes in self.element_attributes["sources"]:
-                source_wrapper = SubElement(lineage_element, f"{{{self.ns.gmd}}}source")
+                source_wrapper = SubElement(lineage_element, GMD.source)
 
                 source = Source(
                     record=self.record,
@@ -172,79 +109,26 @@ class Lineage(MetadataRecordElement):
 class ProcessStep(MetadataRecordElement):
     """gmd:LI_ProcessStep."""
 
-    def make_config(self) -> dict[str, str]:
+    def make_config(self) -> dict:
         """Decode to Python."""
-        _ = {}
-
-        description_value = self.record.xpath(
-            f"{self.xpath}/gmd:LI_ProcessStep/gmd:description/gco:CharacterString/text()", namespaces=self.ns.nsmap()
-        )
-        if len(description_value) == 1:
-            _["description"] = description_value[0]
-
-        rationale_value = self.record.xpath(
-            f"{self.xpath}/gmd:LI_ProcessStep/gmd:rationale/gco:CharacterString/text()", namespaces=self.ns.nsmap()
-        )
-        if len(rationale_value) == 1:
-            _["rationale"] = rationale_value[0]
-
-        date_value = self.record.xpath(
-            f"{self.xpath}/gmd:LI_ProcessStep/gmd:dateTime/gco:DateTime/text()", namespaces=self.ns.nsmap()
-        )
-        if len(date_value) == 1:
-            _["date"] = decode_date_string(date_datetime=date_value[0])["date"]  # unwrap datetime value
-
-        _processors = []
-        processors_length = int(
-            self.record.xpath(f"count({self.xpath}/gmd:LI_ProcessStep/gmd:processor)", namespaces=self.ns.nsmap())
-        )
-        for processor_index in range(1, processors_length + 1):
-            processor = Processor(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:LI_ProcessStep/gmd:processor)[{processor_index}]",
-            )
-            _processor = processor.make_config()
-            if bool(_processor):
-                _processors.append(_processor)
-        if len(_processors) > 0:
-            _processors = condense_contacts_roles(contacts=_processors)
-            _["processors"] = _processors
-
-        _sources = []
-        sources_length = int(
-            self.record.xpath(f"count({self.xpath}/gmd:LI_ProcessStep/gmd:source)", namespaces=self.ns.nsmap())
-        )
-        for source_index in range(1, sources_length + 1):
-            source = Source(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:LI_ProcessStep/gmd:source)[{source_index}]",
-            )
-            _source = source.make_config()
-            if bool(_source):
-                _sources.append(_source)
-        if len(_sources) > 0:
-            _["sources"] = _sources
-
-        return _
+        return _process_step_config(self.select())
 
     def make_element(self) -> None:
         """Encode as XML."""
-        process_step_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}LI_ProcessStep")
+        process_step_element = SubElement(self.parent_element, GMD.LI_ProcessStep)
 
-        description_element = SubElement(process_step_element, f"{{{self.ns.gmd}}}description")
-        description_value = SubElement(description_element, f"{{{self.ns.gco}}}CharacterString")
+        description_element = SubElement(process_step_element, GMD.description)
+        description_value = SubElement(description_element, GCO.CharacterString)
         description_value.text = self.element_attributes["description"]
 
         if "rationale" in self.element_attributes:
-            rational_element = SubElement(process_step_element, f"{{{self.ns.gmd}}}rationale")
-            rational_value = SubElement(rational_element, f"{{{self.ns.gco}}}CharacterString")
+            rational_element = SubElement(process_step_element, GMD.rationale)
+            rational_value = SubElement(rational_element, GCO.CharacterString)
             rational_value.text = self.element_attributes["rationale"]
 
         if "date" in self.element_attributes:
-            date_element = SubElement(process_step_element, f"{{{self.ns.gmd}}}dateTime")
-            date_value = SubElement(date_element, f"{{{self.ns.gco}}}DateTime")
+            date_element = SubElement(process_step_element, GMD.dateTime)
+            date_value = SubElement(date_element, GCO.DateTime)
             date_value.text = encode_date_string(self.element_attributes["date"])
 
         if "processors" in self.element_attributes:
@@ -263,7 +147,7 @@ class ProcessStep(MetadataRecordElement):
 
         if "sources" in self.element_attributes:
             for source_attributes in self.element_attributes["sources"]:
-                source_wrapper = SubElement(process_step_element, f"{{{self.ns.gmd}}}source")
+                source_wrapper = SubElement(process_step_element, GMD.source)
 
                 source = Source(
                     record=self.record,
@@ -279,12 +163,11 @@ class Processor(MetadataRecordElement):
 
     def make_config(self) -> dict:
         """Decode to Python."""
-        responsible_party = ResponsibleParty(record=self.record, attributes=self.attributes, xpath=self.xpath)
-        return responsible_party.make_config()
+        return RESPONSIBLE_PARTY.decode(self.select())
 
     def make_element(self) -> None:
         """Encode as XML."""
-        processor_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}processor")
+        processor_element = SubElement(self.parent_element, GMD.processor)
 
         responsible_party = ResponsibleParty(
             record=self.record,
@@ -300,51 +183,20 @@ class Source(MetadataRecordElement):
 
     def make_config(self) -> dict:
         """Decode to Python."""
-        _ = {}
-
-        description_value = self.record.xpath(
-            f"{self.xpath}/gmd:LI_Source/gmd:description/gco:CharacterString/text()", namespaces=self.ns.nsmap()
-        )
-        if len(description_value) == 1:
-            _["description"] = description_value[0]
-
-        citation = Citation(
-            record=self.record, attributes=self.attributes, xpath=f"({self.xpath}/gmd:LI_Source/gmd:sourceCitation)"
-        )
-        _citation = citation.make_config()
-        if bool(_citation):
-            _.update(**_citation)
-
-        _source_steps = []
-        steps_length = int(
-            self.record.xpath(f"count({self.xpath}/gmd:LI_Source/gmd:sourceStep)", namespaces=self.ns.nsmap())
-        )
-        for step_index in range(1, steps_length + 1):
-            source_step = ProcessStep(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:LI_Source/gmd:sourceStep)[{step_index}]",
-            )
-            _source_step = source_step.make_config()
-            if bool(_source_step):
-                _source_steps.append(_source_step)
-        if len(_source_steps) > 0:
-            _["source_steps"] = _source_steps
-
-        return _
+        return _source_config(self.select())
 
     def make_element(self) -> None:
         """Encode to XML."""
-        source_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}LI_Source")
+        source_element = SubElement(self.parent_element, GMD.LI_Source)
 
         if "description" in self.element_attributes:
-            description_element = SubElement(source_element, f"{{{self.ns.gmd}}}description")
-            description_value = SubElement(description_element, f"{{{self.ns.gco}}}CharacterString")
+            description_element = SubElement(source_element, GMD.description)
+            description_value = SubElement(description_element, GCO.CharacterString)
             description_value.text = self.element_attributes["description"]
 
         # partial citation attributes
         if any(key in ["title", "dates", "edition", "identifiers", "contact"] for key in self.element_attributes):
-            citation_element = SubElement(source_element, f"{{{self.ns.gmd}}}sourceCitation")
+            citation_element = SubElement(source_element, GMD.sourceCitation)
             citation = Citation(
                 record=self.record,
                 attributes=self.attributes,
@@ -355,7 +207,7 @@ class Source(MetadataRecordElement):
 
         if "source_steps" in self.element_attributes:
             for step_attributes in self.element_attributes["source_steps"]:
-                source_step_wrapper = SubElement(source_element, f"{{{self.ns.gmd}}}sourceStep")
+                source_step_wrapper = SubElement(source_element, GMD.sourceStep)
 
                 step = ProcessStep(
                     record=self.record,
@@ -371,34 +223,16 @@ class DomainConsistency(MetadataRecordElement):
 
     def make_config(self) -> dict:
         """Decode to Python."""
-        _ = {}
-        xpath = f"{self.xpath}/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult"
-
-        specification = Citation(record=self.record, attributes=self.attributes, xpath=f"({xpath}/gmd:specification)")
-        _specification = specification.make_config()
-        if bool(_specification):
-            _["specification"] = _specification
-
-        explanation_value = self.record.xpath(
-            f"{xpath}/gmd:explanation/gco:CharacterString/text()", namespaces=self.ns.nsmap()
-        )
-        if len(explanation_value) == 1:
-            _["explanation"] = explanation_value[0]
-
-        result_value = self.record.xpath(f"{xpath}/gmd:pass/gco:Boolean/text()", namespaces=self.ns.nsmap())
-        if len(result_value) == 1:
-            _["result"] = bool(result_value[0])
-
-        return _
+        return _domain_consistency_config(self.select())
 
     def make_element(self) -> None:
         """Encode as XML."""
-        domain_conformance_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}report")
-        domain_conformance_element = SubElement(domain_conformance_wrapper, f"{{{self.ns.gmd}}}DQ_DomainConsistency")
-        result_wrapper = SubElement(domain_conformance_element, f"{{{self.ns.gmd}}}result")
-        result_element = SubElement(result_wrapper, f"{{{self.ns.gmd}}}DQ_ConformanceResult")
+        domain_conformance_wrapper = SubElement(self.parent_element, GMD.report)
+        domain_conformance_element = SubElement(domain_conformance_wrapper, GMD.DQ_DomainConsistency)
+        result_wrapper = SubElement(domain_conformance_element, GMD.result)
+        result_element = SubElement(result_wrapper, GMD.DQ_ConformanceResult)
 
-        specification_element = SubElement(result_element, f"{{{self.ns.gmd}}}specification")
+        specification_element = SubElement(result_element, GMD.specification)
         citation = Citation(
             record=self.record,
             attributes=self.attributes,
@@ -407,10 +241,10 @@ class DomainConsistency(MetadataRecordElement):
         )
         citation.make_element()
 
-        explanation_element = SubElement(result_element, f"{{{self.ns.gmd}}}explanation")
-        explanation_value = SubElement(explanation_element, f"{{{self.ns.gco}}}CharacterString")
+        explanation_element = SubElement(result_element, GMD.explanation)
+        explanation_value = SubElement(explanation_element, GCO.CharacterString)
         explanation_value.text = self.element_attributes["explanation"]
 
-        pass_element = SubElement(result_element, f"{{{self.ns.gmd}}}pass")
-        pass_value = SubElement(pass_element, f"{{{self.ns.gco}}}Boolean")
+        pass_element = SubElement(result_element, GMD["pass"])
+        pass_value = SubElement(pass_element, GCO.Boolean)
         pass_value.text = str(self.element_attributes["result"]).lower()
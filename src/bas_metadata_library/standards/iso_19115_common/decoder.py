@@ -0,0 +1,890 @@
+"""
+Single pass decoder for ISO 19115 records.
+
+Records are decoded into record configurations by walking from their root element, descending into child elements once
+per element, rather than evaluating absolute XPath expressions from the root of a record for each value. All decoding
+is done here, element classes in this package decode their elements using the equivalent function (via `make_config()`).
+
+Each function takes the set of elements (node-set) for an element (e.g. all `gmd:CI_Citation` elements in a parent) and
+returns its (partial) configuration, including where records contain unexpected repeated elements.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from itertools import zip_longest
+from mmap import mmap
+from pathlib import Path
+from typing import Any, BinaryIO, Callable
+
+from lxml.etree import Element
+
+from bas_metadata_library import scan_record
+from bas_metadata_library.decode_cache import get_decode_cache
+from bas_metadata_library.standards.iso_19115_common import GMD, NSMAP
+from bas_metadata_library.standards.iso_19115_common.mapping import (
+    ASSOCIATION_TYPE,
+    CHARACTER_SET,
+    CITATION,
+    FORMAT,
+    HIERARCHY_LEVEL,
+    IDENTIFIER,
+    INITIATIVE_TYPE,
+    KEYWORDS_TYPE,
+    LANGUAGE,
+    LEGAL_CONSTRAINT,
+    MAINTENANCE_INFORMATION,
+    METADATA_STANDARD,
+    REFERENCE_SYSTEM_IDENTIFIER,
+    RESPONSIBLE_PARTY,
+    SPATIAL_REPRESENTATION_TYPE,
+    STATUS,
+    TRANSFER_OPTION,
+    _children,
+    _tags,
+    _texts,
+)
+from bas_metadata_library.standards.iso_19115_common.utils import (
+    condense_contacts_roles,
+    decode_date_string,
+    flatten_distribution_distributors,
+    format_numbers_consistently,
+    match_distribution_options,
+)
+
+_citation_keys = ("title", "dates", "edition", "identifiers", "contact", "series", "other_citation_details")
+_data_quality_keys = ("domain_consistency", "lineage")
+
+
+def _select(nodes: list[Element], path: str) -> list[Element]:
+    """Select child elements along a path of prefixed element names (e.g. 'gmd:title/gco:CharacterString')."""
+    return _children(nodes, *_tags(path))
+
+
+def _attributes(nodes: list[Element], name: str) -> list[str]:
+    """Values of an attribute, optionally prefixed (e.g. 'xlink:href'), for a set of elements."""
+    if ":" in name:
+        prefix, local_name = name.split(":")
+        name = f"{{{NSMAP[prefix]}}}{local_name}"
+    return [node.get(name) for node in nodes if node.get(name) is not None]
+
+
+def _nth(nodes: list[Element], index: int) -> list[Element]:
+    """Element at 1-based index of a set of elements, as per the XPath `(nodes)[index]` expression."""
+    return nodes[index - 1 : index]
+
+
+def _wanted(keys: set[str] | None, *names: str) -> bool:
+    """Whether any of a set of configuration keys are needed, where `keys` is `None` if all keys are needed."""
+    return keys is None or not keys.isdisjoint(names)
+
+
+def _projection(fields: list[str]) -> dict:
+    """
+    Convert a list of configuration paths into a tree of keys.
+
+    Paths use '.' to separate keys (e.g. 'identification.title'). Keys for which all values are needed are `None`.
+    E.g. ['file_identifier', 'identification.title'] becomes {'file_identifier': None, 'identification': {'title': None}}.
+    """
+    projection = {}
+    for field in fields:
+        node = projection
+        *parents, leaf = field.split(".")
+        for key in parents:
+            if key in node and node[key] is None:
+                break
+            node = node.setdefault(key, {})
+        else:
+            node[leaf] = None
+    return projection
+
+
+def _project(value: Any, projection: dict | None) -> Any:  # noqa: ANN401
+    """Select values from a (partial) configuration using a tree of keys (see `_projection()`), omitting empty values."""
+    if projection is None or not isinstance(value, dict):
+        return value
+
+    _ = {}
+    for key, _projection_ in projection.items():
+        if key not in value:
+            continue
+        _value = _project(value[key], _projection_)
+        if _value != {}:
+            _[key] = _value
+    return _
+
+
+def decode_record(record: Element, root_tag: str, fields: list[str] | None = None, digest: str | None = None) -> dict:
+    """
+    Decode an ISO 19115 record into a record configuration in a single pass.
+
+    If set, only the values for `fields` are decoded, where each field is a path of configuration keys separated by '.'
+    (e.g. `['file_identifier', 'identification.title']`). Sections not needed for these fields are not decoded, and
+    values not needed are omitted.
+
+    If a decode cache is set (see `decode_cache.set_decode_cache()`) and the `digest` of the record is given, cached
+    configurations are returned for records already decoded, and other configurations added to the cache.
+
+    :type record: Element
+    :param record: root element of a record (which may be embedded in another document), or any element in a record
+    :type root_tag: str
+    :param root_tag: expected tag of the root element in Clark notation (e.g. '{http://...gmd}MD_Metadata')
+    :type fields: list[str]
+    :param fields: optional configuration paths to decode
+    :type digest: str
+    :param digest: optional digest of the record, as bytes (see `decode_cache.record_digest()`)
+    :return: record configuration
+    """
+    cache = get_decode_cache() if digest is not None else None
+    if cache is not None:
+        cache_key = cache.key(digest=digest, root_tag=root_tag, fields=fields)
+        config = cache.get(cache_key)
+        if config is not None:
+            return config
+        config = _decode_record(record=record, root_tag=root_tag, fields=fields)
+        cache.add(cache_key, config)
+        return config
+
+    return _decode_record(record=record, root_tag=root_tag, fields=fields)
+
+
+def _decode_record(record: Element, root_tag: str, fields: list[str] | None = None) -> dict:
+    projection = None if fields is None else _projection(fields)
+    sections = decode_sections(record=record, root_tag=root_tag, projection=projection)
+
+    _ = {}
+    for key, decode_section in sections.items():
+        if projection is not None and key not in projection:
+            continue
+        value = decode_section()
+        if value is None:
+            continue
+        if projection is not None:
+            value = _project(value, projection[key])
+            if value == {}:
+                continue
+        _[key] = value
+
+    return _
+
+
+def decode_sections(record: Element, root_tag: str, projection: dict | None = None) -> dict[str, Callable[[], Any]]:
+    """
+    Decoders for each top-level section of a record configuration (e.g. 'identification'), in configuration order.
+
+    Each decoder takes no arguments and returns the value of its section, or `None` if the section is empty and so
+    would be omitted from the record configuration. Decoders are independent of each other, so sections can be decoded
+    separately, and only when needed (see `decode_record()` for decoding all sections).
+
+    If set, decoders may skip values not needed for a tree of configuration keys (see `decode_record()` `fields`).
+
+    :type record: Element
+    :param record: root element of a record (which may be embedded in another document), or any element in a record
+    :type root_tag: str
+    :param root_tag: expected tag of the root element in Clark notation (e.g. '{http://...gmd}MD_Metadata')
+    :type projection: dict
+    :param projection: optional tree of configuration keys needed
+    :return: section decoders, indexed by configuration key
+    """
+    root = record if record.tag == root_tag else record.getroottree().getroot()
+    nodes = [root] if root.tag == root_tag else []
+    identification_keys = None
+    if projection is not None and isinstance(projection.get("identification"), dict):
+        identification_keys = set(projection["identification"])
+
+    return {
+        "file_identifier": partial(_file_identifier_section, nodes),
+        "metadata": partial(_metadata_section, nodes),
+        "hierarchy_level": partial(_hierarchy_level_section, nodes),
+        "reference_system_info": partial(_reference_system_info_section, nodes),
+        "identification": partial(_identification_section, nodes, identification_keys),
+        "distribution": partial(_distribution_section, nodes),
+    }
+
+
+@dataclass(frozen=True)
+class RecordHeader:
+    """
+    Summary of the header of a record, for detecting whether a record has changed.
+
+    Values are as they would be decoded into a record configuration (e.g. `date_stamp` as `metadata.date_stamp`), or
+    `None` where not set (or not scanned, in the case of `maintenance`).
+    """
+
+    __slots__ = ("date_stamp", "file_identifier", "hierarchy_level", "maintenance")
+
+    file_identifier: str | None
+    hierarchy_level: str | None
+    date_stamp: date | None
+    maintenance: dict | None
+
+
+def scan_record_header(
+    record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO, root_tag: str, maintenance: bool = True
+) -> RecordHeader:
+    """
+    Decode the file identifier, hierarchy level, date stamp and (optionally) metadata maintenance of a record.
+
+    Records are scanned incrementally, without decoding other elements, and parsing stops once the last of these
+    elements has been parsed (see `scan_record()`).
+
+    The metadata maintenance element comes after the identification, distribution and data quality elements in a
+    record. If `maintenance` is not set, parsing instead stops after the date stamp, so only the start of a record
+    (typically the first few kilobytes) is read.
+
+    :type record: str | bytes | bytearray | memoryview | mmap | Path | BinaryIO
+    :param record: XML record
+    :type root_tag: str
+    :param root_tag: expected tag of the root element in Clark notation (e.g. '{http://...gmd}MD_Metadata')
+    :type maintenance: bool
+    :param maintenance: whether to decode the metadata maintenance element
+    :return: record header
+    """
+    tags = [GMD.fileIdentifier, GMD.hierarchyLevel, GMD.dateStamp]
+    if maintenance:
+        tags.append(GMD.metadataMaintenance)
+
+    root = scan_record(record=record, tags=tags, until=tags[-1])
+    nodes = [root] if root.tag == root_tag else []
+
+    _maintenance = None
+    if maintenance:
+        _maintenance = MAINTENANCE_INFORMATION.decode(_select(nodes, "gmd:metadataMaintenance")) or None
+
+    return RecordHeader(
+        file_identifier=_file_identifier_section(nodes),
+        hierarchy_level=_hierarchy_level_section(nodes),
+        date_stamp=_date_stamp_config(nodes),
+        maintenance=_maintenance,
+    )
+
+
+def _file_identifier_section(nodes: list[Element]) -> str | None:
+    value = _texts(_select(nodes, "gmd:fileIdentifier/gco:CharacterString"))
+    if len(value) == 1 and value[0] != "":
+        return value[0]
+    return None
+
+
+def _metadata_section(nodes: list[Element]) -> dict | None:  # noqa: C901 see uk-pdc/metadata-infrastructure/metadata-library#175 for more information
+    _ = {}
+
+    _language = LANGUAGE.decode(nodes)
+    if _language != "":
+        if "metadata" not in _:
+            _["metadata"] = {}
+        _["metadata"]["language"] = _language
+
+    _character_set = CHARACTER_SET.decode(nodes)
+    if _character_set != "":
+        if "metadata" not in _:
+            _["metadata"] = {}
+        _["metadata"]["character_set"] = _character_set
+
+    if _hierarchy_level_section(nodes) is not None and "metadata" not in _:
+        _["metadata"] = {}
+
+    _contacts = []
+    for contact in _select(nodes, "gmd:contact"):
+        _contact = RESPONSIBLE_PARTY.decode([contact])
+        if bool(_contact):
+            _contacts.append(_contact)
+    if len(_contacts) > 0:
+        if "metadata" not in _:
+            _["metadata"] = {}
+        _["metadata"]["contacts"] = _contacts
+
+    _date_stamp = _date_stamp_config(nodes)
+    if _date_stamp is not None:
+        _["metadata"]["date_stamp"] = _date_stamp
+
+    _metadata_standard = METADATA_STANDARD.decode(nodes)
+    if bool(_metadata_standard):
+        _["metadata"]["metadata_standard"] = _metadata_standard
+
+    _metadata_constraints = []
+    for constraint in _select(nodes, "gmd:metadataConstraints"):
+        _constraint = LEGAL_CONSTRAINT.decode([constraint])
+        if bool(_constraint):
+            _metadata_constraints.append(_constraint)
+    if len(_metadata_constraints) > 0:
+        _["metadata"]["constraints"] = _metadata_constraints
+
+    _metadata_maintenance = MAINTENANCE_INFORMATION.decode(_select(nodes, "gmd:metadataMaintenance"))
+    if bool(_metadata_maintenance):
+        _["metadata"]["maintenance"] = _metadata_maintenance
+
+    return _.get("metadata")
+
+
+def _hierarchy_level_section(nodes: list[Element]) -> str | None:
+    _hierarchy_level = HIERARCHY_LEVEL.decode(nodes)
+    if _hierarchy_level != "":
+        return _hierarchy_level
+    return None
+
+
+def _reference_system_info_section(nodes: list[Element]) -> dict | None:
+    _reference_system_identifier = REFERENCE_SYSTEM_IDENTIFIER.decode(nodes)
+    if bool(_reference_system_identifier):
+        return _reference_system_identifier
+    return None
+
+
+def _identification_section(nodes: list[Element], keys: set[str] | None = None) -> dict | None:
+    _ = {}
+
+    _data_identification = _data_identification_config(nodes, keys)
+    if bool(_data_identification):
+        if "identification" not in _:
+            _["identification"] = {}
+        _["identification"] = {**_["identification"], **_data_identification}
+
+    if _wanted(keys, *_data_quality_keys):
+        _data_quality = _data_quality_config(nodes)
+        if bool(_data_quality):
+            # where only some keys are needed, data identification values may have been skipped
+            _identification = _["identification"] if keys is None else _.get("identification", {})
+            _["identification"] = {**_identification, **_data_quality}
+
+    if "identification" in _ and "contacts" in _["identification"]:
+        _["identification"]["contacts"] = condense_contacts_roles(contacts=_["identification"]["contacts"])
+
+    return _.get("identification")
+
+
+def _distribution_section(nodes: list[Element]) -> list | None:
+    _data_distribution = _data_distribution_config(nodes)
+    if len(_data_distribution) > 0:
+        return _data_distribution
+    return None
+
+
+def _date_stamp_config(nodes: list[Element]) -> date | None:
+    value = _texts(_select(nodes, "gmd:dateStamp/gco:Date"))
+    if len(value) == 1:
+        try:
+            return decode_date_string(date_datetime=value[0])["date"]
+        except ValueError:
+            msg = "Datestamp could not be parsed as an ISO date value"
+            raise RuntimeError(msg) from None
+    return None
+
+
+def _data_identification_config(  # noqa: C901 see uk-pdc/metadata-infrastructure/metadata-library#175 for more information
+    nodes: list[Element], keys: set[str] | None = None
+) -> dict:
+    _ = {}
+    identification = _select(nodes, "gmd:identificationInfo/gmd:MD_DataIdentification")
+
+    if _wanted(keys, *_citation_keys):
+        _citation_ = CITATION.decode(_select(identification, "gmd:citation"))
+        if bool(_citation_):
+            _ = {**_, **_citation_}
+
+    for path, key in [("gmd:abstract", "abstract"), ("gmd:purpose", "purpose"), ("gmd:credit", "credit")]:
+        if not _wanted(keys, key):
+            continue
+        value = _character_string_config(_select(identification, path))
+        if value is not None:
+            _[key] = value
+
+    if _wanted(keys, "status"):
+        _status = STATUS.decode(identification)
+        if _status != "":
+            _["status"] = _status
+
+    if _wanted(keys, "contacts"):
+        _contacts = []
+        for contact in _select(identification, "gmd:pointOfContact"):
+            _contact = RESPONSIBLE_PARTY.decode([contact])
+            if bool(_contact):
+                _contacts.append(_contact)
+        if len(_contacts) > 0:
+            _["contacts"] = _contacts
+
+    if _wanted(keys, "maintenance"):
+        _identification_maintenance = MAINTENANCE_INFORMATION.decode(_select(identification, "gmd:resourceMaintenance"))
+        if bool(_identification_maintenance):
+            _["maintenance"] = _identification_maintenance
+
+    if _wanted(keys, "graphic_overviews"):
+        _graphic_overviews = []
+        for graphic_overview in _select(identification, "gmd:graphicOverview"):
+            _graphic_overview = _graphic_overview_config([graphic_overview])
+            if bool(_graphic_overview):
+                _graphic_overviews.append(_graphic_overview)
+        if len(_graphic_overviews) > 0:
+            _["graphic_overviews"] = _graphic_overviews
+
+    if _wanted(keys, "resource_formats"):
+        _resource_formats = []
+        for resource_format in _select(identification, "gmd:resourceFormat"):
+            _resource_format = FORMAT.decode([resource_format])
+            if bool(_resource_format):
+                _resource_formats.append(_resource_format)
+        if len(_resource_formats) > 0:
+            _["resource_formats"] = _resource_formats
+
+    if _wanted(keys, "keywords"):
+        _descriptive_keywords = []
+        for keywords in _select(identification, "gmd:descriptiveKeywords"):
+            _keywords = _descriptive_keywords_config([keywords])
+            if bool(_keywords):
+                _descriptive_keywords.append(_keywords)
+        if len(_descriptive_keywords) > 0:
+            _["keywords"] = _descriptive_keywords
+
+    if _wanted(keys, "constraints"):
+        _resource_constraints = []
+        for constraint in _select(identification, "gmd:resourceConstraints"):
+            _constraint = LEGAL_CONSTRAINT.decode([constraint])
+            if bool(_constraint):
+                _resource_constraints.append(_constraint)
+        if len(_resource_constraints) > 0:
+            _["constraints"] = _resource_constraints
+
+    if _wanted(keys, "aggregations"):
+        _resource_aggregations = []
+        for aggregation in _select(identification, "gmd:aggregationInfo"):
+            _aggregation = _aggregation_config([aggregation])
+            if bool(_aggregation):
+                _resource_aggregations.append(_aggregation)
+        if len(_resource_aggregations) > 0:
+            _["aggregations"] = _resource_aggregations
+
+    if _wanted(keys, "spatial_representation_type"):
+        _spatial_representation_type = SPATIAL_REPRESENTATION_TYPE.decode(identification)
+        if _spatial_representation_type != "":
+            _["spatial_representation_type"] = _spatial_representation_type
+
+    if _wanted(keys, "spatial_resolution"):
+        _spatial_resolution = _spatial_resolution_config(_select(identification, "gmd:spatialResolution"))
+        if _spatial_resolution is not None:
+            _["spatial_resolution"] = _spatial_resolution
+
+    if _wanted(keys, "language"):
+        _language = LANGUAGE.decode(identification)
+        if _language != "":
+            _["language"] = _language
+
+    if _wanted(keys, "character_set"):
+        _character_set = CHARACTER_SET.decode(identification)
+        if _character_set != "":
+            _["character_set"] = _character_set
+
+    if _wanted(keys, "topics"):
+        _topic_categories = []
+        for topic in _select(identification, "gmd:topicCategory"):
+            _topic_category = _topic_category_config([topic])
+            if _topic_category is not None:
+                _topic_categories.append(_topic_category)
+        if len(_topic_categories) > 0:
+            _["topics"] = _topic_categories
+
+    if _wanted(keys, "extents"):
+        _extents = [_extent_config([extent]) for extent in _select(identification, "gmd:extent")]
+        if len(_extents) > 0:
+            _["extents"] = _extents
+
+    if _wanted(keys, "supplemental_information"):
+        _supplemental_information = _character_string_config(_select(identification, "gmd:supplementalInformation"))
+        if _supplemental_information is not None:
+            _["supplemental_information"] = _supplemental_information
+
+    return _
+
+
+def _character_string_config(nodes: list[Element]) -> str | None:
+    value = _texts(_select(nodes, "gco:CharacterString"))
+    if len(value) == 1 and value[0] != "":
+        return value[0]
+    return None
+
+
+def _spatial_resolution_config(nodes: list[Element]) -> int | float | None:
+    value = _texts(
+        _select(
+            nodes,
+            "gmd:MD_Resolution/gmd:equivalentScale/gmd:MD_RepresentativeFraction/gmd:denominator/gco:Integer",
+        )
+    )
+    if len(value) == 1:
+        return format_numbers_consistently(value[0])
+    return None
+
+
+def _topic_category_config(nodes: list[Element]) -> str | None:
+    value = _texts(_select(nodes, "gmd:MD_TopicCategoryCode"))
+    if len(value) == 1 and value[0] != "":
+        return value[0]
+    return None
+
+
+def _graphic_overview_config(nodes: list[Element]) -> dict:
+    _ = {}
+    graphic = _select(nodes, "gmd:MD_BrowseGraphic")
+
+    identifier_value = _attributes(graphic, "id")
+    if len(identifier_value) == 1:
+        _["identifier"] = identifier_value[0]
+
+    for path, key in [
+        ("gmd:fileName/gco:CharacterString", "href"),
+        ("gmd:fileDescription/gco:CharacterString", "description"),
+        ("gmd:fileType/gco:CharacterString", "mime_type"),
+    ]:
+        value = _texts(_select(graphic, path))
+        if len(value) == 1:
+            _[key] = value[0]
+
+    return _
+
+
+def _descriptive_keywords_config(nodes: list[Element]) -> dict:
+    _ = {}
+    keywords = _select(nodes, "gmd:MD_Keywords")
+
+    _terms = [{"term": term} for term in _texts(_select(keywords, "gmd:keyword/gco:CharacterString"))]
+    for term in _select(keywords, "gmd:keyword/gmx:Anchor"):
+        _term = {}
+        _term_value = _texts([term])
+        if len(_term_value) > 0:
+            _term["term"] = _term_value[0]
+        _term_href = _attributes([term], "xlink:href")
+        if len(_term_href) > 0:
+            _term["href"] = _term_href[0]
+        if bool(_term):
+            _terms.append(_term)
+    if bool(_terms):
+        _["terms"] = _terms
+
+    _descriptive_keywords_type = KEYWORDS_TYPE.decode(keywords)
+    if _descriptive_keywords_type != "":
+        _["type"] = _descriptive_keywords_type
+
+    _thesaurus = CITATION.decode(_select(keywords, "gmd:thesaurusName"))
+    if bool(_thesaurus):
+        _["thesaurus"] = _thesaurus
+
+    return _
+
+
+def _aggregation_config(nodes: list[Element]) -> dict:
+    _ = {}
+    aggregation = _select(nodes, "gmd:MD_AggregateInformation")
+
+    _association_type = ASSOCIATION_TYPE.decode(aggregation)
+    if _association_type != "":
+        _["association_type"] = _association_type
+
+    _initiative_type = INITIATIVE_TYPE.decode(aggregation)
+    if _initiative_type != "":
+        _["initiative_type"] = _initiative_type
+
+    _identifier = IDENTIFIER.decode(_select(aggregation, "gmd:aggregateDataSetIdentifier"))
+    if bool(_identifier):
+        _["identifier"] = _identifier
+
+    return _
+
+
+def _extent_config(nodes: list[Element]) -> dict:
+    _ = {}
+    extent = _select(nodes, "gmd:EX_Extent")
+
+    identifier_value = _attributes(extent, "id")
+    if len(identifier_value) == 1:
+        _["identifier"] = identifier_value[0]
+
+    _geographic_extent = _geographic_extent_config(extent)
+    if bool(_geographic_extent):
+        _["geographic"] = _geographic_extent
+
+    _temporal_extent = _temporal_extent_config(extent)
+    if bool(_temporal_extent):
+        _["temporal"] = _temporal_extent
+
+    _vertical_extent = _vertical_extent_config(_select(extent, "gmd:verticalElement"))
+    if bool(_vertical_extent):
+        _["vertical"] = _vertical_extent
+
+    return _
+
+
+def _geographic_extent_config(nodes: list[Element]) -> dict:
+    _ = {}
+    geographic = _select(nodes, "gmd:geographicElement")
+
+    _bounding_box = _bounding_box_config(geographic)
+    if bool(_bounding_box):
+        _["bounding_box"] = _bounding_box
+
+    _identifier = IDENTIFIER.decode(_select(geographic, "gmd:EX_GeographicDescription/gmd:geographicIdentifier"))
+    if bool(_identifier):
+        _["identifier"] = _identifier
+
+    return _
+
+
+def _bounding_box_config(nodes: list[Element]) -> dict:
+    _ = {}
+    bounding_box = _select(nodes, "gmd:EX_GeographicBoundingBox")
+
+    for path, key in [
+        ("gmd:westBoundLongitude/gco:Decimal", "west_longitude"),
+        ("gmd:eastBoundLongitude/gco:Decimal", "east_longitude"),
+        ("gmd:southBoundLatitude/gco:Decimal", "south_latitude"),
+        ("gmd:northBoundLatitude/gco:Decimal", "north_latitude"),
+    ]:
+        value = _texts(_select(bounding_box, path))
+        if len(value) == 1:
+            _[key] = float(value[0])
+
+    return _
+
+
+def _temporal_extent_config(nodes: list[Element]) -> dict:
+    _ = {}
+    period = _select(nodes, "gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod")
+
+    for path, key in [("gml:beginPosition", "start"), ("gml:endPosition", "end")]:
+        value = _texts(_select(period, path))
+        if len(value) == 1:
+            if "period" not in _:
+                _["period"] = {}
+            try:
+                _["period"][key] = decode_date_string(date_datetime=value[0])
+            except ValueError:
+                msg = "Date/datetime could not be parsed as an ISO date value"
+                raise RuntimeError(msg) from None
+
+    return _
+
+
+def _vertical_extent_config(nodes: list[Element]) -> dict:
+    _ = {}
+    vertical_extent = _select(nodes, "gmd:EX_VerticalExtent")
+
+    for path, key in [("gmd:minimumValue/gco:Real", "minimum"), ("gmd:maximumValue/gco:Real", "maximum")]:
+        value = _texts(_select(vertical_extent, path))
+        if len(value) == 1:
+            _[key] = float(value[0])
+
+    _vertical_crs = _vertical_crs_config(vertical_extent)
+    if bool(_vertical_crs):
+        _ = {**_, **_vertical_crs}
+
+    return _
+
+
+def _vertical_crs_config(nodes: list[Element]) -> dict:
+    _ = {}
+    crs = _select(nodes, "gmd:verticalCRS/gml:VerticalCRS")
+
+    identifier_value = _attributes(crs, "gml:id")
+    if len(identifier_value) == 1:
+        _["identifier"] = identifier_value[0]
+
+    for path, key in [("gml:identifier", "code"), ("gml:name", "name"), ("gml:remarks", "remarks")]:
+        value = _texts(_select(crs, path))
+        if len(value) == 1:
+            _[key] = value[0]
+
+    domain_of_validity_href = _attributes(_select(crs, "gml:domainOfValidity"), "xlink:href")
+    if len(domain_of_validity_href) == 1:
+        _["domain_of_validity"] = {"href": domain_of_validity_href[0]}
+
+    scope_value = _texts(_select(crs, "gml:scope"))
+    if len(scope_value) == 1:
+        _["scope"] = scope_value[0]
+
+    for path, key in [("gml:verticalCS", "vertical_cs"), ("gml:verticalDatum", "vertical_datum")]:
+        value = _attributes(_select(crs, path), "xlink:href")
+        if len(value) == 1:
+            _[key] = {"href": value[0]}
+
+    return _
+
+
+def _data_distribution_config(nodes: list[Element]) -> list:
+    _ = []
+    distributions = _select(nodes, "gmd:distributionInfo/gmd:MD_Distribution")
+
+    # as per the XPath 'gmd:MD_Distribution/gmd:distributor[n]', the nth distributor in each distribution
+    distributors = [_select([distribution], "gmd:distributor") for distribution in distributions]
+    for distribution_index in range(1, sum(len(_distributors) for _distributors in distributors) + 1):
+        distributor = [
+            _distributors[distribution_index - 1]
+            for _distributors in distributors
+            if len(_distributors) >= distribution_index
+        ]
+        _distribution = _distribution_config(_select(distributor, "gmd:MD_Distributor"))
+        if bool(_distribution):
+            _.append(_distribution)
+
+    # distributions are grouped by distributor in ISO but should not be in configs
+    return flatten_distribution_distributors(distributions=_)
+
+
+def _distribution_config(nodes: list[Element]) -> dict:
+    _ = {}
+
+    _distributor = RESPONSIBLE_PARTY.decode(_select(nodes, "gmd:distributorContact"))
+    if bool(_distributor):
+        _["distributor"] = _distributor
+
+    _distribution_formats = []
+    _transfer_options = []
+    for distribution_formats in _positional_children(nodes, "gmd:distributorFormat"):
+        _distribution_format = FORMAT.decode(distribution_formats)
+        if bool(_distribution_format):
+            _distribution_formats.append(_distribution_format)
+    for transfer_options in _positional_children(nodes, "gmd:distributorTransferOptions"):
+        _transfer_option = TRANSFER_OPTION.decode(transfer_options)
+        if bool(_transfer_option):
+            _transfer_options.append(_transfer_option)
+
+    _["distribution_options"] = match_distribution_options(
+        distribution_formats=_distribution_formats, transfer_options=_transfer_options
+    )
+
+    return _
+
+
+def _positional_children(nodes: list[Element], path: str) -> list[list[Element]]:
+    """
+    Child elements of a set of elements, grouped by their position within each element.
+
+    Equivalent to the XPath 'nodes/path[index]' for each index in turn, with the children of each element selected once.
+    """
+    children = [_select([node], path) for node in nodes]
+    return [[child for child in group if child is not None] for group in zip_longest(*children)]
+
+
+def _data_quality_config(nodes: list[Element]) -> dict:
+    _ = {}
+    data_quality = _select(nodes, "gmd:dataQualityInfo/gmd:DQ_DataQuality")
+
+    _domain_consistency = []
+    reports = _select(data_quality, "gmd:report")
+    domain_reports = [report for report in reports if len(_select([report], "gmd:DQ_DomainConsistency")) > 0]
+    for domain_index in range(1, len(_select(reports, "gmd:DQ_DomainConsistency")) + 1):
+        _domain = _domain_consistency_config(_nth(domain_reports, domain_index))
+        if bool(_domain):
+            _domain_consistency.append(_domain)
+    if len(_domain_consistency) > 0:
+        _["domain_consistency"] = _domain_consistency
+
+    _lineage = _lineage_config(_select(data_quality, "gmd:lineage"))
+    if bool(_lineage):
+        _["lineage"] = _lineage
+
+    return _
+
+
+def _lineage_config(nodes: list[Element]) -> dict[str, str]:
+    _ = {}
+    lineage = _select(nodes, "gmd:LI_Lineage")
+
+    statement_value = _texts(_select(lineage, "gmd:statement/gco:CharacterString"))
+    if len(statement_value) == 1:
+        _["statement"] = statement_value[0]
+
+    _process_steps = []
+    for step in _select(lineage, "gmd:processStep"):
+        _process_step = _process_step_config([step])
+        if bool(_process_step):
+            _process_steps.append(_process_step)
+    if len(_process_steps) > 0:
+        _["process_steps"] = _process_steps
+
+    _sources = []
+    for source in _select(lineage, "gmd:source"):
+        _source = _source_config([source])
+        if bool(_source):
+            _sources.append(_source)
+    if len(_sources) > 0:
+        _["sources"] = _sources
+
+    return _
+
+
+def _process_step_config(nodes: list[Element]) -> dict[str, str]:
+    _ = {}
+    step = _select(nodes, "gmd:LI_ProcessStep")
+
+    description_value = _texts(_select(step, "gmd:description/gco:CharacterString"))
+    if len(description_value) == 1:
+        _["description"] = description_value[0]
+
+    rationale_value = _texts(_select(step, "gmd:rationale/gco:CharacterString"))
+    if len(rationale_value) == 1:
+        _["rationale"] = rationale_value[0]
+
+    date_value = _texts(_select(step, "gmd:dateTime/gco:DateTime"))
+    if len(date_value) == 1:
+        _["date"] = decode_date_string(date_datetime=date_value[0])["date"]  # unwrap datetime value
+
+    _processors = []
+    for processor in _select(step, "gmd:processor"):
+        _processor = RESPONSIBLE_PARTY.decode([processor])
+        if bool(_processor):
+            _processors.append(_processor)
+    if len(_processors) > 0:
+        _processors = condense_contacts_roles(contacts=_processors)
+        _["processors"] = _processors
+
+    _sources = []
+    for source in _select(step, "gmd:source"):
+        _source = _source_config([source])
+        if bool(_source):
+            _sources.append(_source)
+    if len(_sources) > 0:
+        _["sources"] = _sources
+
+    return _
+
+
+def _source_config(nodes: list[Element]) -> dict:
+    _ = {}
+    source = _select(nodes, "gmd:LI_Source")
+
+    description_value = _texts(_select(source, "gmd:description/gco:CharacterString"))
+    if len(description_value) == 1:
+        _["description"] = description_value[0]
+
+    _citation_ = CITATION.decode(_select(source, "gmd:sourceCitation"))
+    if bool(_citation_):
+        _.update(**_citation_)
+
+    _source_steps = []
+    for step in _select(source, "gmd:sourceStep"):
+        _source_step = _process_step_config([step])
+        if bool(_source_step):
+            _source_steps.append(_source_step)
+    if len(_source_steps) > 0:
+        _["source_steps"] = _source_steps
+
+    return _
+
+
+def _domain_consistency_config(nodes: list[Element]) -> dict:
+    _ = {}
+    result = _select(nodes, "gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult")
+
+    _specification = CITATION.decode(_select(result, "gmd:specification"))
+    if bool(_specification):
+        _["specification"] = _specification
+
+    explanation_value = _texts(_select(result, "gmd:explanation/gco:CharacterString"))
+    if len(explanation_value) == 1:
+        _["explanation"] = explanation_value[0]
+
+    result_value = _texts(_select(result, "gmd:pass/gco:Boolean"))
+    if len(result_value) == 1:
+        _["result"] = bool(result_value[0])
+
+    return _
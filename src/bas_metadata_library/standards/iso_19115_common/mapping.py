@@ -0,0 +1,1079 @@
+"""
+Declarative mappings between record configurations and ISO 19115 elements.
+
+Regular elements (code lists, character strings, anchors, dates, and groups or repeated sets of these) are described
+once here, as a mapping between configuration keys and element paths, rather than as hand-written encoding and
+decoding steps. Each mapping is compiled (by `compile_mapping()`), when this module is imported, into a codec with an
+encoder and decoder closure specialised for that element (e.g. with tags resolved into Clark notation). Groups are
+compiled recursively, with a codec for each member.
+
+Irregular elements (e.g. responsible parties, where some values depend on others) are encoded and decoded by
+hand-written functions in this module instead (see `Custom`), so that they can still be used as members of groups.
+
+Codecs are used by element classes (when encoding) and the single pass decoder (when decoding), so that both
+directions stay in sync, and without creating an element class instance for each element.
+
+Encoders take a parent element and the (partial) configuration containing the mapped key, and add the mapped element
+to the parent. Decoders take the set of parent elements (node-set) and return the value for the mapped key. Mappings
+without a key (anchors, dates, custom elements and some groups) instead encode and decode several keys in the
+containing configuration, with decoders returning a dict of these values.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import lru_cache
+from hashlib import sha1
+from json import JSONDecodeError
+from typing import Any, Callable, ClassVar, Union
+
+from lxml.etree import Element, SubElement
+
+from bas_metadata_library.standards.iso_19115_common import GCO, GMD, GMX, NSMAP, XLINK
+from bas_metadata_library.standards.iso_19115_common.utils import (
+    decode_date_string,
+    encode_date_string,
+    format_numbers_consistently,
+)
+
+
+@dataclass(frozen=True)
+class CodeList:
+    """
+    Code list element, e.g. `gmd:language/gmd:LanguageCode`.
+
+    Values are encoded where set to one of the code list `values` (the containing element is always encoded). Values
+    are decoded where exactly one code is found for the code list, otherwise as an empty string.
+    """
+
+    key: str
+    element: str
+    code: str
+    code_list: str
+    values: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CharacterString:
+    """
+    Character string element, e.g. `gmd:name/gco:CharacterString`.
+
+    The element can be a path of elements (e.g. `gmd:phone/gmd:CI_Telephone/gmd:voice`), and the value element can be
+    an element other than a character string (e.g. `gmd:URL`). Values are decoded where exactly one value is found (or
+    the first value if `first` is set), otherwise as `None`.
+    """
+
+    key: str
+    element: str
+    value: str = "gco:CharacterString"
+    first: bool = False
+
+
+@dataclass(frozen=True)
+class Anchor:
+    """
+    Character string or anchor element, e.g. `gmd:code/gco:CharacterString` or `gmd:code/gmx:Anchor`.
+
+    Anchors are used where a URL is set in the `href` key, with a title if set in the `title` key (if any), otherwise
+    character strings are used. Values are decoded where exactly one value is found (or the first value if `first` is
+    set). Elements are only encoded where the `value` key is set.
+    """
+
+    element: str
+    value: str = "value"
+    href: str = "href"
+    title: str | None = None
+    first: bool = False
+
+    key: ClassVar[None] = None
+
+
+@dataclass(frozen=True)
+class Date:
+    """
+    Date or date time element, e.g. `gmd:date/gco:Date` or `gmd:date/gco:DateTime`.
+
+    Values are encoded from the `date` and (optional) `date_precision` keys, and decoded where exactly one value is
+    found. Elements are only encoded where the `date` key is set.
+    """
+
+    element: str
+
+    key: ClassVar[None] = None
+
+
+@dataclass(frozen=True)
+class Group:
+    """
+    Element, or path of elements, containing other mapped elements, e.g. `gmd:series/gmd:CI_Series`.
+
+    Groups are encoded from, and decoded as, a dict containing values for members set in a configuration, or decoded
+    as non-empty values. Where `key` is set, this dict is the value of this key in the containing configuration,
+    otherwise values are encoded from, and decoded into, the containing configuration. Where `element` isn't set,
+    members are encoded into, and decoded from, the parent element.
+    """
+
+    element: str | None
+    members: tuple[ElementMapping, ...]
+    key: str | None = None
+
+
+@dataclass(frozen=True)
+class Repeated:
+    """
+    Repeated element containing another mapped element, e.g. `gmd:identifier` containing `gmd:RS_Identifier`.
+
+    Repeated elements are encoded from, and decoded as, a list of values, skipping empty values when decoded. Where
+    `index` is set, values are instead a dict, indexed by the value of the `index` key in each value (e.g. citation
+    dates indexed by date type), or an empty string if this key can't be decoded.
+    """
+
+    key: str
+    element: str
+    item: ElementMapping
+    index: str | None = None
+
+
+@dataclass(frozen=True)
+class Custom:
+    """
+    Irregular element, encoded and decoded by hand-written functions, e.g. `gmd:CI_ResponsibleParty`.
+
+    Functions take the same arguments as the encoder and decoder of a codec, encoding from, and decoding into, the
+    containing configuration (as for a `Group` without a `key`).
+    """
+
+    encode: Callable[[Element, dict], None]
+    decode: Callable[[list[Element]], dict]
+
+    key: ClassVar[None] = None
+
+
+ElementMapping = Union[CodeList, CharacterString, Anchor, Date, Group, Repeated, Custom]
+
+
+@dataclass(frozen=True)
+class Codec:
+    """
+    Compiled encoder and decoder for an element mapping.
+
+    For code lists, `tags` are the element and code element tags, in Clark notation, resolved when compiled.
+    """
+
+    mapping: ElementMapping
+    encode: Callable[[Element, dict], None]
+    decode: Callable[[list[Element]], Any]
+    tags: tuple[str, ...] = ()
+
+
+@lru_cache(maxsize=None)
+def _tags(path: str) -> tuple[str, ...]:
+    """
+    Convert a path of prefixed element names (e.g. 'gmd:series/gmd:CI_Series') to Clark notation tags.
+
+    Paths are converted once, as the single pass decoder selects elements using paths for each record.
+    """
+    tags = []
+    for name in path.split("/"):
+        prefix, local_name = name.split(":")
+        tags.append(f"{{{NSMAP[prefix]}}}{local_name}")
+    return tuple(tags)
+
+
+def _add(parent: Element, tags: tuple[str, ...]) -> Element:
+    """Add a path of elements to a parent element, returning the last element."""
+    for tag in tags:
+        parent = SubElement(parent, tag)
+    return parent
+
+
+def _children(nodes: list[Element], *tags: str) -> list[Element]:
+    """Select child elements along a path of tags from a set of elements, in document order."""
+    for tag in tags:
+        nodes = [child for node in nodes for child in node.iterchildren(tag)]
+    return nodes
+
+
+def _texts(nodes: list[Element]) -> list[str]:
+    """Text nodes of a set of elements, as per the XPath `text()` function."""
+    texts = []
+    for node in nodes:
+        if node.text is not None:
+            texts.append(node.text)
+        texts.extend(child.tail for child in node if child.tail is not None)
+    return texts
+
+
+def _single(values: list[str], first: bool = False) -> str | None:
+    """Single value from a list of values, where there is exactly one value (or the first value if `first` is set)."""
+    if len(values) == 1 or (first and len(values) > 0):
+        return values[0]
+    return None
+
+
+def _compile_code_list(mapping: CodeList) -> Codec:
+    (element_tag,) = _tags(mapping.element)
+    (code_tag,) = _tags(mapping.code)
+    key, code_list, values = mapping.key, mapping.code_list, mapping.values
+
+    def encode(parent: Element, attributes: dict) -> None:
+        element = SubElement(parent, element_tag)
+        if key in attributes and attributes[key] in values:
+            code = SubElement(element, code_tag, attrib={"codeList": code_list, "codeListValue": attributes[key]})
+            code.text = attributes[key]
+
+    def decode(nodes: list[Element]) -> str:
+        value = [
+            code.get("codeListValue")
+            for node in nodes
+            for element in node.iterchildren(element_tag)
+            for code in element.iterchildren(code_tag)
+            if code.get("codeList") == code_list and code.get("codeListValue") is not None
+        ]
+        if len(value) == 1:
+            return value[0]
+        return ""
+
+    return Codec(mapping=mapping, encode=encode, decode=decode, tags=(element_tag, code_tag))
+
+
+def _compile_character_string(mapping: CharacterString) -> Codec:
+    tags = _tags(mapping.element)
+    (value_tag,) = _tags(mapping.value)
+    key, first = mapping.key, mapping.first
+
+    def encode(parent: Element, attributes: dict) -> None:
+        value = SubElement(_add(parent, tags), value_tag)
+        value.text = str(attributes[key])
+
+    def decode(nodes: list[Element]) -> str | None:
+        return _single(_texts(_children(nodes, *tags, value_tag)), first=first)
+
+    return Codec(mapping=mapping, encode=encode, decode=decode)
+
+
+def _compile_anchor(mapping: Anchor) -> Codec:
+    tags = _tags(mapping.element)
+    value_key, href_key, title_key, first = mapping.value, mapping.href, mapping.title, mapping.first
+
+    def encode(parent: Element, attributes: dict) -> None:
+        if value_key not in attributes:
+            return
+        element = _add(parent, tags)
+        if href_key in attributes:
+            attrib = {XLINK.href: attributes[href_key], XLINK.actuate: "onRequest"}
+            if title_key is not None and title_key in attributes:
+                attrib[XLINK.title] = attributes[title_key]
+            value = SubElement(element, GMX.Anchor, attrib=attrib)
+        else:
+            value = SubElement(element, GCO.CharacterString)
+        value.text = attributes[value_key]
+
+    def decode(nodes: list[Element]) -> dict:
+        elements = _children(nodes, *tags)
+        anchors = _children(elements, GMX.Anchor)
+
+        _ = {}
+        value = _single(
+            _texts([child for element in elements for child in element.iterchildren(GCO.CharacterString, GMX.Anchor)]),
+            first=first,
+        )
+        if value is not None:
+            _[value_key] = value
+        href = _single(
+            [anchor.get(XLINK.href) for anchor in anchors if anchor.get(XLINK.href) is not None], first=first
+        )
+        if href is not None:
+            _[href_key] = href
+        if title_key is not None:
+            title = _single(
+                [anchor.get(XLINK.title) for anchor in anchors if anchor.get(XLINK.title) is not None], first=first
+            )
+            if title is not None:
+                _[title_key] = title
+        return _
+
+    return Codec(mapping=mapping, encode=encode, decode=decode)
+
+
+def _compile_date(mapping: Date) -> Codec:
+    tags = _tags(mapping.element)
+
+    def encode(parent: Element, attributes: dict) -> None:
+        if "date" not in attributes:
+            return
+        value = SubElement(_add(parent, tags), GCO.DateTime if type(attributes["date"]) is datetime else GCO.Date)
+        value.text = encode_date_string(
+            date_datetime=attributes["date"], date_precision=attributes.get("date_precision")
+        )
+
+    def decode(nodes: list[Element]) -> dict:
+        value = _texts(
+            [child for element in _children(nodes, *tags) for child in element.iterchildren(GCO.Date, GCO.DateTime)]
+        )
+        if len(value) != 1:
+            return {}
+        try:
+            return decode_date_string(date_datetime=value[0])
+        except ValueError:
+            msg = "Date/datetime could not be parsed as an ISO date value"
+            raise RuntimeError(msg) from None
+
+    return Codec(mapping=mapping, encode=encode, decode=decode)
+
+
+def _compile_group(mapping: Group) -> Codec:
+    tags = () if mapping.element is None else _tags(mapping.element)
+    group_key = mapping.key
+    members = [(member.key, compile_mapping(member)) for member in mapping.members]
+
+    def encode(parent: Element, attributes: dict) -> None:
+        if group_key is not None:
+            attributes = attributes[group_key]
+        parent = _add(parent, tags)
+        for key, member in members:
+            if key is None or key in attributes:
+                member.encode(parent, attributes)
+
+    def decode(nodes: list[Element]) -> dict:
+        nodes = _children(nodes, *tags)
+        _ = {}
+        for key, member in members:
+            value = member.decode(nodes)
+            if key is None:
+                _.update(value)
+            elif value is not None and value not in ("", [], {}):
+                _[key] = value
+        return _
+
+    return Codec(mapping=mapping, encode=encode, decode=decode)
+
+
+def _compile_repeated(mapping: Repeated) -> Codec:
+    (element_tag,) = _tags(mapping.element)
+    key, index = mapping.key, mapping.index
+    item = compile_mapping(mapping.item)
+
+    def encode(parent: Element, attributes: dict) -> None:
+        values = attributes[key]
+        if index is not None:
+            values = [{**value, index: name} for name, value in values.items()]
+        for value in values:
+            item.encode(SubElement(parent, element_tag), value)
+
+    def decode(nodes: list[Element]) -> list | dict:
+        values = [item.decode([element]) for element in _children(nodes, element_tag)]
+        if index is None:
+            return [value for value in values if bool(value)]
+        return {value.pop(index, ""): value for value in values}
+
+    return Codec(mapping=mapping, encode=encode, decode=decode)
+
+
+@lru_cache(maxsize=None)
+def compile_mapping(mapping: ElementMapping) -> Codec:
+    """
+    Compile an element mapping into a codec.
+
+    Codecs are compiled once per mapping and then reused, including for members of groups and items of repeated
+    elements, which are compiled recursively.
+
+    :type mapping: ElementMapping
+    :param mapping: element mapping
+    :return: codec for mapping
+    """
+    if isinstance(mapping, CodeList):
+        return _compile_code_list(mapping)
+    if isinstance(mapping, CharacterString):
+        return _compile_character_string(mapping)
+    if isinstance(mapping, Anchor):
+        return _compile_anchor(mapping)
+    if isinstance(mapping, Date):
+        return _compile_date(mapping)
+    if isinstance(mapping, Repeated):
+        return _compile_repeated(mapping)
+    if isinstance(mapping, Custom):
+        return Codec(mapping=mapping, encode=mapping.encode, decode=mapping.decode)
+    return _compile_group(mapping)
+
+
+LANGUAGE = compile_mapping(
+    CodeList(
+        key="language",
+        element="gmd:language",
+        code="gmd:LanguageCode",
+        code_list="http://www.loc.gov/standards/iso639-2/php/code_list.php",
+        values=("eng",),
+    )
+)
+CHARACTER_SET = compile_mapping(
+    CodeList(
+        key="character_set",
+        element="gmd:characterSet",
+        code="gmd:MD_CharacterSetCode",
+        code_list=(
+            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
+            "codelist/gmxCodelists.xml#MD_CharacterSetCode"
+        ),
+        values=("utf8",),
+    )
+)
+SCOPE = compile_mapping(
+    CodeList(
+        key="hierarchy_level",
+        element="gmd:level",
+        code="gmd:MD_ScopeCode",
+        code_list="https://standards.iso.org/iso/19115/resources/Codelists/cat/codelists.xml#MD_ScopeCode",
+        values=(
+            "aggregate",
+            "application",
+            "attribute",
+            "attributeType",
+            "collection",
+            "collectionHardware",
+            "collectionSession",
+            "coverage",
+            "dataset",
+            "dimensionGroup",
+            "document",
+            "feature",
+            "featureType",
+            "fieldSession",
+            "initiative",
+            "metadata",
+            "model",
+            "nonGeographicDataset",
+            "product",
+            "propertyType",
+            "repository",
+            "sample",
+            "series",
+            "service",
+            "software",
+            "tile",
+        ),
+    )
+)
+ROLE = compile_mapping(
+    CodeList(
+        key="role",
+        element="gmd:role",
+        code="gmd:CI_RoleCode",
+        code_list="https://standards.iso.org/iso/19115/resources/Codelists/cat/codelists.xml#CI_RoleCode",
+        values=(
+            "author",
+            "custodian",
+            "distributor",
+            "originator",
+            "owner",
+            "pointOfContact",
+            "principalInvestigator",
+            "processor",
+            "publisher",
+            "resourceProvider",
+            "sponsor",
+            "user",
+            "coAuthor",
+            "collaborator",
+            "contributor",
+            "editor",
+            "funder",
+            "mediator",
+            "rightsHolder",
+            "stakeholder",
+        ),
+    )
+)
+ONLINE_FUNCTION = compile_mapping(
+    CodeList(
+        key="function",
+        element="gmd:function",
+        code="gmd:CI_OnLineFunctionCode",
+        code_list=(
+            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
+            "codelist/gmxCodelists.xml#CI_OnLineFunctionCode"
+        ),
+        values=(
+            "download",
+            "information",
+            "offlineAccess",
+            "order",
+            "search",
+        ),
+    )
+)
+MAINTENANCE_FREQUENCY = compile_mapping(
+    CodeList(
+        key="maintenance_frequency",
+        element="gmd:maintenanceAndUpdateFrequency",
+        code="gmd:MD_MaintenanceFrequencyCode",
+        code_list=(
+            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
+            "codelist/gmxCodelists.xml#MD_MaintenanceFrequencyCode"
+        ),
+        values=(
+            "continual",
+            "daily",
+            "weekly",
+            "fortnightly",
+            "monthly",
+            "quarterly",
+            "biannually",
+            "annually",
+            "asNeeded",
+            "irregular",
+            "notPlanned",
+            "unknown",
+        ),
+    )
+)
+MAINTENANCE_PROGRESS = compile_mapping(
+    CodeList(
+        key="progress",
+        element="gmd:maintenanceNote",
+        code="gmd:MD_ProgressCode",
+        code_list=(
+            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
+            "codelist/gmxCodelists.xml#MD_ProgressCode"
+        ),
+        values=(
+            "completed",
+            "historicalArchive",
+            "obsolete",
+            "onGoing",
+            "planned",
+            "required",
+            "underDevelopment",
+        ),
+    )
+)
+DATE_TYPE = compile_mapping(
+    CodeList(
+        key="date_type",
+        element="gmd:dateType",
+        code="gmd:CI_DateTypeCode",
+        code_list="https://standards.iso.org/iso/19115/resources/Codelists/cat/codelists.xml#CI_DateTypeCode",
+        values=(
+            "creation",
+            "publication",
+            "revision",
+            "expiry",
+            "lastUpdate",
+            "lastRevision",
+            "nextUpdate",
+            "unavailable",
+            "inForce",
+            "adopted",
+            "deprecated",
+            "superseded",
+            "validityBegins",
+            "validityExpires",
+            "released",
+            "distribution",
+        ),
+    )
+)
+ACCESS_CONSTRAINT = compile_mapping(
+    CodeList(
+        key="restriction_code",
+        element="gmd:accessConstraints",
+        code="gmd:MD_RestrictionCode",
+        code_list="https://standards.iso.org/iso/19115/resources/Codelists/cat/codelists.xml#MD_RestrictionCode",
+        values=(
+            "confidential",
+            "copyright",
+            "inConfidence",
+            "intellectualPropertyRights",
+            "licenceDistributor",
+            "licenceEndUser",
+            "licenceUnrestricted",
+            "license",
+            "otherRestrictions",
+            "patent",
+            "patentPending",
+            "private",
+            "restricted",
+            "SBU",
+            "statutory",
+            "trademark",
+            "unrestricted",
+        ),
+    )
+)
+USE_CONSTRAINT = compile_mapping(
+    CodeList(
+        key="restriction_code",
+        element="gmd:useConstraints",
+        code="gmd:MD_RestrictionCode",
+        code_list="https://standards.iso.org/iso/19115/resources/Codelists/cat/codelists.xml#MD_RestrictionCode",
+        values=(
+            "confidential",
+            "copyright",
+            "inConfidence",
+            "intellectualPropertyRights",
+            "licenceDistributor",
+            "licenceEndUser",
+            "licenceUnrestricted",
+            "license",
+            "otherRestrictions",
+            "patent",
+            "patentPending",
+            "private",
+            "restricted",
+            "SBU",
+            "statutory",
+            "trademark",
+            "unrestricted",
+        ),
+    )
+)
+STATUS = compile_mapping(
+    CodeList(
+        key="status",
+        element="gmd:status",
+        code="gmd:MD_ProgressCode",
+        code_list=(
+            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
+            "codelist/gmxCodelists.xml#MD_ProgressCode"
+        ),
+        values=(
+            "completed",
+            "historicalArchive",
+            "obsolete",
+            "onGoing",
+            "planned",
+            "required",
+            "underDevelopment",
+        ),
+    )
+)
+SPATIAL_REPRESENTATION_TYPE = compile_mapping(
+    CodeList(
+        key="spatial_representation_type",
+        element="gmd:spatialRepresentationType",
+        code="gmd:MD_SpatialRepresentationTypeCode",
+        code_list=(
+            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
+            "codelist/gmxCodelists.xml#MD_SpatialRepresentationTypeCode"
+        ),
+        values=(
+            "vector",
+            "grid",
+            "textTable",
+            "tin",
+            "stereoModel",
+            "video",
+        ),
+    )
+)
+KEYWORDS_TYPE = compile_mapping(
+    CodeList(
+        key="type",
+        element="gmd:type",
+        code="gmd:MD_KeywordTypeCode",
+        code_list=(
+            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
+            "codelist/gmxCodelists.xml#MD_KeywordTypeCode"
+        ),
+        values=(
+            "discipline",
+            "place",
+            "stratum",
+            "temporal",
+            "theme",
+        ),
+    )
+)
+ASSOCIATION_TYPE = compile_mapping(
+    CodeList(
+        key="association_type",
+        element="gmd:associationType",
+        code="gmd:DS_AssociationTypeCode",
+        code_list="https://standards.iso.org/iso/19115/resources/Codelists/cat/codelists.xml#DS_AssociationTypeCode",
+        values=(
+            "collectiveTitle",
+            "crossReference",
+            "dependency",
+            "isComposedOf",
+            "largerWorkCitation",
+            "partOfSeamlessDatabase",
+            "revisionOf",
+            "series",
+            "stereoMate",
+            "physicalReverseOf",
+        ),
+    )
+)
+INITIATIVE_TYPE = compile_mapping(
+    CodeList(
+        key="initiative_type",
+        element="gmd:initiativeType",
+        code="gmd:DS_InitiativeTypeCode",
+        code_list="https://standards.iso.org/iso/19115/resources/Codelists/cat/codelists.xml#DS_InitiativeTypeCode",
+        values=(
+            "campaign",
+            "collection",
+            "exercise",
+            "experiment",
+            "investigation",
+            "mission",
+            "operation",
+            "platform",
+            "process",
+            "program",
+            "project",
+            "sensor",
+            "study",
+            "task",
+            "trial",
+            "dataDictionary",
+            "sciencePaper",
+            "userGuide",
+        ),
+    )
+)
+HIERARCHY_LEVEL = compile_mapping(replace(SCOPE.mapping, element="gmd:hierarchyLevel"))
+
+MAINTENANCE_INFORMATION = compile_mapping(
+    Group(
+        element="gmd:MD_MaintenanceInformation", members=(MAINTENANCE_FREQUENCY.mapping, MAINTENANCE_PROGRESS.mapping)
+    )
+)
+SERIES = compile_mapping(
+    Group(
+        element="gmd:series/gmd:CI_Series",
+        members=(
+            CharacterString(key="name", element="gmd:name"),
+            CharacterString(key="edition", element="gmd:issueIdentification"),
+            CharacterString(key="page", element="gmd:page"),
+        ),
+    )
+)
+METADATA_STANDARD = compile_mapping(
+    Group(
+        element=None,
+        members=(
+            CharacterString(key="name", element="gmd:metadataStandardName"),
+            CharacterString(key="version", element="gmd:metadataStandardVersion"),
+        ),
+    )
+)
+ONLINE_RESOURCE = compile_mapping(
+    Group(
+        element="gmd:CI_OnlineResource",
+        members=(
+            CharacterString(key="href", element="gmd:linkage", value="gmd:URL", first=True),
+            CharacterString(key="protocol", element="gmd:protocol", first=True),
+            CharacterString(key="title", element="gmd:name", first=True),
+            CharacterString(key="description", element="gmd:description", first=True),
+            ONLINE_FUNCTION.mapping,
+        ),
+    )
+)
+DATE = compile_mapping(Group(element="gmd:CI_Date", members=(Date(element="gmd:date"), DATE_TYPE.mapping)))
+IDENTIFIER = compile_mapping(
+    Group(
+        element="gmd:RS_Identifier",
+        members=(
+            Anchor(element="gmd:code", value="identifier"),
+            CharacterString(key="namespace", element="gmd:codeSpace"),
+        ),
+    )
+)
+
+_CONTACT_NAMES = compile_mapping(
+    Group(
+        element=None,
+        members=(
+            Group(
+                element=None,
+                key="individual",
+                members=(Anchor(element="gmd:individualName", value="name", title="title", first=True),),
+            ),
+            Group(
+                element=None,
+                key="organisation",
+                members=(Anchor(element="gmd:organisationName", value="name", title="title", first=True),),
+            ),
+            CharacterString(key="position", element="gmd:positionName", first=True),
+        ),
+    )
+)
+_CONTACT_PHONE = compile_mapping(
+    CharacterString(key="phone", element="gmd:phone/gmd:CI_Telephone/gmd:voice", first=True)
+)
+_CONTACT_ADDRESS = compile_mapping(
+    Group(
+        element=None,
+        key="address",
+        members=(
+            CharacterString(key="delivery_point", element="gmd:deliveryPoint", first=True),
+            CharacterString(key="city", element="gmd:city", first=True),
+            CharacterString(key="administrative_area", element="gmd:administrativeArea", first=True),
+            CharacterString(key="postal_code", element="gmd:postalCode", first=True),
+            CharacterString(key="country", element="gmd:country", first=True),
+        ),
+    )
+)
+_CONTACT_EMAIL = compile_mapping(CharacterString(key="email", element="gmd:electronicMailAddress", first=True))
+_CONTACT_ONLINE_RESOURCE = compile_mapping(
+    Group(element="gmd:onlineResource", key="online_resource", members=(ONLINE_RESOURCE.mapping,))
+)
+
+
+def _encode_responsible_party(parent: Element, attributes: dict) -> None:
+    # Citations can only have a single contact so collapse roles array down to a single value
+    if type(attributes.get("role")) is list:
+        if len(attributes["role"]) > 1:
+            msg = "Contacts can only have a single role. Citations can only have a single contact."
+            raise ValueError(msg)
+        attributes = {**attributes, "role": attributes["role"][0]}
+
+    responsible_party = SubElement(parent, GMD.CI_ResponsibleParty)
+    _CONTACT_NAMES.encode(responsible_party, attributes)
+
+    if any(key in attributes for key in ("phone", "address", "email", "online_resource")):
+        contact = _add(responsible_party, (GMD.contactInfo, GMD.CI_Contact))
+
+        if "phone" in attributes:
+            _CONTACT_PHONE.encode(contact, attributes)
+
+        if "address" in attributes or "email" in attributes:
+            address = _add(contact, (GMD.address, GMD.CI_Address))
+            if "address" in attributes:
+                _CONTACT_ADDRESS.encode(address, attributes)
+            if "email" in attributes:
+                _CONTACT_EMAIL.encode(address, attributes)
+            else:
+                SubElement(address, GMD.electronicMailAddress, attrib={GCO.nilReason: "unknown"})
+
+        if "online_resource" in attributes:
+            _CONTACT_ONLINE_RESOURCE.encode(contact, attributes)
+
+    if "role" in attributes:
+        ROLE.encode(responsible_party, attributes)
+
+
+def _decode_responsible_party(nodes: list[Element]) -> dict:
+    responsible_party = _children(nodes, GMD.CI_ResponsibleParty)
+    contact = _children(responsible_party, GMD.contactInfo, GMD.CI_Contact)
+    address = _children(contact, GMD.address, GMD.CI_Address)
+
+    _ = _CONTACT_NAMES.decode(responsible_party)
+    for key, value in [
+        ("phone", _CONTACT_PHONE.decode(contact)),
+        ("address", _CONTACT_ADDRESS.decode(address)),
+        ("email", _CONTACT_EMAIL.decode(address)),
+        ("online_resource", _CONTACT_ONLINE_RESOURCE.decode(contact)),
+    ]:
+        if bool(value):
+            _[key] = value
+
+    _role = ROLE.decode(responsible_party)
+    if _role != "":
+        _["role"] = [_role]
+
+    return _
+
+
+RESPONSIBLE_PARTY = compile_mapping(Custom(encode=_encode_responsible_party, decode=_decode_responsible_party))
+CITATION = compile_mapping(
+    Group(
+        element="gmd:CI_Citation",
+        members=(
+            Group(element=None, key="title", members=(Anchor(element="gmd:title"),)),
+            Repeated(key="dates", element="gmd:date", item=DATE.mapping, index="date_type"),
+            CharacterString(key="edition", element="gmd:edition"),
+            Repeated(key="identifiers", element="gmd:identifier", item=IDENTIFIER.mapping),
+            Group(element="gmd:citedResponsibleParty", key="contact", members=(RESPONSIBLE_PARTY.mapping,)),
+            replace(SERIES.mapping, key="series"),
+            CharacterString(key="other_citation_details", element="gmd:otherCitationDetails"),
+        ),
+    )
+)
+REFERENCE_SYSTEM_IDENTIFIER = compile_mapping(
+    Group(
+        element=("gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier"),
+        members=(
+            Group(element="gmd:authority", key="authority", members=(CITATION.mapping,)),
+            Group(element=None, key="code", members=(Anchor(element="gmd:code"),)),
+            CharacterString(key="version", element="gmd:version"),
+        ),
+    )
+)
+
+_OTHER_CONSTRAINTS = compile_mapping(Anchor(element="gmd:otherConstraints", value="statement"))
+
+
+def _encode_legal_constraint(parent: Element, attributes: dict) -> None:
+    constraint = SubElement(parent, GMD.MD_LegalConstraints)
+
+    if attributes["type"] == "access":
+        ACCESS_CONSTRAINT.encode(constraint, attributes)
+    if attributes["type"] == "usage":
+        USE_CONSTRAINT.encode(constraint, attributes)
+
+    if "href" in attributes and "statement" not in attributes:
+        # where a constraint only has a URL, use this as a text value as well
+        # when decoded, this fake value/statement value will be removed
+        _OTHER_CONSTRAINTS.encode(constraint, {**attributes, "statement": attributes["href"]})
+    elif "statement" in attributes:
+        _OTHER_CONSTRAINTS.encode(constraint, attributes)
+
+    if "permissions" in attributes:
+        _id = sha1(json.dumps(attributes["permissions"]).encode(), usedforsecurity=False).hexdigest()
+        constraint.attrib["id"] = f"bml-permissions-{_id}"
+
+        _statement = attributes["permissions"]
+        if not isinstance(_statement, str):
+            _statement = json.dumps(_statement)
+        _OTHER_CONSTRAINTS.encode(constraint, {"statement": _statement})
+
+
+def _decode_legal_constraint(nodes: list[Element]) -> dict:
+    _ = {}
+    constraint = _children(nodes, GMD.MD_LegalConstraints)
+
+    _access_constraint = ACCESS_CONSTRAINT.decode(constraint)
+    if _access_constraint != "":
+        _["type"] = "access"
+        _["restriction_code"] = _access_constraint
+
+    _use_constraint = USE_CONSTRAINT.decode(constraint)
+    if _use_constraint != "":
+        _["type"] = "usage"
+        _["restriction_code"] = _use_constraint
+
+    _other_constraint = _OTHER_CONSTRAINTS.decode(constraint)
+    # account for constraints that use a URL only
+    if "href" in _other_constraint and _other_constraint.get("statement") == _other_constraint["href"]:
+        del _other_constraint["statement"]
+    _.update(_other_constraint)
+
+    # detect permissions statements
+    constraint_id = _single([element.get("id") for element in constraint if element.get("id") is not None])
+    if constraint_id is not None and "permissions" in constraint_id and "statement" in _:
+        _["permissions"] = _.pop("statement")
+        with contextlib.suppress(JSONDecodeError):
+            _["permissions"] = json.loads(_["permissions"])
+
+    return _
+
+
+LEGAL_CONSTRAINT = compile_mapping(Custom(encode=_encode_legal_constraint, decode=_decode_legal_constraint))
+
+
+def _encode_id(_id: str, suffix: str) -> str:
+    """Encode the ID of a distribution option as the ID of a format or transfer option element."""
+    return f"bml-{_id}-{suffix}"
+
+
+def _decode_id(nodes: list[Element], suffix: str) -> str | None:
+    """Decode the ID of a distribution option from the ID of a format or transfer option element, if set."""
+    _id = _single([element.get("id") for element in nodes if element.get("id") is not None])
+    if _id is None:
+        return None
+    return _id.replace("bml-", "").replace(f"-{suffix}", "")
+
+
+_FORMAT_NAME = compile_mapping(Anchor(element="gmd:name", value="format"))
+_FORMAT_VERSION = compile_mapping(CharacterString(key="version", element="gmd:version"))
+_FORMAT_DETAILS = compile_mapping(
+    Group(
+        element=None,
+        members=(
+            CharacterString(key="amendment_number", element="gmd:amendmentNumber"),
+            CharacterString(key="specification", element="gmd:specification"),
+            CharacterString(key="file_decompression_technique", element="gmd:fileDecompressionTechnique"),
+        ),
+    )
+)
+
+
+def _encode_format(parent: Element, attributes: dict) -> None:
+    attrib = {}
+    if "_id" in attributes:
+        attrib["id"] = _encode_id(attributes["_id"], suffix="fmt")
+    format_ = SubElement(parent, GMD.MD_Format, attrib=attrib)
+
+    _FORMAT_NAME.encode(format_, attributes)
+    if "version" in attributes:
+        _FORMAT_VERSION.encode(format_, attributes)
+    else:
+        SubElement(format_, GMD.version, attrib={GCO.nilReason: "missing"})
+    _FORMAT_DETAILS.encode(format_, attributes)
+
+
+def _decode_format(nodes: list[Element]) -> dict:
+    _ = {}
+    format_ = _children(nodes, GMD.MD_Format)
+
+    _id = _decode_id(format_, suffix="fmt")
+    if _id is not None:
+        _["_id"] = _id
+
+    _.update(_FORMAT_NAME.decode(format_))
+    _version = _FORMAT_VERSION.decode(format_)
+    if _version is not None:
+        _["version"] = _version
+    _.update(_FORMAT_DETAILS.decode(format_))
+
+    if list(_.keys()) == ["_id"]:
+        _ = {}
+    return _
+
+
+FORMAT = compile_mapping(Custom(encode=_encode_format, decode=_decode_format))
+
+_TRANSFER_SIZE_UNIT = compile_mapping(CharacterString(key="unit", element="gmd:unitsOfDistribution"))
+_TRANSFER_ONLINE_RESOURCE = compile_mapping(
+    Group(element="gmd:onLine", key="online_resource", members=(ONLINE_RESOURCE.mapping,))
+)
+
+
+def _encode_transfer_option(parent: Element, attributes: dict) -> None:
+    transfer_option = SubElement(
+        parent, GMD.MD_DigitalTransferOptions, attrib={"id": _encode_id(attributes["_id"], suffix="tfo")}
+    )
+
+    if "size" in attributes:
+        if "unit" in attributes["size"]:
+            _TRANSFER_SIZE_UNIT.encode(transfer_option, attributes["size"])
+        if "magnitude" in attributes["size"]:
+            magnitude = SubElement(SubElement(transfer_option, GMD.transferSize), GCO.Real)
+            magnitude.text = str(format_numbers_consistently(attributes["size"]["magnitude"]))
+
+    _TRANSFER_ONLINE_RESOURCE.encode(transfer_option, attributes)
+
+
+def _decode_transfer_option(nodes: list[Element]) -> dict:
+    _ = {}
+    transfer_option = _children(nodes, GMD.MD_DigitalTransferOptions)
+
+    _id = _decode_id(transfer_option, suffix="tfo")
+    if _id is not None:
+        _["_id"] = _id
+
+    _size = {}
+    _unit = _TRANSFER_SIZE_UNIT.decode(transfer_option)
+    if _unit is not None:
+        _size["unit"] = _unit
+    _magnitude = _single(_texts(_children(transfer_option, GMD.transferSize, GCO.Real)))
+    if _magnitude is not None:
+        _size["magnitude"] = format_numbers_consistently(_magnitude)
+    if bool(_size):
+        _["size"] = _size
+
+    _online_resource = _TRANSFER_ONLINE_RESOURCE.decode(transfer_option)
+    if bool(_online_resource):
+        _["online_resource"] = _online_resource
+
+    if list(_.keys()) == ["_id"]:
+        _ = {}
+    return _
+
+
+TRANSFER_OPTION = compile_mapping(Custom(encode=_encode_transfer_option, decode=_decode_transfer_option))
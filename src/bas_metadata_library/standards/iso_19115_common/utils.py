@@ -4,10 +4,16 @@ import json
 from copy import deepcopy
 from datetime import date, datetime
 from itertools import groupby
+from threading import RLock
+from typing import Any, Callable
 
 from importlib_resources import files as resource_file
 from importlib_resources.abc import Traversable
-from jsonschema.validators import validate
+from jsonschema import FormatChecker
+from jsonschema.protocols import Validator
+
+from bas_metadata_library import get_format_checker, get_schema_validator, validate_fragment, validate_instance
+from bas_metadata_library.validation_cache import ValidationCache, canonical_json, get_validation_cache
 
 profiles: dict[str, Traversable] = {
     "https://metadata-standards.data.bas.ac.uk/profiles/magic-discovery-v1/": resource_file(
@@ -24,6 +30,9 @@ profiles: dict[str, Traversable] = {
     ).joinpath("magic_administration_encoding_v1.json"),
 }
 
+_profile_validators_lock = RLock()
+_profile_schemas: dict[str, dict] = {}
+
 
 def _sort_dict_by_keys(dictionary: dict) -> dict:
     """
@@ -354,6 +363,73 @@ def flatten_distribution_distributors(distributions: list[dict]) -> list[dict]:
     return _flattened_distribution_options
 
 
+def match_distribution_options(distribution_formats: list[dict], transfer_options: list[dict]) -> list[dict]:  # noqa: C901 see uk-pdc/metadata-infrastructure/metadata-library#175 for more information
+    """
+    Matches distribution formats and transfer options into complete or partial distribution objects.
+
+    See the README 'Automatic transfer option / format IDs' section for more information on the background to this
+    feature and why it's needed.
+
+    Note: there is almost certainly a more elegant/efficient way to do this process. Alternative/improved
+    implementations are definitely welcome as contributions.
+
+    :param distribution_formats: list of distribution format objects
+    :param transfer_options: list of transfer option objects
+    :return list of complete or partial distribution option objects
+    """
+    distribution_options = []
+    _distribution_formats = {}
+    _transfer_options = {}
+    _unmatched_distribution_formats = []
+    _unmatched_transfer_options = []
+    _matched_distribution_formats = []
+    _matched_transfer_options = []
+
+    # index options by ID or add to unmatched list
+    for distribution_format in distribution_formats:
+        if "_id" in distribution_format:
+            _id = distribution_format["_id"]
+            del distribution_format["_id"]
+            _distribution_formats[_id] = distribution_format
+            continue
+        _unmatched_distribution_formats.append(distribution_format)
+    for transfer_option in transfer_options:
+        if "_id" in transfer_option:
+            _id = transfer_option["_id"]
+            del transfer_option["_id"]
+            _transfer_options[_id] = transfer_option
+            continue
+        _unmatched_transfer_options.append(transfer_option)
+
+    # try to match up items or add to unmatched list
+    if len(_distribution_formats) >= len(_transfer_options):
+        for fmt_id, distribution_format in _distribution_formats.items():
+            if fmt_id not in _transfer_options:
+                _unmatched_distribution_formats.append(distribution_format)
+                continue
+
+            distribution_options.append({"format": distribution_format, "transfer_option": _transfer_options[fmt_id]})
+            _matched_distribution_formats.append(fmt_id)
+            _matched_transfer_options.append(fmt_id)
+    if len(_transfer_options) > len(_distribution_formats):
+        for tfo_id, transfer_option in _transfer_options.items():
+            if tfo_id not in _distribution_formats:
+                _unmatched_transfer_options.append(transfer_option)
+                continue
+
+            distribution_options.append({"format": _distribution_formats[tfo_id], "transfer_option": transfer_option})
+            _matched_transfer_options.append(tfo_id)
+            _matched_distribution_formats.append(tfo_id)
+
+    # add all unmatched items as non-complete distribution options
+    for unmatched_distribution_format in _unmatched_distribution_formats:
+        distribution_options.append({"format": unmatched_distribution_format})
+    for unmatched_transfer_options in _unmatched_transfer_options:
+        distribution_options.append({"transfer_option": unmatched_transfer_options})
+
+    return distribution_options
+
+
 def format_numbers_consistently(number: int | float) -> int | float:
     """
     Formats numeric values in a consistent way.
@@ -435,6 +511,31 @@ def encode_config_for_json(config: dict) -> dict:
     return _encode_date_properties(dictionary=config)
 
 
+def encode_config_member(key: str | int, value: Any) -> Any:  # noqa: ANN401
+    """
+    Encode a member of a record configuration object as per `encode_config_for_json()`.
+
+    For validating record configurations in place (see `bas_metadata_library.encoding_validator()`). Date properties
+    (dicts with a date or datetime and an optional date precision) and date stamp or (process step) date values are
+    encoded as strings. As with `encode_config_for_json()`, array members are not encoded.
+
+    E.g. `{'date': date(2012, 2, 1), 'date_precision': 'month'}` becomes '2012-02'.
+
+    :param key: property name or array index of member
+    :param value: member value
+    :return: encoded value, or the same value if no encoding is needed
+    """
+    if isinstance(key, int):
+        return value
+    if isinstance(value, dict) and list(value.keys()) == ["date"]:
+        return encode_date_string(date_datetime=value["date"])
+    if isinstance(value, dict) and {"date", "date_precision"}.issubset(set(value.keys())):
+        return encode_date_string(date_datetime=value["date"], date_precision=value["date_precision"])
+    if isinstance(value, date) and key in ["date_stamp", "date"]:
+        return value.isoformat()
+    return value
+
+
 def _get_profile_keys(config: dict) -> list[str]:
     """
     Determine whether a record configuration contains any supported profiles.
@@ -451,41 +552,161 @@ def _get_profile_keys(config: dict) -> list[str]:
             continue
 
         title_href = domain_consistency["specification"]["title"]["href"]
-        if title_href in profiles:
+        if isinstance(title_href, str) and title_href in profiles:
             profile_keys.append(title_href)
 
     return profile_keys
 
 
-def validate_profiles(config: dict) -> None:
+def _get_profile_schema(profile_key: str) -> dict:
+    """Load the schema for a supported profile, once per process."""
+    with _profile_validators_lock:
+        if profile_key not in _profile_schemas:
+            with profiles[profile_key].open() as schema_file:
+                _profile_schemas[profile_key] = json.load(schema_file)
+        return _profile_schemas[profile_key]
+
+
+def get_profile_validator(
+    profile_key: str,
+    encode_member: Callable[[str | int, Any], Any] | None = None,
+    format_checker: FormatChecker | None = None,
+) -> Validator:
+    """
+    Get a compiled validator for a supported profile.
+
+    Profile schemas are loaded and compiled the first time each profile is used, then reused for all later records.
+    Profiles identified by multiple URIs (such as MAGIC Discovery v1) share a validator via their schema's `$id`.
+
+    :type profile_key: str
+    :param profile_key: URI identifying a supported profile (a key in `profiles`)
+    :type encode_member: Callable
+    :param encode_member: optional function to encode members (see `bas_metadata_library.get_schema_validator()`)
+    :type format_checker: FormatChecker
+    :param format_checker: optional format checker (see `bas_metadata_library.get_schema_validator()`)
+    :return: validator for profile schema
+    """
+    return get_schema_validator(
+        schema=_get_profile_schema(profile_key=profile_key), encode_member=encode_member, format_checker=format_checker
+    )
+
+
+def validate_profiles(
+    config: dict,
+    profile_keys: list[str] | None = None,
+    encode_member: Callable[[str | int, Any], Any] | None = None,
+    format_checker: FormatChecker | None = None,
+) -> None:
     """
     Validate a record configuration against any supported profiles it indicates compliance with.
 
     Profiles are indicated via domain consistency data quality elements. Supported profiles are defined locally within
-    this module.
+    this module. Profile keys can be passed where already known, to avoid detecting them again.
 
     Where a record includes an element with a reference matching a supported profile, the record is validated against
-    the schema for that profile, loaded locally from this package.
+    the schema for that profile, using a validator compiled once per profile (see `get_profile_validator()`).
 
     Note: the first profile to fail validation will raise an exception, and stop further validation of other profiles.
     """
-    profile_keys = _get_profile_keys(config)
+    if profile_keys is None:
+        profile_keys = _get_profile_keys(config)
+
     for profile_key in profile_keys:
-        profile_schema_path = profiles[profile_key]
-        with profile_schema_path.open() as schema_file:
-            schema_data = json.load(schema_file)
-        validate(instance=config, schema=schema_data)
+        validator = get_profile_validator(
+            profile_key=profile_key, encode_member=encode_member, format_checker=format_checker
+        )
+        validate_instance(
+            instance=config,
+            schema=validator.schema,
+            encode_member=encode_member,
+            format_checker=format_checker,
+            validator=validator,
+        )
 
 
-def validate_config(config: dict, schema: dict) -> None:
+def validate_config(config: dict, schema: dict, encode_config: bool = False, check_formats: bool = False) -> None:
     """
     Validate a record configuration against a schema and any profiles it indicates compliance with.
 
-    The record config is first encoded as a JSON document so that dates are strings rather than datetimes for example.
+    The record config is validated in place, with dates checked as strings rather than datetimes for example (see
+    `encode_config_member()`). This avoids copying and encoding the record config.
+
+    If `encode_config` is set, the record config is instead first copied and encoded as a JSON document, and this copy
+    validated. This gives the same result, and is slower, but may be useful for debugging.
+
+    Validators for each schema are compiled once and reused (see `bas_metadata_library.get_schema_validator()`).
+
+    If `check_formats` is set, values with a format (such as URIs and date-times) are also checked to be valid for that
+    format. Format checks are memoized, as the same values tend to be repeated across records (see
+    `bas_metadata_library.get_format_checker()`).
+
+    If a validation cache is set (see `bas_metadata_library.validation_cache.set_validation_cache()`), validation is
+    skipped for record configs that have already been validated successfully against the same schemas.
+
+    Profiles a record config indicates compliance with are detected once, and used for both the validation cache key
+    and validating against profiles.
 
     Note: Records which fail to validate against the schema for the base standard will raise an exception, and stop
     further validation against any possible profiles.
     """
-    config_ = encode_config_for_json(config=deepcopy(config))
-    validate(instance=config_, schema=schema)
-    validate_profiles(config=config_)
+    try:
+        profile_keys = _get_profile_keys(config)
+    except (KeyError, TypeError):
+        # profiles can't be determined for some invalid record configs, which will fail base schema validation
+        profile_keys = None
+
+    cache = get_validation_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = _validation_cache_key(
+            cache=cache, config=config, schema=schema, profile_keys=profile_keys or [], check_formats=check_formats
+        )
+        if cache_key in cache:
+            return
+
+    format_checker = get_format_checker() if check_formats else None
+    if encode_config:
+        config_ = encode_config_for_json(config=deepcopy(config))
+        validate_instance(instance=config_, schema=schema, format_checker=format_checker)
+        validate_profiles(config=config_, profile_keys=profile_keys, format_checker=format_checker)
+    else:
+        validate_instance(
+            instance=config, schema=schema, encode_member=encode_config_member, format_checker=format_checker
+        )
+        validate_profiles(
+            config=config,
+            profile_keys=profile_keys,
+            encode_member=encode_config_member,
+            format_checker=format_checker,
+        )
+
+    if cache_key is not None:
+        cache.add(cache_key)
+
+
+def _validation_cache_key(
+    cache: ValidationCache, config: dict, schema: dict, profile_keys: list[str], check_formats: bool = False
+) -> str:
+    """
+    Validation cache key for a record config, including the identifiers of any profile schemas that apply.
+
+    Profiles can't be determined for some invalid record configs, these will not be in the cache as they're invalid.
+    """
+    schema_ids = [schema["$id"], *[_get_profile_schema(profile_key)["$id"] for profile_key in profile_keys]]
+    kind = "config-formats" if check_formats else "config"
+    return cache.key(kind=kind, content=canonical_json(config), schema_ids=schema_ids)
+
+
+def validate_config_fragment(fragment: Any, schema: dict, name: str, path: list[str | int] | None = None) -> None:  # noqa: ANN401
+    """
+    Validate part of a record configuration against a named sub-schema of a schema (e.g. a single contact).
+
+    As with `validate_config()`, fragments are validated in place. Where `path` is given, the fragment is encoded as a
+    member of its parent (e.g. a date property), and error paths are relative to the whole record configuration (see
+    `bas_metadata_library.validate_fragment()`).
+
+    Profiles are not checked, as they apply to whole record configurations.
+    """
+    if path:
+        fragment = encode_config_member(key=path[-1], value=fragment)
+    validate_fragment(instance=fragment, schema=schema, name=name, path=path, encode_member=encode_config_member)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from threading import RLock
+from time import time
+
+_validation_cache_lock = RLock()
+_validation_cache: ValidationCache | None = None
+
+
+def _library_version() -> str:
+    try:
+        return version("bas-metadata-library")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _tagged_json_value(value: object) -> dict:
+    """
+    Encode a value that can't be encoded as JSON as an object tagged with its type.
+
+    E.g. `date(2012, 1, 1)` becomes `{"$date": "2012-01-01"}`, so it can't be confused with the string '2012-01-01'.
+    """
+    isoformat = getattr(value, "isoformat", None)
+    return {f"${type(value).__name__}": isoformat() if callable(isoformat) else str(value)}
+
+
+def canonical_json(value: dict) -> bytes:
+    """
+    Encode a value (such as a record configuration) as canonical JSON, for use as validation cache content.
+
+    Keys are sorted and whitespace removed. Values that can't be encoded as JSON (such as dates) are encoded as objects
+    tagged with their type (see `_tagged_json_value()`), so they are distinct from strings with the same value.
+    """
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_tagged_json_value
+    ).encode()
+
+
+class ValidationCache:
+    """
+    Optional on-disk cache of successful validation outcomes.
+
+    For avoiding validating the same, unchanged, record configurations and records repeatedly (e.g. across runs of a
+    pipeline). Outcomes are stored in a SQLite database, keyed by a hash of the validated content, the identifiers of
+    the schemas used, and the version of this library (see `key()`).
+
+    Only successful outcomes are cached. Invalid content is always validated again, so that errors can be reported.
+
+    Where the cache holds more than `max_entries` entries, the least recently used entries are removed.
+
+    Caches are safe to use from multiple threads, and (via SQLite locking) multiple processes. To use a cache for all
+    record configuration and record validation in a process, see `set_validation_cache()`.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 100_000):
+        """
+        Initialise.
+
+        :type path: Path
+        :param path: path to SQLite database, created if it doesn't exist
+        :type max_entries: int
+        :param max_entries: maximum number of entries to keep
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = RLock()
+        self._version = _library_version()
+
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS outcomes (key TEXT PRIMARY KEY, used REAL NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS outcomes_used ON outcomes (used)")
+        self._entries = len(self)
+
+    def __len__(self) -> int:
+        """Number of entries in cache."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM outcomes").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        """Whether a successful outcome is cached for a key, marking the entry as recently used if so."""
+        with self._lock:
+            cursor = self._connection.execute("UPDATE outcomes SET used = ? WHERE key = ?", (time(), key))
+            return cursor.rowcount > 0
+
+    def key(self, kind: str, content: bytes, schema_ids: list[str]) -> str:
+        """
+        Generate a cache key for validating some content.
+
+        :type kind: str
+        :param kind: kind of validation (e.g. 'config' or 'record')
+        :type content: bytes
+        :param content: content to validate, canonically encoded (see `canonical_json()`) or as an XML document
+        :type schema_ids: list[str]
+        :param schema_ids: identifiers of schemas used (JSON Schema `$id`s or XML schema paths with a digest)
+        :return: cache key
+        """
+        digest = sha256()
+        for part in [self._version, kind, *sorted(schema_ids)]:
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def add(self, key: str) -> None:
+        """Record a successful outcome for a key, removing the least recently used entries if needed."""
+        with self._lock:
+            cursor = self._connection.execute("INSERT OR IGNORE INTO outcomes (key, used) VALUES (?, ?)", (key, time()))
+            if cursor.rowcount == 0:
+                self._connection.execute("UPDATE outcomes SET used = ? WHERE key = ?", (time(), key))
+                return
+
+            # entry count is tracked to avoid counting entries on each call, and recounted in case of other processes
+            self._entries += 1
+            if self._entries <= self.max_entries:
+                return
+            self._entries = len(self)
+            excess = self._entries - self.max_entries
+            if excess > 0:
+                self._connection.execute(
+                    "DELETE FROM outcomes WHERE key IN (SELECT key FROM outcomes ORDER BY used LIMIT ?)", (excess,)
+                )
+                self._entries -= excess
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._connection.execute("DELETE FROM outcomes")
+            self._entries = 0
+
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+def set_validation_cache(cache: ValidationCache | None) -> None:
+    """
+    Set, or unset, a validation cache to use for all record configuration and record validation in this process.
+
+    Where set, `validate_config()` and `MetadataRecord.validate()` (and `MetadataRecord.validate_document()` for bytes
+    or paths) are skipped for content already validated successfully.
+
+    :type cache: ValidationCache | None
+    :param cache: validation cache, or None to stop using a cache
+    """
+    global _validation_cache
+    with _validation_cache_lock:
+        _validation_cache = cache
+
+
+def get_validation_cache() -> ValidationCache | None:
+    """Get the validation cache set for this process, if any (see `set_validation_cache()`)."""
+    return _validation_cache
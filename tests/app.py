@@ -10,6 +10,7 @@ from jsonref import JsonRef
 from jsonschema.validators import validate
 
 from bas_metadata_library import MetadataRecordConfig
+from bas_metadata_library.codegen import generate_validator_source, generate_validators_index_source
 from bas_metadata_library.standards.iso_19115_0 import (
     MetadataRecord as ISO19115_0_MetadataRecord,
 )
@@ -160,6 +161,39 @@ def _generate_schemas() -> None:
             dist_schema_file.write("\n")
 
 
+def _generate_validators() -> None:
+    """
+    Generate Python validator modules for distribution schemas.
+
+    Generated validators check configurations against distribution schemas without interpreting schemas at runtime (see
+    `bas_metadata_library.codegen`). They must be regenerated whenever distribution schemas change, otherwise they will
+    be ignored in favour of slower `jsonschema` validators.
+    """
+    schemas = [
+        "iso_19115_0_v4",
+        "iso_19115_2_v4",
+        "magic_discovery_v1",
+        "magic_discovery_v2",
+        "magic_administration_content_v1",
+        "magic_administration_encoding_v1",
+    ]
+    dest_path = Path("./src/bas_metadata_library/schemas/validators")
+    dest_path.mkdir(exist_ok=True, parents=True)
+
+    modules = {}
+    for schema in schemas:
+        print(f"Generating validator for [{schema}]")
+        schema_path = Path(f"./src/bas_metadata_library/schemas/dist/{schema}.json")
+        with schema_path.open() as schema_file:
+            schema_data = json.load(schema_file)
+        dest_path.joinpath(f"{schema}.py").write_text(
+            generate_validator_source(schema=schema_data, source=f"{schema}.json")
+        )
+        modules[schema_data["$id"]] = schema
+
+    dest_path.joinpath("__init__.py").write_text(generate_validators_index_source(modules=modules))
+
+
 def _validate_schemas() -> None:
     """
     Validate source and distribution schemas against the JSON Schema specification.
@@ -338,6 +372,11 @@ def create_app() -> Flask:  # noqa: C901
         """Inline JSON Schema references in configuration schemas."""
         _generate_schemas()
 
+    @app.cli.command()
+    def generate_validators() -> None:
+        """Generate Python validators from distribution configuration schemas."""
+        _generate_validators()
+
     @app.cli.command()
     def validate_schemas() -> None:
         """Validate JSON schemas against JSON Schema specification."""
@@ -1,7 +1,44 @@
 # noinspection PyUnresolvedReferences
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from datetime import date, datetime
+from io import BytesIO
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
+from typing import Iterator
 
-from bas_metadata_library import MetadataRecord, MetadataRecordConfig, MetadataRecordElement
+import pytest
+from jsonschema import Draft7Validator, FormatChecker, ValidationError
+from lxml.etree import Element, ElementTree, SubElement, fromstring, tostring
+
+from bas_metadata_library import (
+    LazyMetadataRecordConfig,
+    MetadataRecord,
+    MetadataRecordConfig,
+    MetadataRecordElement,
+    Namespaces,
+    RecordValidationError,
+    Vocabulary,
+    XMLParserOptions,
+    _is_uri,
+    _schema_validators,
+    encode_json_member,
+    get_format_checker,
+    get_schema_validator,
+    get_xml_parser,
+    get_xml_parser_options,
+    get_xml_schema,
+    load_schema,
+    parse_record,
+    parse_xml_document,
+    scan_record,
+    set_xml_parser_options,
+    validate_instance,
+    validate_xml_document,
+    warm_schema_validators,
+    warm_xml_schemas,
+    write_xml_sections,
+)
 
 _config = {"foo": "bar"}
 
@@ -29,6 +66,101 @@ def test_record_class_record():
     assert config.config == {"$schema": ""}
 
 
+@pytest.mark.parametrize("source", ["str", "bytes", "bytearray", "memoryview", "mmap", "path", "file"])
+def test_parse_record(source: str):
+    record_path = Path().resolve().parent.joinpath(f"resources/records/test-standard/minimal-record.xml")
+    record_data = record_path.read_bytes()
+
+    with record_path.open(mode="rb") as record_file:
+        record = {
+            "str": lambda: record_data.decode(),
+            "bytes": lambda: record_data,
+            "bytearray": lambda: bytearray(record_data),
+            "memoryview": lambda: memoryview(record_data),
+            "mmap": lambda: mmap(record_file.fileno(), 0, access=ACCESS_READ),
+            "path": lambda: record_path,
+            "file": lambda: BytesIO(record_data),
+        }[source]()
+        element = parse_record(record)
+
+    assert element.tag == fromstring(record_data).tag
+    assert MetadataRecord(record=record).record.tag == element.tag
+
+
+def test_get_xml_parser():
+    parser = get_xml_parser()
+    assert get_xml_parser() is parser
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(get_xml_parser).result() is not parser
+
+
+def test_set_xml_parser_options():
+    options = get_xml_parser_options()
+    parser = get_xml_parser()
+    record_data = b"<record>\n  <value> </value>\n</record>"
+    assert parse_record(record_data)[0].text == " "
+    assert parse_record(record_data).text is None
+
+    set_xml_parser_options(XMLParserOptions(remove_blank_text=False))
+    try:
+        assert get_xml_parser() is not parser
+        assert parse_record(record_data).text == "\n  "
+    finally:
+        set_xml_parser_options(options)
+    assert get_xml_parser() is parser
+
+
+def test_parse_record_entities():
+    record_data = b'<!DOCTYPE record [<!ENTITY value "foo">]><record>&value;</record>'
+    assert parse_record(record_data).text is None
+
+
+def test_scan_record():
+    record_data = b"<record><a>1</a><b>2</b><c>3</c>" + b"<d>4</d>" * 10_000 + b"<e>5</e></record>"
+    record = scan_record(BytesIO(record_data), tags=["a", "c"], until="c")
+    assert [(element.tag, element.text) for element in record[:3]] == [("a", "1"), ("b", None), ("c", "3")]
+
+    record = scan_record(record_data, tags=["e"])
+    assert record[-1].text == "5"
+    assert record[-2].text is None
+
+
+def test_scan_record_invalid():
+    with pytest.raises(RecordValidationError):
+        scan_record(b"<record><a>1</a><b>", tags=["a"], until="b")
+
+
+@pytest.mark.parametrize("pretty_print", [True, False])
+def test_write_xml_sections(pretty_print: bool):
+    nsmap = {"a": "https://example.com/a", "b": "https://example.com/b"}
+    root = Element("{https://example.com/a}record", nsmap=nsmap)
+
+    def _sections() -> Iterator[Element]:
+        yield root
+        for i in range(3):
+            section = SubElement(root, "{https://example.com/a}section", attrib={"id": str(i)})
+            SubElement(section, "{https://example.com/b}value").text = f"<{i}>"
+            SubElement(root, "{https://example.com/b}empty")
+            yield root
+
+    for _ in _sections():
+        pass
+    expected = tostring(ElementTree(root), pretty_print=pretty_print, xml_declaration=True, encoding="utf-8")
+    root.clear()
+
+    document = BytesIO()
+    write_xml_sections(sections=_sections(), file=document, pretty_print=pretty_print)
+    assert document.getvalue() == expected
+    assert len(root) == 0
+
+    document = BytesIO()
+    write_xml_sections(sections=[root], file=document, pretty_print=pretty_print)
+    assert document.getvalue() == tostring(
+        ElementTree(root), pretty_print=pretty_print, xml_declaration=True, encoding="utf-8"
+    )
+
+
 def test_element_class_config():
     configuration = MetadataRecordConfig(**_config)
     record = MetadataRecord(configuration=configuration)
@@ -44,3 +176,199 @@ def test_element_class_record():
     record = MetadataRecord(record=record_data)
     element = MetadataRecordElement(record=record, attributes={})
     element.make_config()
+
+
+def test_lazy_config_class():
+    decoded = []
+
+    def _section(key: str, value: object) -> object:
+        decoded.append(key)
+        return value
+
+    config = LazyMetadataRecordConfig(
+        sections={"foo": lambda: _section("foo", "bar"), "empty": lambda: _section("empty", None)},
+        values={"$schema": ""},
+    )
+    assert config["foo"] == "bar"
+    assert config["foo"] == "bar"
+    assert decoded == ["foo"]
+    assert "empty" not in config
+    with pytest.raises(KeyError):
+        _ = config["unknown"]
+    assert config.materialise() == {"$schema": "", "foo": "bar"}
+    assert len(config) == 2
+    assert decoded == ["foo", "empty"]
+
+
+def test_lazy_config_class_error():
+    config = LazyMetadataRecordConfig(sections={"foo": lambda: {}["bar"]})
+    with pytest.raises(RuntimeError, match="section 'foo' could not be decoded"):
+        _ = config["foo"]
+
+
+def test_namespaces_frozen_nsmap():
+    namespaces = Namespaces(namespaces={"xlink": "http://www.w3.org/1999/xlink"})
+    nsmap = namespaces.frozen_nsmap()
+    assert nsmap == namespaces.nsmap()
+    assert namespaces.frozen_nsmap() is nsmap
+    assert deepcopy(namespaces) is namespaces
+    with pytest.raises(TypeError):
+        nsmap["foo"] = "bar"  # type: ignore[index]
+
+
+def test_vocabulary():
+    vocabulary = Vocabulary("http://www.w3.org/1999/xlink")
+    assert vocabulary.href == "{http://www.w3.org/1999/xlink}href"
+    assert vocabulary.href is vocabulary.href
+    assert vocabulary["pass"] == "{http://www.w3.org/1999/xlink}pass"
+    with pytest.raises(AttributeError):
+        vocabulary.href = "foo"
+
+
+def test_load_schema_cached():
+    schema = load_schema(name="iso_19115_0_v4")
+    assert schema["$id"] == "https://metadata-resources.data.bas.ac.uk/bas-metadata-generator-configuration-schemas/v2/iso-19115-0-v4.json"
+    assert load_schema(name="iso_19115_0_v4") is schema
+
+
+def test_get_schema_validator_cached():
+    schema = load_schema(name="iso_19115_0_v4")
+    validator = get_schema_validator(schema=schema)
+    assert get_schema_validator(schema=schema) is validator
+
+
+def test_get_schema_validator_no_id():
+    schema = {"type": "object"}
+    assert get_schema_validator(schema=schema) is not get_schema_validator(schema=schema)
+
+
+def test_get_schema_validator_threads():
+    schema = load_schema(name="iso_19115_2_v4")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        validators = list(executor.map(lambda _: get_schema_validator(schema=schema), range(8)))
+    assert len({id(validator) for validator in validators}) == 1
+
+
+def test_warm_schema_validators():
+    warm_schema_validators()
+    schema = load_schema(name="magic_discovery_v2")
+    assert (schema["$id"], None, None) in _schema_validators
+
+
+def test_validate_instance_invalid():
+    with pytest.raises(ValidationError) as e:
+        validate_instance(instance={}, schema=load_schema(name="iso_19115_0_v4"))
+    assert "is a required property" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    ("value", "format_", "expected"),
+    [
+        ("https://example.com/foo?bar=1#baz", "uri", True),
+        ("/foo", "uri", False),
+        ("not a uri", "uri", False),
+        ("/foo", "uri-reference", True),
+        ("not a uri", "uri-reference", False),
+        ("2018-01-01T12:30:00Z", "date-time", True),
+        ("2018-01-01t12:30:00+01:00", "date-time", True),
+        ("2018-01-01", "date-time", False),
+        ("2018-01-01", "date", True),
+        (1, "uri", True),
+    ],
+)
+def test_format_checker(value, format_: str, expected: bool):
+    assert get_format_checker().conforms(value, format_) is expected
+
+
+def test_format_checker_memoized():
+    _is_uri.cache_clear()
+    for _ in range(3):
+        get_format_checker().conforms("https://example.com", "uri")
+    assert _is_uri.cache_info().hits == 2
+    assert _is_uri.cache_info().misses == 1
+
+
+def test_format_checker_registry_unchanged():
+    """Custom format checks apply to the library's checker only, not the default jsonschema checkers."""
+    assert get_format_checker().checkers["uri"] != Draft7Validator.FORMAT_CHECKER.checkers["uri"]
+    assert get_format_checker().checkers["uri"] != FormatChecker.checkers["uri"]
+    assert set(Draft7Validator.FORMAT_CHECKER.checkers).issubset(get_format_checker().checkers)
+
+
+def test_validate_instance_formats():
+    schema = {"$id": "#", "type": "object", "properties": {"foo": {"type": "string", "format": "uri"}}}
+    validate_instance(instance={"foo": "x"}, schema=schema)
+    with pytest.raises(ValidationError, match="is not a 'uri'"):
+        validate_instance(instance={"foo": "x"}, schema=schema, format_checker=get_format_checker())
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("foo", "foo"),
+        (1, 1),
+        (None, None),
+        ((1, 2), [1, 2]),
+        (date(2018, 1, 1), "2018-01-01"),
+        (datetime(2018, 1, 1, 12, 30), "2018-01-01 12:30:00"),
+    ],
+)
+def test_encode_json_member(value, expected):
+    assert encode_json_member("foo", value) == expected
+
+
+@pytest.mark.parametrize("encode_config", [False, True])
+def test_config_class_validate_date(encode_config: bool):
+    schema = {"type": "object", "properties": {"foo": {"type": "string", "pattern": "^2018-"}}}
+    configuration = MetadataRecordConfig(foo=date(2018, 1, 1))
+    configuration.schema = schema
+    configuration.validate(encode_config=encode_config)
+    assert configuration.config["foo"] == date(2018, 1, 1)
+
+
+def test_xml_schema_cached():
+    """XML schemas are compiled once, including imported schemas resolved from within this package."""
+    warm_xml_schemas(xsd_paths=[Path("gmd/gmd.xsd")])
+    schema = get_xml_schema(Path("gmd/gmd.xsd"))
+    assert get_xml_schema(Path("gmd/gmd.xsd")) is schema
+    assert get_xml_schema("gmd/gmd.xsd") is schema
+
+
+def test_validate_xml_document_errors():
+    """Validation errors include line numbers for parsed documents."""
+    document = fromstring(
+        b'<?xml version="1.0" encoding="utf-8"?>\n'
+        b'<gmd:MD_Metadata xmlns:gmd="http://www.isotc211.org/2005/gmd">\n'
+        b"  <gmd:invalid/>\n"
+        b"</gmd:MD_Metadata>"
+    )
+    with pytest.raises(RecordValidationError) as e:
+        validate_xml_document(document=document, xsd_path=Path("gmd/gmd.xsd"))
+    assert "Record validation failed:" in str(e.value)
+    assert e.value.errors[0].line == 3
+    assert e.value.errors[0].path == "/gmd:MD_Metadata/gmd:invalid"
+
+
+@pytest.mark.parametrize("source", ["str", "bytes", "bytearray", "memoryview", "mmap", "path"])
+def test_validate_xml_document_sources(tmp_path: Path, source: str):
+    """Text documents are parsed as content, not paths, other buffers are parsed in place."""
+    document = '<gmd:MD_Metadata xmlns:gmd="http://www.isotc211.org/2005/gmd"><gmd:invalid/></gmd:MD_Metadata>'
+    document_path = tmp_path / "record.xml"
+    document_path.write_text(document)
+
+    with document_path.open(mode="rb") as document_file, mmap(
+        document_file.fileno(), 0, access=ACCESS_READ
+    ) as document_mmap:
+        document = {
+            "str": document,
+            "bytes": document.encode(),
+            "bytearray": bytearray(document.encode()),
+            "memoryview": memoryview(document.encode()),
+            "mmap": document_mmap,
+            "path": document_path,
+        }[source]
+
+        assert parse_xml_document(document).getroot().tag == "{http://www.isotc211.org/2005/gmd}MD_Metadata"
+        with pytest.raises(RecordValidationError) as e:
+            validate_xml_document(document=document, xsd_path=Path("gmd/gmd.xsd"))
+        assert e.value.errors[0].path == "/gmd:MD_Metadata/gmd:invalid"
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from datetime import date
+
+import pytest
+from importlib_resources import files as resource_file
+from jsonschema import FormatChecker
+
+from bas_metadata_library import get_format_checker, get_schema_validator, load_schema
+from bas_metadata_library.codegen import (
+    _load_generated_module,
+    generate_validator_source,
+    get_generated_validator,
+    json_equal,
+)
+from bas_metadata_library.standards.iso_19115_common.utils import encode_config_member
+from bas_metadata_library.standards.iso_19115_0 import MetadataRecordConfigV4 as ISO19115_0_MetadataRecordConfigV4
+from bas_metadata_library.standards.iso_19115_2 import MetadataRecordConfigV4 as ISO19115_2_MetadataRecordConfigV4
+from tests.resources.configs.iso19115_0_standard import configs_v4_all as iso19115_0_configs
+from tests.resources.configs.iso19115_2_standard import configs_v4_all as iso19115_2_configs
+from tests.resources.configs.magic_administration_profile import content_configs_all, encoding_configs_all
+from tests.resources.configs.magic_discovery_profile import configs_v1_all, configs_v2_all
+
+schema_names = [
+    "iso_19115_0_v4",
+    "iso_19115_2_v4",
+    "magic_discovery_v1",
+    "magic_discovery_v2",
+    "magic_administration_content_v1",
+    "magic_administration_encoding_v1",
+]
+test_configs = [
+    *[("iso_19115_0_v4", name, ISO19115_0_MetadataRecordConfigV4(**config).config) for name, config in iso19115_0_configs.items()],
+    *[("iso_19115_2_v4", name, ISO19115_2_MetadataRecordConfigV4(**config).config) for name, config in iso19115_2_configs.items()],
+    *[("magic_discovery_v1", name, config) for name, config in configs_v1_all.items()],
+    *[("magic_discovery_v2", name, config) for name, config in configs_v2_all.items()],
+    # MAGIC Discovery v1 records are not valid against v2 (and vice versa), checking records are rejected consistently
+    *[("magic_discovery_v2", name, config) for name, config in configs_v1_all.items()],
+    *[("magic_discovery_v1", name, config) for name, config in configs_v2_all.items()],
+    *[("magic_administration_content_v1", name, config) for name, config in content_configs_all.items()],
+    *[("magic_administration_encoding_v1", name, config) for name, config in encoding_configs_all.items()],
+]
+
+
+def _mutations(config: dict, depth: int = 2) -> list[dict]:
+    """Copies of a config with each member (to a given depth) removed or replaced with an unexpected value."""
+    mutations = []
+
+    def _walk(value: object, path: tuple) -> None:
+        if len(path) >= depth:
+            return
+        members = value.items() if isinstance(value, dict) else enumerate(value) if isinstance(value, list) else []
+        for key, member in list(members):
+            for replacement in ["DELETE", None, 1, True, "x", [], {}, date(2012, 1, 1)]:
+                mutation = deepcopy(config)
+                target = mutation
+                for part in path:
+                    target = target[part]
+                if replacement == "DELETE":
+                    del target[key]
+                else:
+                    target[key] = replacement
+                mutations.append(mutation)
+            _walk(member, (*path, key))
+
+    _walk(config, ())
+    return mutations
+
+
+@pytest.mark.parametrize("schema_name", schema_names)
+def test_generated_validator_current(schema_name: str):
+    """Generated validators exist for each distribution schema and are up to date."""
+    schema = load_schema(name=schema_name)
+    assert get_generated_validator(schema=schema) is not None
+
+    module_path = resource_file("bas_metadata_library.schemas.validators").joinpath(f"{schema_name}.py")
+    assert module_path.read_text() == generate_validator_source(schema=schema, source=f"{schema_name}.json")
+
+
+@pytest.mark.parametrize("format_checker", [None, get_format_checker()], ids=["no-formats", "formats"])
+@pytest.mark.parametrize(("schema_name", "config_name", "config"), test_configs)
+def test_generated_validator_equivalent(
+    schema_name: str, config_name: str, config: dict, format_checker: FormatChecker | None
+):
+    """Generated validators accept and reject the same configs as `jsonschema` validators."""
+    schema = load_schema(name=schema_name)
+    generated_validator = get_generated_validator(schema=schema)
+
+    for encode_member in [None, encode_config_member]:
+        validator = get_schema_validator(schema=schema, encode_member=encode_member, format_checker=format_checker)
+        assert generated_validator(config, encode_member, format_checker) == validator.is_valid(config)
+
+    for mutation in _mutations(config):
+        try:
+            expected = validator.is_valid(mutation)
+        except (AttributeError, TypeError, ValueError) as e:
+            with pytest.raises(type(e)):
+                generated_validator(mutation, encode_config_member, format_checker)
+            continue
+        assert generated_validator(mutation, encode_config_member, format_checker) == expected
+
+
+def test_generated_validator_stale():
+    """Generated validators are not used for schemas that differ from the schema they were generated from."""
+    schema = deepcopy(load_schema(name="magic_administration_content_v1"))
+    assert _load_generated_module(schema=schema) is not None
+    schema["required"] = []
+    assert _load_generated_module(schema=schema) is None
+
+
+def test_generated_validator_unknown():
+    assert get_generated_validator(schema={"$id": "https://example.com/schema.json"}) is None
+    assert get_generated_validator(schema={"$id": "#"}) is None
+
+
+def test_generate_validator_unsupported():
+    with pytest.raises(ValueError, match="Unsupported JSON Schema keywords"):
+        generate_validator_source(schema={"$id": "https://example.com/schema.json", "uniqueItems": True}, source="x")
+    with pytest.raises(ValueError, match="Unsupported JSON Schema keywords"):
+        generate_validator_source(
+            schema={"$id": "https://example.com/schema.json", "properties": {"foo": {"uniqueItems": True}}}, source="x"
+        )
+    with pytest.raises(ValueError, match="Unsupported reference"):
+        generate_validator_source(schema={"$id": "https://example.com/schema.json", "$ref": "x.json"}, source="x")
+
+
+@pytest.mark.parametrize(
+    ("one", "two", "expected"),
+    [
+        ("a", "a", True),
+        (1, 1.0, True),
+        (True, 1, False),
+        (False, 0, False),
+        ([1, True], [1, True], True),
+        ([1, True], [1, 1], False),
+        ({"a": [1]}, {"a": [1]}, True),
+        ({"a": 1}, {"a": 1, "b": 2}, False),
+    ],
+)
+def test_json_equal(one: object, two: object, expected: bool):
+    assert json_equal(one, two) is expected
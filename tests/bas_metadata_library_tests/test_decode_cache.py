@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from bas_metadata_library.decode_cache import (
+    DecodeCache,
+    DecodeCacheStats,
+    get_decode_cache,
+    record_digest,
+    set_decode_cache,
+)
+from bas_metadata_library.standards.iso_19115_2 import MetadataRecord
+from bas_metadata_library.standards.iso_19115_common import decoder
+from tests.resources.configs.iso19115_2_standard import configs_v4_all
+
+standard = "iso-19115-2"
+
+
+@pytest.fixture()
+def fx_decode_cache() -> DecodeCache:
+    cache = DecodeCache()
+    set_decode_cache(cache)
+    yield cache
+    set_decode_cache(None)
+
+
+def test_cache_key():
+    key = DecodeCache.key(digest="x", root_tag="a", fields=["b", "c"])
+    assert key == DecodeCache.key(digest="x", root_tag="a", fields=["c", "b"])
+    assert key != DecodeCache.key(digest="x", root_tag="a")
+    assert key != DecodeCache.key(digest="y", root_tag="a", fields=["b", "c"])
+    assert key != DecodeCache.key(digest="x", root_tag="b", fields=["b", "c"])
+
+
+def test_cache_copies():
+    cache = DecodeCache()
+    config = {"foo": ["bar"]}
+    cache.add("x", config)
+    config["foo"].append("baz")
+
+    cached = cache.get("x")
+    assert cached == {"foo": ["bar"]}
+    cached["foo"].append("baz")
+    assert cache.get("x") == {"foo": ["bar"]}
+    assert cache.get("y") is None
+    assert cache.stats() == DecodeCacheStats(hits=2, misses=1, entries=1, size=cache.stats().size)
+
+    cache.clear()
+    assert cache.stats() == DecodeCacheStats(hits=0, misses=0, entries=0, size=0)
+
+
+def test_cache_eviction():
+    """Least recently used entries are removed where the cache is full."""
+    cache = DecodeCache(max_entries=3)
+    for key in ["a", "b", "c"]:
+        cache.add(key, {"key": key})
+    assert cache.get("a") is not None
+    cache.add("d", {"key": "d"})
+
+    assert len(cache) == 3
+    assert "b" not in cache
+    assert all(key in cache for key in ["a", "c", "d"])
+
+
+def test_cache_eviction_size():
+    """Least recently used entries are removed where the cache is too large, and entries too large are not cached."""
+    cache = DecodeCache()
+    cache.add("a", {"value": "a" * 1000})
+    cache.max_bytes = cache.stats().size * 2
+    cache.add("b", {"value": "b" * 1000})
+    cache.add("c", {"value": "c" * 1000})
+
+    assert "a" not in cache
+    assert all(key in cache for key in ["b", "c"])
+    assert cache.stats().size <= cache.max_bytes
+
+    cache.add("d", {"value": "d" * 10_000})
+    assert "d" not in cache
+    assert len(cache) == 2
+
+
+def test_set_decode_cache(fx_decode_cache: DecodeCache):
+    assert get_decode_cache() is fx_decode_cache
+
+
+def test_make_config_cached(monkeypatch: MonkeyPatch, fx_decode_cache: DecodeCache):
+    calls = []
+    _decode_record = decoder._decode_record
+
+    def _decode(*args: object, **kwargs: object) -> object:
+        calls.append(1)
+        return _decode_record(*args, **kwargs)
+
+    monkeypatch.setattr(decoder, "_decode_record", _decode)
+    record_path = Path().resolve().parent.joinpath(f"resources/records/{standard}/complete_v4-record.xml")
+
+    record = MetadataRecord(record=record_path)
+    assert record.record_digest == record_digest(record_path.read_bytes())
+    config = record.make_config().config
+    config["identification"]["title"]["value"] = "changed"
+
+    for source in [record_path, record_path.read_bytes(), record_path.read_text()]:
+        assert MetadataRecord(record=source).make_config().config == configs_v4_all["complete_v4"]
+    assert MetadataRecord(record=record_path).make_config(fields=["file_identifier"]).config == {
+        "$schema": config["$schema"],
+        "file_identifier": configs_v4_all["complete_v4"]["file_identifier"],
+    }
+
+    assert len(calls) == 2
+    assert fx_decode_cache.stats() == DecodeCacheStats(
+        hits=3, misses=2, entries=2, size=fx_decode_cache.stats().size
+    )
+
+
+def test_make_config_not_cached():
+    record_path = Path().resolve().parent.joinpath(f"resources/records/{standard}/minimal_v4-record.xml")
+    record = MetadataRecord(record=record_path)
+    assert record.record_digest is None
+    assert record.make_config().config == configs_v4_all["minimal_v4"]
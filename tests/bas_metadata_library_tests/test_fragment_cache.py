@@ -0,0 +1,89 @@
+from datetime import date
+
+import pytest
+from lxml.etree import Element, SubElement, tostring
+
+from bas_metadata_library.fragment_cache import (
+    FragmentCache,
+    FragmentCacheStats,
+    get_fragment_cache,
+    set_fragment_cache,
+)
+from bas_metadata_library.standards.iso_19115_2 import MetadataRecord, MetadataRecordConfigV4
+from bas_metadata_library.standards.iso_19115_common import GMD
+from bas_metadata_library.standards.iso_19115_common.common_elements import ResponsibleParty
+from tests.resources.configs.iso19115_2_standard import configs_v4_all
+
+
+@pytest.fixture()
+def fx_fragment_cache() -> FragmentCache:
+    cache = FragmentCache()
+    set_fragment_cache(cache)
+    yield cache
+    set_fragment_cache(None)
+
+
+def test_cache_key():
+    key = FragmentCache.key(kind="a", config={"b": 1, "c": date(2020, 1, 1)})
+    assert key == FragmentCache.key(kind="a", config={"c": date(2020, 1, 1), "b": 1})
+    assert key != FragmentCache.key(kind="b", config={"b": 1, "c": date(2020, 1, 1)})
+    assert key != FragmentCache.key(kind="a", config={"b": 2, "c": date(2020, 1, 1)})
+    assert key != FragmentCache.key(kind="a", config={"b": 1, "c": "2020-01-01"})
+
+
+def test_cache_copies():
+    cache = FragmentCache()
+    element = Element("foo")
+    cache.add("x", [element])
+    element.text = "changed"
+
+    cached = cache.get("x")
+    assert tostring(cached[0]) == b"<foo/>"
+    SubElement(cached[0], "bar")
+    assert tostring(cache.get("x")[0]) == b"<foo/>"
+    assert cache.get("y") is None
+    assert cache.stats() == FragmentCacheStats(hits=2, misses=1, entries=1)
+
+    cache.clear()
+    assert cache.stats() == FragmentCacheStats(hits=0, misses=0, entries=0)
+
+
+def test_cache_eviction():
+    """Least recently used entries are removed where the cache is full."""
+    cache = FragmentCache(max_entries=3)
+    for key in ["a", "b", "c"]:
+        cache.add(key, [Element(key)])
+    assert cache.get("a") is not None
+    cache.add("d", [Element("d")])
+
+    assert len(cache) == 3
+    assert "b" not in cache
+    assert all(key in cache for key in ["a", "c", "d"])
+
+
+def test_set_fragment_cache(fx_fragment_cache: FragmentCache):
+    assert get_fragment_cache() is fx_fragment_cache
+
+
+def test_make_element_cached(fx_fragment_cache: FragmentCache):
+    contact = {"organisation": {"name": "British Antarctic Survey"}, "role": "pointOfContact"}
+    parent = Element("parent")
+    for _ in range(2):
+        ResponsibleParty(record=parent, attributes={}, parent_element=parent, element_attributes=contact).make_element()
+
+    assert [element.tag for element in parent] == [GMD.CI_ResponsibleParty, GMD.CI_ResponsibleParty]
+    assert tostring(parent[0]) == tostring(parent[1])
+    assert parent[0] is not parent[1]
+    assert fx_fragment_cache.stats() == FragmentCacheStats(hits=1, misses=1, entries=1)
+
+
+@pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
+def test_generate_record_cached(fx_fragment_cache: FragmentCache, config_name: str):
+    config = MetadataRecordConfigV4(**configs_v4_all[config_name])
+    set_fragment_cache(None)
+    expected = MetadataRecord(configuration=config).generate_xml_document()
+    set_fragment_cache(fx_fragment_cache)
+
+    for _ in range(2):
+        assert MetadataRecord(configuration=config).generate_xml_document() == expected
+    assert fx_fragment_cache.stats().hits > 0
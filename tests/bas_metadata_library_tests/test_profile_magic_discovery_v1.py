@@ -1,3 +1,4 @@
+import json
 from copy import deepcopy
 from http import HTTPStatus
 from pathlib import Path
@@ -8,11 +9,13 @@ from flask.testing import FlaskClient
 from jsonschema.exceptions import ValidationError
 from lxml.etree import tostring, ElementTree
 
+from bas_metadata_library import get_format_checker
 from bas_metadata_library.standards.iso_19115_2 import (
     MetadataRecord,
     MetadataRecordConfigV4,
     Namespaces,
 )
+from bas_metadata_library.standards.iso_19115_common.utils import get_profile_validator, validate_profiles
 from tests.resources.configs.magic_discovery_profile import configs_v1_all
 
 profile = "magic-discovery"
@@ -43,6 +46,32 @@ def test_config_schema_validation_invalid_profile_alt():
     assert "'file_identifier' is a required property" in str(e.value)
 
 
+def test_profile_validator_cached():
+    """Profile validators are compiled once and shared between URIs for the same profile."""
+    validator = get_profile_validator("https://metadata-standards.data.bas.ac.uk/profiles/magic-discovery/v1/")
+    assert get_profile_validator("https://metadata-standards.data.bas.ac.uk/profiles/magic-discovery/v1/") is validator
+    assert get_profile_validator("https://metadata-standards.data.bas.ac.uk/profiles/magic-discovery-v1/") is validator
+
+
+def test_profile_validator_format_checker():
+    """Profile validators are compiled with, and cached per, any format checker given."""
+    format_checker = get_format_checker()
+    validator = get_profile_validator(
+        "https://metadata-standards.data.bas.ac.uk/profiles/magic-discovery/v1/", format_checker=format_checker
+    )
+    assert validator.format_checker is format_checker
+    assert get_profile_validator("https://metadata-standards.data.bas.ac.uk/profiles/magic-discovery/v1/") is not validator
+
+
+def test_validate_profiles_explicit_keys():
+    """Profiles are only validated for the profile keys given, where set."""
+    config = json.loads(MetadataRecordConfigV4(**configs_v1_all["minimal_product_v1"]).dumps())
+    del config["file_identifier"]
+    validate_profiles(config=config, profile_keys=[])
+    with pytest.raises(ValidationError):
+        validate_profiles(config=config)
+
+
 @pytest.mark.parametrize("config_name", list(configs_v1_all.keys()))
 def test_response(app_client: FlaskClient, config_name: str):
     response = app_client.get(f"/profiles/{profile}/{config_name}")
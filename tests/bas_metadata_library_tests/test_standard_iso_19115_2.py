@@ -1,6 +1,10 @@
+import gzip
 import json
 from copy import deepcopy
+from datetime import date
 from http import HTTPStatus
+from io import BytesIO
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Callable
@@ -8,14 +12,31 @@ from typing import Callable
 import pytest
 from flask.testing import FlaskClient
 from jsonschema import ValidationError
-from lxml.etree import XML, ElementTree, tostring
+from lxml.etree import XML, Element, ElementTree, fromstring, tostring
 
-from bas_metadata_library import RecordValidationError
+from bas_metadata_library import RecordValidationError, validate_many
 from bas_metadata_library.standards.iso_19115_2 import (
     MetadataRecord,
     MetadataRecordConfigV4,
     Namespaces,
 )
+from bas_metadata_library.standards.iso_19115_common import GMD, GMI, NAMESPACES, NSMAP, decoder, mapping
+from bas_metadata_library.standards.iso_19115_common.common_elements import Citation, Language
+from bas_metadata_library.standards.iso_19115_common.data_identification_elements import Abstract, Extent
+from bas_metadata_library.standards.iso_19115_common.decoder import decode_record
+from bas_metadata_library.standards.iso_19115_common.mapping import (
+    CITATION,
+    LEGAL_CONSTRAINT,
+    MAINTENANCE_INFORMATION,
+    ONLINE_RESOURCE,
+    ROLE,
+    SERIES,
+    CharacterString,
+    compile_mapping,
+)
+from bas_metadata_library.standards.iso_19115_common.mapping import _children as mapping_children
+from bas_metadata_library.standards.iso_19115_common.root_element import ISOMetadataRecord
+from bas_metadata_library.standards.iso_19115_common.utils import match_distribution_options
 from tests.resources.configs.iso19115_2_standard import configs_v4_all
 
 standard = "iso-19115-2"
@@ -30,6 +51,78 @@ def test_invalid_configuration_v4():
     assert "'metadata' is a required property" in str(e.value)
 
 
+@pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
+@pytest.mark.parametrize("encode_config", [False, True])
+def test_configuration_v4_validate(config_name: str, encode_config: bool):
+    config = deepcopy(configs_v4_all[config_name])
+    configuration = MetadataRecordConfigV4(**config)
+    configuration.validate(encode_config=encode_config)
+    assert configuration.config == {"$schema": configuration.schema_uri, **configs_v4_all[config_name]}
+
+
+@pytest.mark.parametrize("encode_config", [False, True])
+def test_configuration_v4_validate_invalid_date(encode_config: bool):
+    config = deepcopy(configs_v4_all["minimal_v4"])
+    config["identification"]["title"]["value"] = date(2018, 1, 1)
+    configuration = MetadataRecordConfigV4(**config)
+    with pytest.raises(ValidationError) as e:
+        configuration.validate(encode_config=encode_config)
+    assert "is not of type 'string'" in str(e.value)
+    assert list(e.value.path) == ["identification", "title", "value"]
+
+
+@pytest.mark.parametrize("encode_config", [False, True])
+def test_configuration_v4_validate_formats(encode_config: bool):
+    config = deepcopy(configs_v4_all["complete_v4"])
+    config["identification"]["graphic_overviews"][0]["href"] = "not a uri"
+    configuration = MetadataRecordConfigV4(**config)
+    with pytest.raises(ValidationError) as e:
+        configuration.validate(encode_config=encode_config, check_formats=True)
+    assert "is not a 'uri-reference'" in str(e.value)
+    assert list(e.value.path) == ["identification", "graphic_overviews", 0, "href"]
+
+
+@pytest.mark.parametrize(
+    ("name", "path"),
+    [
+        ("contact", ["metadata", "contacts", 0]),
+        ("maintenance", ["metadata", "maintenance"]),
+        ("dates", ["identification", "dates"]),
+        ("extent", ["identification", "extents", 0]),
+        ("specification", ["identification", "domain_consistency", 0, "specification"]),
+        ("distribution_option", ["distribution", 0]),
+    ],
+)
+def test_configuration_v4_validate_fragment(name: str, path: list):
+    configuration = MetadataRecordConfigV4(**deepcopy(configs_v4_all["complete_v4"]))
+    fragment = configuration.config
+    for part in path:
+        fragment = fragment[part]
+    configuration.validate_fragment(name=name, fragment=fragment, path=path)
+
+
+@pytest.mark.parametrize("fragment_key", ["organisation", "role"])
+def test_configuration_v4_validate_fragment_invalid(fragment_key: str):
+    """Fragment errors are the same as errors from validating a whole config."""
+    configuration = MetadataRecordConfigV4(**deepcopy(configs_v4_all["complete_v4"]))
+    contact = configuration.config["identification"]["contacts"][0]
+    contact[fragment_key] = 1
+
+    with pytest.raises(ValidationError) as e:
+        configuration.validate()
+    with pytest.raises(ValidationError) as e_fragment:
+        configuration.validate_fragment(name="contact", fragment=contact, path=["identification", "contacts", 0])
+    assert e_fragment.value.message == e.value.message
+    assert list(e_fragment.value.absolute_path) == list(e.value.absolute_path)
+    assert list(e_fragment.value.absolute_path)[:3] == ["identification", "contacts", 0]
+
+
+def test_configuration_v4_validate_fragment_unknown():
+    configuration = MetadataRecordConfigV4(**deepcopy(configs_v4_all["minimal_v4"]))
+    with pytest.raises(ValueError, match="does not define a sub-schema named 'invalid'"):
+        configuration.validate_fragment(name="invalid", fragment={})
+
+
 @pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
 def test_configuration_v4_from_json_file(config_name: str):
     configuration = MetadataRecordConfigV4()
@@ -128,6 +221,175 @@ def test_parse_existing_record_v4(config_name: str):
     assert config == configs_v4_all[config_name]
 
 
+@pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
+def test_parse_existing_record_v4_elements(config_name: str):
+    """Element classes decode the elements selected by their XPath using the decoder."""
+    record_path = Path().resolve().parent.joinpath(f"resources/records/{standard}/{config_name}-record.xml")
+    record = fromstring(record_path.read_bytes())
+    identification = "/gmi:MI_Metadata/gmd:identificationInfo/gmd:MD_DataIdentification"
+
+    expected = deepcopy(configs_v4_all[config_name])
+    expected.pop("$schema")
+    assert ISOMetadataRecord(record=record, attributes={}, xpath="/gmi:MI_Metadata").make_config() == expected
+
+    citation = Citation(record=record, attributes={}, xpath=f"{identification}/gmd:citation")
+    assert citation.make_config()["title"] == expected["identification"]["title"]
+    abstract = Abstract(record=record, attributes={}, xpath=f"{identification}/gmd:abstract")
+    assert abstract.make_config() == expected["identification"]["abstract"]
+    language = Language(record=record, attributes={}, xpath="/gmi:MI_Metadata/gmd:language")
+    assert language.make_config() == expected["metadata"].get("language", "")
+    for index, extent in enumerate(expected["identification"].get("extents", []), start=1):
+        assert Extent(record=record, attributes={}, xpath=f"({identification}/gmd:extent)[{index}]").make_config() == extent
+
+
+@pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
+def test_parse_existing_record_v4_repeated_elements(config_name: str):
+    """Values of unexpectedly repeated elements are omitted, rather than picking one of them."""
+    record_path = Path().resolve().parent.joinpath(f"resources/records/{standard}/{config_name}-record.xml")
+    record = fromstring(record_path.read_bytes())
+    for element in record.xpath(
+        "gmd:fileIdentifier|gmd:identificationInfo/*/gmd:citation/gmd:CI_Citation/gmd:title",
+        namespaces=namespaces.nsmap(),
+    ):
+        element.addnext(deepcopy(element))
+
+    expected = deepcopy(configs_v4_all[config_name])
+    expected.pop("$schema")
+    expected.pop("file_identifier", None)
+    del expected["identification"]["title"]
+    assert decode_record(record=record, root_tag=f"{{{Namespaces.gmi}}}MI_Metadata") == expected
+
+
+def test_parse_repeated_elements_many():
+    """Each of many repeated elements (e.g. 10,000 graphic overviews) is decoded, in order."""
+    record_path = Path().resolve().parent.joinpath(f"resources/records/{standard}/complete_v4-record.xml")
+    record = fromstring(record_path.read_bytes())
+    graphic_overviews = list(record.iter(f"{{{namespaces.gmd}}}graphicOverview"))
+    for _ in range(10_000 - len(graphic_overviews)):
+        graphic_overviews[-1].addnext(deepcopy(graphic_overviews[0]))
+
+    config = decode_record(record=record, root_tag=f"{{{namespaces.gmi}}}MI_Metadata")
+
+    expected = configs_v4_all["complete_v4"]["identification"]["graphic_overviews"]
+    graphic_overviews = config["identification"]["graphic_overviews"]
+    assert len(graphic_overviews) == 10_000
+    assert graphic_overviews[: len(expected)] == expected
+    assert all(overview == expected[0] for overview in graphic_overviews[len(expected) :])
+
+
+def _count_visited(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count the child elements visited when selecting elements while decoding, as a measure of decoding work."""
+    visited = []
+
+    def _children(nodes: list[Element], *tags: str) -> list[Element]:
+        visited.append(sum(len(node) for node in nodes))
+        return mapping_children(nodes, *tags)
+
+    monkeypatch.setattr(mapping, "_children", _children)
+    monkeypatch.setattr(decoder, "_children", _children)
+    return visited
+
+
+def test_parse_repeated_elements_linear(monkeypatch: pytest.MonkeyPatch):
+    """Decoding work grows linearly with the number of repeated elements (e.g. graphic overviews)."""
+    record_path = Path().resolve().parent.joinpath(f"resources/records/{standard}/complete_v4-record.xml")
+    visited = _count_visited(monkeypatch=monkeypatch)
+
+    def _decode(repeats: int) -> int:
+        record = fromstring(record_path.read_bytes())
+        graphic_overviews = list(record.iter(f"{{{namespaces.gmd}}}graphicOverview"))
+        for _ in range(repeats - len(graphic_overviews)):
+            graphic_overviews[0].addnext(deepcopy(graphic_overviews[0]))
+
+        visited.clear()
+        config = decode_record(record=record, root_tag=f"{{{namespaces.gmi}}}MI_Metadata")
+        assert len(config["identification"]["graphic_overviews"]) == repeats
+        return sum(visited)
+
+    visited_small = _decode(repeats=100)
+    visited_large = _decode(repeats=200)
+    # 2x the elements should visit less than 2x as many elements, quadratic decoding would visit ~4x as many
+    assert visited_small < visited_large <= visited_small * 2
+
+
+def test_parse_distribution_options_linear(monkeypatch: pytest.MonkeyPatch):
+    """Decoding work grows linearly with the number of distributor formats and transfer options in a distributor."""
+    record_path = Path().resolve().parent.joinpath(f"resources/records/{standard}/complete_v4-record.xml")
+    visited = _count_visited(monkeypatch=monkeypatch)
+    matches = []
+
+    def _match_distribution_options(distribution_formats: list[dict], transfer_options: list[dict]) -> list[dict]:
+        matches.append(1)
+        return match_distribution_options(distribution_formats=distribution_formats, transfer_options=transfer_options)
+
+    monkeypatch.setattr(decoder, "match_distribution_options", _match_distribution_options)
+
+    def _decode(repeats: int) -> int:
+        record = fromstring(record_path.read_bytes())
+        distributors = list(record.iter(f"{{{namespaces.gmd}}}MD_Distributor"))
+        distribution_format = distributors[0].find(f"{{{namespaces.gmd}}}distributorFormat")
+        transfer_option = distributors[0].find(f"{{{namespaces.gmd}}}distributorTransferOptions")
+        for element in [distribution_format, transfer_option]:
+            for _ in range(repeats - 1):
+                element.addnext(deepcopy(element))
+
+        # IDs must be unique to match formats and transfer options as separate distribution options
+        for index, element in enumerate(distributors[0].iterfind(f"{{{namespaces.gmd}}}distributorFormat/*")):
+            element.attrib["id"] = f"bml-{index}-fmt"
+        for index, element in enumerate(distributors[0].iterfind(f"{{{namespaces.gmd}}}distributorTransferOptions/*")):
+            element.attrib["id"] = f"bml-{index}-tfo"
+
+        visited.clear()
+        matches.clear()
+        config = decode_record(record=record, root_tag=f"{{{namespaces.gmi}}}MI_Metadata")
+        assert len(config["distribution"]) >= repeats
+        # formats and transfer options are matched once per distributor, rather than once per option
+        assert len(matches) == len(distributors)
+        return sum(visited)
+
+    visited_small = _decode(repeats=100)
+    visited_large = _decode(repeats=200)
+    # 2x the options should visit less than 2x as many elements, quadratic decoding would visit ~4x as many
+    assert visited_small < visited_large <= visited_small * 2
+
+
+@pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
+def test_parse_existing_record_v4_fields(config_name: str):
+    with Path().resolve().parent.joinpath(f"resources/records/{standard}/{config_name}-record.xml").open() as record_file:
+        record_data = record_file.read()
+
+    record = MetadataRecord(record=record_data)
+    config = record.make_config(
+        fields=["file_identifier", "metadata.date_stamp", "identification.title", "identification.extents"]
+    ).config
+
+    full_config = configs_v4_all[config_name]
+    expected = {
+        "$schema": record.make_config().config["$schema"],
+        "metadata": {"date_stamp": full_config["metadata"]["date_stamp"]},
+        "identification": {
+            key: full_config["identification"][key] for key in ["title", "extents"] if key in full_config["identification"]
+        },
+    }
+    if "file_identifier" in full_config:
+        expected["file_identifier"] = full_config["file_identifier"]
+    assert config == expected
+
+
+@pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
+def test_parse_existing_record_v4_lazy(config_name: str):
+    with Path().resolve().parent.joinpath(f"resources/records/{standard}/{config_name}-record.xml").open() as record_file:
+        record_data = record_file.read()
+
+    record = MetadataRecord(record=record_data)
+    config = record.make_lazy_config()
+    assert config.get("file_identifier") == configs_v4_all[config_name].get("file_identifier")
+    assert config.decoded_sections == ["$schema", "file_identifier"]
+    assert "distribution" not in config.decoded_sections
+    assert config.materialise() == record.make_config().config
+    assert MetadataRecordConfigV4(**config).config == record.make_config().config
+
+
 @pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
 def test_lossless_conversion_v4(fx_get_record_response: Callable[...,ElementTree], config_name: str):
     _record = tostring(
@@ -147,6 +409,58 @@ def test_lossless_conversion_v4(fx_get_record_response: Callable[...,ElementTree
     assert _config == config_
 
 
+@pytest.mark.parametrize("pretty_print", [True, False])
+@pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
+def test_write_xml_document_v4(config_name: str, pretty_print: bool):
+    config = MetadataRecordConfigV4(**configs_v4_all[config_name])
+    expected = tostring(
+        ElementTree(MetadataRecord(configuration=config).make_element()),
+        pretty_print=pretty_print,
+        xml_declaration=True,
+        encoding="utf-8",
+    )
+
+    record = MetadataRecord(configuration=config)
+    document = BytesIO()
+    record.write_xml_document(file=document, pretty_print=pretty_print)
+    assert document.getvalue() == expected
+    assert len(record.record) == 0
+
+
+@pytest.mark.parametrize(("pretty_print", "compress"), [(True, True), (False, False), (False, True)])
+@pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
+def test_generate_xml_document_v4_modes(config_name: str, pretty_print: bool, compress: bool):
+    config = MetadataRecordConfigV4(**configs_v4_all[config_name])
+    document = MetadataRecord(configuration=config).generate_xml_document(pretty_print=pretty_print, compress=compress)
+
+    expected = MetadataRecord(configuration=config).generate_xml_document(pretty_print=pretty_print)
+    assert (gzip.decompress(document) if compress else document) == expected
+    assert (b"\n  <" in expected) == pretty_print
+
+    MetadataRecord.validate_document(document=document)
+    assert MetadataRecord(record=document).make_config().config == configs_v4_all[config_name]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("destination", ["path", "file"])
+def test_generate_xml_document_v4_file(destination: str, compress: bool):
+    config = MetadataRecordConfigV4(**configs_v4_all["complete_v4"])
+    expected = MetadataRecord(configuration=config).generate_xml_document()
+
+    with TemporaryDirectory() as document_dir:
+        document_path = Path(document_dir).joinpath("record.xml")
+        record = MetadataRecord(configuration=config)
+        if destination == "path":
+            assert record.generate_xml_document(compress=compress, file=document_path) is None
+        else:
+            with document_path.open(mode="wb") as document_file:
+                assert record.generate_xml_document(compress=compress, file=document_file) is None
+
+        document = document_path.read_bytes()
+        assert (gzip.decompress(document) if compress else document) == expected
+        assert MetadataRecord(record=document_path).make_config().config == configs_v4_all["complete_v4"]
+
+
 @pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
 def test_record_schema_validation_valid(config_name: str):
     config = MetadataRecordConfigV4(**configs_v4_all[config_name])
@@ -162,3 +476,223 @@ def test_record_schema_validation_invalid():
         record.attributes["identification"]["spatial_resolution"] = "invalid"
         record.validate()
     assert "Record validation failed:" in str(e.value)
+    assert len(e.value.errors) > 0
+    assert "/gmd:spatialResolution/" in e.value.errors[0].path
+
+
+@pytest.mark.parametrize("document_type", ["str", "bytes", "memoryview", "mmap", "path", "element", "tree"])
+def test_record_schema_validation_document(document_type: str):
+    config = MetadataRecordConfigV4(**configs_v4_all["minimal_v4"])
+    document = MetadataRecord(configuration=config).generate_xml_document()
+
+    with TemporaryDirectory() as document_dir:
+        document_path = Path(document_dir).joinpath("record.xml")
+        document_path.write_bytes(document)
+        with document_path.open(mode="rb") as document_file, mmap(
+            document_file.fileno(), 0, access=ACCESS_READ
+        ) as document_mmap:
+            documents = {
+                "str": document.decode(),
+                "bytes": document,
+                "memoryview": memoryview(document),
+                "mmap": document_mmap,
+                "path": document_path,
+                "element": fromstring(document),
+                "tree": ElementTree(fromstring(document)),
+            }
+            MetadataRecord.validate_document(document=documents[document_type])
+
+
+def test_record_schema_validation_document_invalid():
+    config = deepcopy(MetadataRecordConfigV4(**configs_v4_all["minimal_v4"]))
+    record = MetadataRecord(configuration=config)
+    record.attributes["identification"]["spatial_resolution"] = "invalid"
+    document = record.generate_xml_document()
+    with pytest.raises(RecordValidationError) as e:
+        MetadataRecord.validate_document(document=document)
+    assert e.value.errors[0].line is not None
+
+    with pytest.raises(RecordValidationError) as e:
+        MetadataRecord.validate_document(document=b"<invalid>")
+    assert "Record validation failed:" in str(e.value)
+
+
+def _invalid_record() -> MetadataRecord:
+    record = MetadataRecord(configuration=MetadataRecordConfigV4(**deepcopy(configs_v4_all["minimal_v4"])))
+    record.attributes["identification"]["spatial_resolution"] = "invalid"
+    return record
+
+
+def test_record_schema_validation_many():
+    valid_document = MetadataRecord(configuration=MetadataRecordConfigV4(**configs_v4_all["minimal_v4"])).generate_xml_document()
+    records = (
+        record
+        for record in [
+            MetadataRecordConfigV4(**configs_v4_all["minimal_v4"]),
+            _invalid_record(),
+            valid_document,
+            _invalid_record().generate_xml_document(),
+        ]
+    )
+
+    results = list(validate_many(records=records, standard=MetadataRecord))
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.valid for result in results] == [True, False, True, False]
+    assert results[2].record is valid_document
+    assert len(results[1].errors) > 0
+    assert results[3].errors[0].line is not None
+    assert results[0].errors == []
+
+
+def test_record_schema_validation_many_stop_on_failure():
+    records = [_invalid_record(), MetadataRecordConfigV4(**configs_v4_all["minimal_v4"])]
+
+    results = list(validate_many(records=records, standard=MetadataRecord, stop_on_failure=True))
+    assert len(results) == 1
+    assert results[0].valid is False
+
+
+def test_record_schema_validation_xmllint():
+    config = deepcopy(MetadataRecordConfigV4(**configs_v4_all["minimal_v4"]))
+    record = MetadataRecord(configuration=config)
+    record.validate(use_xmllint=True)
+    with pytest.raises(RecordValidationError) as e:
+        record.attributes["identification"]["spatial_resolution"] = "invalid"
+        record.validate(use_xmllint=True)
+    assert "Record validation failed:" in str(e.value)
+
+
+def _embedded_records() -> list[bytes]:
+    records = []
+    for config_name in configs_v4_all:
+        with Path().resolve().parent.joinpath(f"resources/records/{standard}/{config_name}-record.xml").open(
+            mode="rb"
+        ) as record_file:
+            records.append(record_file.read())
+    return records
+
+
+@pytest.mark.parametrize("concatenated", [False, True])
+def test_parse_embedded_records_v4(concatenated: bool):
+    records = _embedded_records()
+    if concatenated:
+        document = b"\n".join(records)
+    else:
+        document = (
+            b'<?xml version="1.0" encoding="UTF-8"?>\n'
+            b'<csw:GetRecordsResponse xmlns:csw="http://www.opengis.net/cat/csw/2.0.2"><csw:SearchResults>'
+            + b"".join(record.split(b"?>", 1)[1] for record in records)
+            + b"</csw:SearchResults></csw:GetRecordsResponse>"
+        )
+
+    with TemporaryDirectory() as tmp_dir_name:
+        document_path = Path(tmp_dir_name).joinpath("records.xml")
+        document_path.write_bytes(document)
+        configs = list(MetadataRecord.iter_configs(document=document_path, concatenated=concatenated))
+
+    assert [config.config for config in configs] == [
+        MetadataRecord(record=record.decode()).make_config().config for record in records
+    ]
+
+
+def test_parse_embedded_records_v4_fields():
+    document = b"\n".join(_embedded_records())
+    configs = MetadataRecord.iter_configs(document=BytesIO(document), concatenated=True, fields=["metadata.date_stamp"])
+
+    assert [config.config["metadata"] for config in configs] == [
+        {"date_stamp": config["metadata"]["date_stamp"]} for config in configs_v4_all.values()
+    ]
+
+
+def test_parse_embedded_records_v4_invalid():
+    document = _embedded_records()[0][:-20]
+
+    with pytest.raises(RecordValidationError):
+        list(MetadataRecord.iter_configs(document=BytesIO(document)))
+
+
+@pytest.mark.parametrize("source", ["bytes", "mmap", "path", "file"])
+def test_parse_existing_record_v4_sources(source: str):
+    record_path = Path().resolve().parent.joinpath(f"resources/records/{standard}/complete_v4-record.xml")
+
+    with record_path.open(mode="rb") as record_file:
+        record = {
+            "bytes": lambda: record_file.read(),
+            "mmap": lambda: mmap(record_file.fileno(), 0, access=ACCESS_READ),
+            "path": lambda: record_path,
+            "file": lambda: record_file,
+        }[source]()
+        config = MetadataRecord(record=record).make_config().config
+
+    assert config == configs_v4_all["complete_v4"]
+
+
+@pytest.mark.parametrize("config_name", list(configs_v4_all.keys()))
+@pytest.mark.parametrize("maintenance", [False, True])
+def test_scan_existing_record_v4_header(config_name: str, maintenance: bool):
+    record_path = Path().resolve().parent.joinpath(f"resources/records/{standard}/{config_name}-record.xml")
+    header = MetadataRecord.scan_header(record=record_path, maintenance=maintenance)
+
+    config = configs_v4_all[config_name]
+    assert header.file_identifier == config.get("file_identifier")
+    assert header.hierarchy_level == config.get("hierarchy_level")
+    assert header.date_stamp == config["metadata"]["date_stamp"]
+    assert header.maintenance == (config["metadata"].get("maintenance") if maintenance else None)
+    assert not hasattr(header, "__dict__")
+
+
+def test_mapping_code_list():
+    parent = Element(f"{{{namespaces.gmd}}}CI_ResponsibleParty")
+    ROLE.encode(parent, {"role": "author"})
+    ROLE.encode(parent, {"role": "invalid"})
+
+    assert len(parent) == 2
+    assert len(parent[1]) == 0
+    assert parent[0][0].get("codeListValue") == "author"
+    assert ROLE.decode([parent]) == "author"
+    assert ROLE.decode([]) == ""
+    assert ROLE.tags == (GMD.role, GMD.CI_RoleCode)
+
+
+@pytest.mark.parametrize(
+    ("codec", "config"),
+    [
+        (MAINTENANCE_INFORMATION, {"maintenance_frequency": "asNeeded", "progress": "completed"}),
+        (MAINTENANCE_INFORMATION, {"progress": "completed"}),
+        (SERIES, {"name": "Series", "edition": "1", "page": "2"}),
+        (SERIES, {}),
+        (ONLINE_RESOURCE, {"href": "https://example.com", "title": "Example", "function": "download"}),
+        (
+            CITATION,
+            {
+                "title": {"value": "Title", "href": "https://example.com"},
+                "dates": {"creation": {"date": date(2020, 1, 1)}, "revision": {"date": date(2020, 1, 2)}},
+                "identifiers": [{"identifier": "x", "namespace": "y"}, {"identifier": "z"}],
+                "contact": {"organisation": {"name": "BAS"}, "email": "x@example.com", "role": ["author"]},
+                "series": {"name": "Series"},
+            },
+        ),
+        (LEGAL_CONSTRAINT, {"type": "usage", "restriction_code": "license", "href": "https://example.com"}),
+        (LEGAL_CONSTRAINT, {"type": "usage", "restriction_code": "otherRestrictions", "permissions": {"a": 1}}),
+    ],
+)
+def test_mapping_codec(codec, config: dict):
+    parent = Element(f"{{{namespaces.gmd}}}parent")
+    codec.encode(parent, config)
+    assert codec.decode([parent]) == config
+
+
+def test_compile_mapping_cached():
+    mapping = CharacterString(key="name", element="gmd:name")
+    assert compile_mapping(mapping) is compile_mapping(CharacterString(key="name", element="gmd:name"))
+    assert SERIES.mapping.members[0] == mapping
+    assert compile_mapping(mapping) is compile_mapping(SERIES.mapping.members[0])
+
+
+def test_shared_namespaces():
+    record = MetadataRecord(configuration=MetadataRecordConfigV4(**configs_v4_all["minimal_v4"]))
+    assert record.ns is NAMESPACES
+    assert record.metadata_record.ns is NAMESPACES
+    assert NSMAP == Namespaces().nsmap()
+    assert GMD.CI_Citation == f"{{{Namespaces.gmd}}}CI_Citation"
+    assert GMI.MI_Metadata == record.record.tag
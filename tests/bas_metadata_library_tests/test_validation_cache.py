@@ -0,0 +1,172 @@
+from copy import deepcopy
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from jsonschema import ValidationError
+
+import bas_metadata_library
+from bas_metadata_library import RecordValidationError, validate_many
+from bas_metadata_library.standards.iso_19115_2 import MetadataRecord, MetadataRecordConfigV4
+from bas_metadata_library.standards.iso_19115_common import utils
+from bas_metadata_library.validation_cache import (
+    ValidationCache,
+    canonical_json,
+    get_validation_cache,
+    set_validation_cache,
+)
+from tests.resources.configs.iso19115_2_standard import configs_v4_all
+from tests.resources.configs.magic_discovery_profile import configs_v2_all
+
+
+@pytest.fixture()
+def fx_validation_cache(tmp_path: Path) -> ValidationCache:
+    cache = ValidationCache(path=tmp_path.joinpath("cache.db"))
+    set_validation_cache(cache)
+    yield cache
+    set_validation_cache(None)
+    cache.close()
+
+
+def _count_calls(monkeypatch: MonkeyPatch, module: object, name: str) -> list:
+    calls = []
+    function: Callable = getattr(module, name)
+
+    def _function(*args: object, **kwargs: object) -> object:
+        calls.append(1)
+        return function(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, _function)
+    return calls
+
+
+def test_canonical_json():
+    assert canonical_json({"b": 1, "a": date(2012, 1, 1)}) == b'{"a":{"$date":"2012-01-01"},"b":1}'
+    assert canonical_json({"a": datetime(2012, 1, 1, 12)}) == b'{"a":{"$datetime":"2012-01-01T12:00:00"}}'
+    assert canonical_json({"a": date(2012, 1, 1)}) != canonical_json({"a": "2012-01-01"})
+
+
+def test_cache_key(tmp_path: Path):
+    cache = ValidationCache(path=tmp_path.joinpath("cache.db"))
+    key = cache.key(kind="config", content=b"{}", schema_ids=["a", "b"])
+    assert key == cache.key(kind="config", content=b"{}", schema_ids=["b", "a"])
+    assert key != cache.key(kind="config", content=b"{}", schema_ids=["a"])
+    assert key != cache.key(kind="record", content=b"{}", schema_ids=["a", "b"])
+    assert key != cache.key(kind="config", content=b"[]", schema_ids=["a", "b"])
+    cache.close()
+
+
+def test_cache_persistent(tmp_path: Path):
+    cache = ValidationCache(path=tmp_path.joinpath("cache.db"))
+    cache.add("x")
+    cache.close()
+
+    cache = ValidationCache(path=tmp_path.joinpath("cache.db"))
+    assert "x" in cache
+    assert "y" not in cache
+    cache.clear()
+    assert "x" not in cache
+    cache.close()
+
+
+def test_cache_eviction(tmp_path: Path):
+    """Least recently used entries are removed where the cache is full."""
+    cache = ValidationCache(path=tmp_path.joinpath("cache.db"), max_entries=3)
+    for key in ["a", "b", "c"]:
+        cache.add(key)
+    assert "a" in cache
+    cache.add("d")
+
+    assert len(cache) == 3
+    assert "b" not in cache
+    assert all(key in cache for key in ["a", "c", "d"])
+    cache.close()
+
+
+def test_set_validation_cache(fx_validation_cache: ValidationCache):
+    assert get_validation_cache() is fx_validation_cache
+
+
+@pytest.mark.usefixtures("fx_validation_cache")
+@pytest.mark.parametrize(
+    "config", [configs_v4_all["complete_v4"], configs_v2_all["minimal_resource_v2"]], ids=["standard", "profile"]
+)
+def test_validate_config_cached(monkeypatch: MonkeyPatch, config: dict):
+    calls = _count_calls(monkeypatch=monkeypatch, module=utils, name="validate_instance")
+
+    MetadataRecordConfigV4(**config).validate()
+    validated_calls = len(calls)
+    assert validated_calls > 0
+    MetadataRecordConfigV4(**deepcopy(config)).validate()
+    assert len(calls) == validated_calls
+
+
+@pytest.mark.usefixtures("fx_validation_cache")
+def test_validate_config_profiles_detected_once(monkeypatch: MonkeyPatch):
+    calls = _count_calls(monkeypatch=monkeypatch, module=utils, name="_get_profile_keys")
+
+    MetadataRecordConfigV4(**deepcopy(configs_v2_all["minimal_resource_v2"])).validate()
+    assert len(calls) == 1
+
+
+@pytest.mark.usefixtures("fx_validation_cache")
+def test_validate_config_invalid_not_cached():
+    config = deepcopy(configs_v4_all["minimal_v4"])
+    configuration = MetadataRecordConfigV4(**config)
+    del configuration.config["identification"]
+
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            configuration.validate()
+
+
+@pytest.mark.usefixtures("fx_validation_cache")
+def test_validate_record_cached(monkeypatch: MonkeyPatch):
+    calls = _count_calls(monkeypatch=monkeypatch, module=bas_metadata_library, name="validate_xml_document")
+    record = MetadataRecord(configuration=MetadataRecordConfigV4(**configs_v4_all["minimal_v4"]))
+    record.validate()
+    record.validate()
+    assert len(calls) == 1
+
+    document = record.generate_xml_document()
+    MetadataRecord.validate_document(document=document)
+    MetadataRecord.validate_document(document=document)
+    assert len(calls) == 2
+
+
+@pytest.mark.usefixtures("fx_validation_cache")
+def test_validate_record_cached_schema_changed(monkeypatch: MonkeyPatch):
+    """Records and documents are validated again if the contents of the packaged XML schemas change."""
+    calls = _count_calls(monkeypatch=monkeypatch, module=bas_metadata_library, name="validate_xml_document")
+    document = MetadataRecord(configuration=MetadataRecordConfigV4(**configs_v4_all["minimal_v4"])).generate_xml_document()
+    record = MetadataRecord(configuration=MetadataRecordConfigV4(**configs_v4_all["minimal_v4"]))
+    record.validate()
+    MetadataRecord.validate_document(document=document)
+    assert len(calls) == 2
+
+    monkeypatch.setattr(bas_metadata_library, "_xml_schemas_digest", lambda: "changed")
+    record.validate()
+    MetadataRecord.validate_document(document=document)
+    assert len(calls) == 4
+
+
+@pytest.mark.usefixtures("fx_validation_cache")
+def test_validate_many_configs_cached(monkeypatch: MonkeyPatch):
+    calls = _count_calls(monkeypatch=monkeypatch, module=bas_metadata_library, name="validate_xml_document")
+    configs = [MetadataRecordConfigV4(**deepcopy(configs_v4_all["minimal_v4"])) for _ in range(2)]
+
+    results = list(validate_many(records=configs, standard=MetadataRecord))
+    assert [result.valid for result in results] == [True, True]
+    assert len(calls) == 1
+
+
+@pytest.mark.usefixtures("fx_validation_cache")
+def test_validate_record_invalid_not_cached():
+    record = MetadataRecord(configuration=MetadataRecordConfigV4(**deepcopy(configs_v4_all["minimal_v4"])))
+    record.attributes["identification"]["spatial_resolution"] = "invalid"
+
+    for _ in range(2):
+        with pytest.raises(RecordValidationError):
+            record.validate()